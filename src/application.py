@@ -42,6 +42,15 @@ except Exception as e:
     logger.critical("opus動的ライブラリが正しくインストールされているか、正しい場所にあることを確認してください")
     sys.exit(1)
 
+# uvloopが利用可能な場合（Linux/macOS）はイベントループに使用（任意依存）
+try:
+    if sys.platform != "win32":
+        import uvloop
+    else:
+        uvloop = None
+except ImportError:
+    uvloop = None
+
 
 class Application:
     """小智ESP32システムのメインアプリケーションクラス
@@ -104,7 +113,8 @@ class Application:
         self.is_tts_playing = False
 
         # イベントループとスレッド管理
-        self.loop = asyncio.new_event_loop()  # 非同期処理用イベントループ
+        # 非同期処理用イベントループ（uvloopがあればコールバック処理の軽いuvloopを使用）
+        self.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
         self.loop_thread = None  # イベントループ実行スレッド
         self.running = False  # アプリケーション実行フラグ
         self.input_event_thread = None  # 音声入力イベント処理スレッド
@@ -185,6 +195,10 @@ class Application:
         """
         logger.debug("イベントループを設定して起動")
         asyncio.set_event_loop(self.loop)
+        if sys.version_info >= (3, 12):
+            # 最初のawaitまで同期的に完了するタスクはスケジューラを経由せずに実行する。
+            # 生成元に制御を返す必要がある処理は明示的に await asyncio.sleep(0) を入れること
+            self.loop.set_task_factory(asyncio.eager_task_factory)
         self.loop.run_forever()
 
     def set_is_tts_playing(self, value: bool):
@@ -775,6 +789,8 @@ class Application:
             return
 
         self.device_state = state
+        if self.display:
+            self.display.mark_dirty("status")
 
         # 状態に応じて適切な操作を実行
         if state == DeviceState.IDLE:
@@ -920,6 +936,7 @@ class Application:
         self.current_text = message
         # 表示を更新
         if self.display:
+            self.display.mark_dirty("text")
             self.display.update_text(message)
 
     def set_emotion(self, emotion):
@@ -931,6 +948,7 @@ class Application:
         self.current_emotion = emotion
         # 表示を更新
         if self.display:
+            self.display.mark_dirty("emotion")
             self.display.update_emotion(self._get_current_emotion())
 
     def start_listening(self):
@@ -10,10 +10,14 @@ class BaseDisplay(ABC):
     音量制御、状態更新、感情表示、キーボード監視などの機能を提供します。
     """
 
+    # サブクラスが__slots__を使えるよう空にしておく（QObjectとの多重継承とも両立する）
+    __slots__ = ()
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.current_volume = 70  # デフォルト音量値
         self.volume_controller = None
+        self.volume_controller_failed = False  # 音量制御器の動作異常フラグ
 
         # 音量制御の依存関係をチェック
         try:
@@ -94,6 +98,15 @@ class BaseDisplay(ABC):
             emotion: 表示する感情（絵文字またはGIFファイルパス）
         """
 
+    def mark_dirty(self, *fields: str):
+        """状態が変化したことを通知します.
+
+        状態をポーリングする実装は、通知された項目のコールバックのみを再取得します。
+
+        Args:
+            fields: 変化した項目（"status"、"text"、"emotion"）
+        """
+
     def get_current_volume(self):
         """現在の音量を取得します.
         
@@ -105,8 +118,7 @@ class BaseDisplay(ABC):
                 # システムから最新の音量を取得
                 self.current_volume = self.volume_controller.get_volume()
                 # 取得成功、音量制御器が正常に動作していることをマーク
-                if hasattr(self, "volume_controller_failed"):
-                    self.volume_controller_failed = False
+                self.volume_controller_failed = False
             except Exception as e:
                 self.logger.debug(f"システム音量の取得に失敗しました: {e}")
                 # 音量制御器の動作異常をマーク
@@ -1,8 +1,11 @@
 import asyncio
 import os
 import platform
+import queue
+import sys
 import threading
 import time
+from functools import lru_cache
 from typing import Callable, Optional
 
 from src.display.base_display import BaseDisplay
@@ -18,10 +21,75 @@ try:
 except ImportError:
     pynput_keyboard = None
 
+try:
+    import aioconsole
+except ImportError:
+    aioconsole = None
+
 from src.utils.logging_config import get_logger
 
+# ヘルプ情報 (一度の書き込みで出力するため事前に組み立てる)
+_HELP_TEXT = (
+    "\n=== 小智AIコマンドライン制御 ===\n"
+    "利用可能なコマンド：\n"
+    "  r     - 対話を開始/停止\n"
+    "  x     - 現在の対話を中断\n"
+    "  s     - 現在のステータスを表示\n"
+    "  v 数字 - 音量設定(0-100)\n"
+    "  q     - プログラム終了\n"
+    "  h     - このヘルプ情報を表示\n"
+    "ショートカットキー：\n"
+    "  Alt+Shift+A - 自動対話モード\n"
+    "  Alt+Shift+X - 現在の対話を中断\n"
+    "=====================\n\n"
+)
+
+
+@lru_cache(maxsize=64)
+def _emotion_label(emotion_path: str) -> str:
+    """表情パスを表示用の表情名に変換.
+
+    GIFファイルパスの場合はファイル名から.gif拡張子を除いたものを返し、
+    それ以外（絵文字など）はそのまま返す。
+    """
+    if emotion_path.endswith(".gif"):
+        return f"[{os.path.basename(emotion_path)[:-4]}]"
+    return emotion_path
+
 
 class CliDisplay(BaseDisplay):
+    __slots__ = (
+        # BaseDisplay
+        "logger",
+        "current_volume",
+        "volume_controller",
+        "volume_controller_failed",
+        # ステータス関連
+        "running",
+        "current_status",
+        "current_text",
+        "current_emotion",
+        "_last_emotion_path",
+        "_last_state",
+        # コールバック関数
+        "auto_callback",
+        "status_callback",
+        "text_callback",
+        "emotion_callback",
+        "abort_callback",
+        "send_text_callback",
+        # キー状態
+        "is_r_pressed",
+        "pressed_keys",
+        "_key_events",
+        "keyboard_listener",
+        "_status_dirty",
+        "_text_dirty",
+        "_emotion_dirty",
+        "_dirty",
+        "_out_q",
+    )
+
     def __init__(self):
         super().__init__()  # 親クラスの初期化を呼び出し
         """CLIディスプレイを初期化."""
@@ -29,9 +97,10 @@ class CliDisplay(BaseDisplay):
         self.running = True
 
         # ステータス関連
-        self.current_status = "未接続"
+        self.current_status = sys.intern("未接続")
         self.current_text = "待機中"
         self.current_emotion = "😊"
+        self._last_emotion_path = None  # 最後に受け取った表情パス
         self.current_volume = 0  # 現在の音量属性を追加
 
         # コールバック関数
@@ -45,18 +114,24 @@ class CliDisplay(BaseDisplay):
         self.is_r_pressed = False
         # 組み合わせキーサポートを追加
         self.pressed_keys = set()
+        # pynputから受け取ったキーイベント (key, 押下かどうか)
+        self._key_events = queue.SimpleQueue()
 
-        # ステータスキャッシュ
-        self.last_status = None
-        self.last_text = None
-        self.last_emotion = None
-        self.last_volume = None
+        # ステータスキャッシュ (ステータス, テキスト, 表情, 音量)
+        self._last_state = (None, None, None, None)
 
         # キーボードリスナー
         self.keyboard_listener = None
 
-        # 非同期操作のためのイベントループを追加
-        self.loop = asyncio.new_event_loop()
+        # 状態変化フラグ (変化した状態のコールバックのみを呼び出す)
+        self._status_dirty = threading.Event()
+        self._text_dirty = threading.Event()
+        self._emotion_dirty = threading.Event()
+        self._dirty = threading.Event()
+
+        # 出力キュー (端末I/Oで呼び出し元がブロックしないよう専用スレッドで書き込む)
+        self._out_q = queue.Queue(maxsize=64)
+        threading.Thread(target=self._output_writer, daemon=True).start()
 
     def set_callbacks(
         self,
@@ -80,36 +155,36 @@ class CliDisplay(BaseDisplay):
 
     def update_button_status(self, text: str):
         """ボタンステータスを更新."""
-        print(f"ボタンステータス: {text}")
+        self._write(f"ボタンステータス: {text}\n")
 
     def update_status(self, status: str):
         """ステータステキストを更新."""
-        if status != self.current_status:
+        # ステータスは有限個の文字列なのでインターンし、同一性のみで比較する
+        status = sys.intern(status)
+        if status is not self.current_status:
             self.current_status = status
             self._print_current_status()
 
     def update_text(self, text: str):
         """TTSテキストを更新."""
-        if text != self.current_text:
-            self.current_text = text
-            self._print_current_status()
+        if text is self.current_text or text == self.current_text:
+            return
+        self.current_text = text
+        self._print_current_status()
 
     def update_emotion(self, emotion_path: str):
         """表情を更新
         emotion_path: GIFファイルパスまたは表情文字列
         """
-        if emotion_path != self.current_emotion:
-            # GIFファイルパスの場合、ファイル名を表情名として抽出
-            if emotion_path.endswith(".gif"):
-                # パスからファイル名を抽出し、.gif拡張子を削除
-                emotion_name = os.path.basename(emotion_path)
-                emotion_name = emotion_name.replace(".gif", "")
-                self.current_emotion = f"[{emotion_name}]"
-            else:
-                # GIFパスでない場合、そのまま使用
-                self.current_emotion = emotion_path
-
-            self._print_current_status()
+        # current_emotionは加工後の表示名なので、受け取ったパスそのもので比較する
+        if (
+            emotion_path is self._last_emotion_path
+            or emotion_path == self._last_emotion_path
+        ):
+            return
+        self._last_emotion_path = emotion_path
+        self.current_emotion = _emotion_label(emotion_path)
+        self._print_current_status()
 
     def is_combo(self, *keys):
         """一組のキーが同時に押されているかを判定."""
@@ -125,51 +200,16 @@ class CliDisplay(BaseDisplay):
             return
 
         try:
+            # pynputのスレッドではキューへの追加のみ行い、処理は専用スレッドで行う
+            put = self._key_events.put
 
             def on_press(key):
-                try:
-                    # 押されたキーを記録
-                    if (
-                        key == pynput_keyboard.Key.alt_l
-                        or key == pynput_keyboard.Key.alt_r
-                    ):
-                        self.pressed_keys.add("alt")
-                    elif (
-                        key == pynput_keyboard.Key.shift_l
-                        or key == pynput_keyboard.Key.shift_r
-                    ):
-                        self.pressed_keys.add("shift")
-                    elif hasattr(key, "char") and key.char:
-                        self.pressed_keys.add(key.char.lower())
-
-                    # 自動対話モード - Alt+Shift+A
-                    if self.is_combo("alt", "shift", "a") and self.auto_callback:
-                        self.auto_callback()
-
-                    # 対話を中断 - Alt+Shift+X
-                    if self.is_combo("alt", "shift", "x") and self.abort_callback:
-                        self.abort_callback()
-
-                except Exception as e:
-                    self.logger.error(f"キーボードイベント処理エラー: {e}")
+                put((key, True))
 
             def on_release(key):
-                try:
-                    # 解放されたキーをクリア
-                    if (
-                        key == pynput_keyboard.Key.alt_l
-                        or key == pynput_keyboard.Key.alt_r
-                    ):
-                        self.pressed_keys.discard("alt")
-                    elif (
-                        key == pynput_keyboard.Key.shift_l
-                        or key == pynput_keyboard.Key.shift_r
-                    ):
-                        self.pressed_keys.discard("shift")
-                    elif hasattr(key, "char") and key.char:
-                        self.pressed_keys.discard(key.char.lower())
-                except Exception as e:
-                    self.logger.error(f"キーボードイベント処理エラー: {e}")
+                put((key, False))
+
+            threading.Thread(target=self._dispatch_key_events, daemon=True).start()
 
             # リスナーを作成して開始
             self.keyboard_listener = pynput_keyboard.Listener(
@@ -180,12 +220,55 @@ class CliDisplay(BaseDisplay):
         except Exception as e:
             self.logger.error(f"キーボードリスナー初期化失敗: {e}")
 
+    def _dispatch_key_events(self):
+        """キーイベントキューを消費するスレッド（Noneを受け取ると終了）."""
+        while True:
+            event = self._key_events.get()
+            if event is None:
+                break
+            self._handle_key(*event)
+
+    def _handle_key(self, key, pressed: bool):
+        """キーの押下/解放を処理."""
+        try:
+            if key == pynput_keyboard.Key.alt_l or key == pynput_keyboard.Key.alt_r:
+                name = "alt"
+            elif (
+                key == pynput_keyboard.Key.shift_l
+                or key == pynput_keyboard.Key.shift_r
+            ):
+                name = "shift"
+            elif hasattr(key, "char") and key.char:
+                name = key.char.lower()
+            else:
+                return
+
+            if not pressed:
+                # 解放されたキーをクリア
+                self.pressed_keys.discard(name)
+                return
+
+            # 押されたキーを記録
+            self.pressed_keys.add(name)
+
+            # 自動対話モード - Alt+Shift+A
+            if self.is_combo("alt", "shift", "a") and self.auto_callback:
+                self.auto_callback()
+
+            # 対話を中断 - Alt+Shift+X
+            if self.is_combo("alt", "shift", "x") and self.abort_callback:
+                self.abort_callback()
+
+        except Exception as e:
+            self.logger.error(f"キーボードイベント処理エラー: {e}")
+
     def stop_keyboard_listener(self):
         """キーボード監視を停止."""
         if self.keyboard_listener:
             try:
                 self.keyboard_listener.stop()
                 self.keyboard_listener = None
+                self._key_events.put(None)  # ディスパッチスレッドを終了
                 self.logger.info("キーボードリスナーが停止されました")
             except Exception as e:
                 self.logger.error(f"キーボードリスナー停止失敗: {e}")
@@ -197,10 +280,16 @@ class CliDisplay(BaseDisplay):
         # ステータス更新スレッドを開始
         self.start_update_threads()
 
-        # キーボード監視スレッドを開始
-        keyboard_thread = threading.Thread(target=self._keyboard_listener)
-        keyboard_thread.daemon = True
-        keyboard_thread.start()
+        # コマンド入力の監視を開始（可能ならイベントループ上で非同期に読み取る）
+        from src.application import Application
+
+        app = Application.get_instance()
+        if aioconsole is not None and app and app.loop:
+            asyncio.run_coroutine_threadsafe(self._cli_reader(), app.loop)
+        else:
+            keyboard_thread = threading.Thread(target=self._keyboard_listener)
+            keyboard_thread.daemon = True
+            keyboard_thread.start()
 
         # キーボード監視を開始
         self.start_keyboard_listener()
@@ -220,89 +309,147 @@ class CliDisplay(BaseDisplay):
 
     def _print_help(self):
         """ヘルプ情報を表示."""
-        print("\n=== 小智AIコマンドライン制御 ===")
-        print("利用可能なコマンド：")
-        print("  r     - 対話を開始/停止")
-        print("  x     - 現在の対話を中断")
-        print("  s     - 現在のステータスを表示")
-        print("  v 数字 - 音量設定(0-100)")
-        print("  q     - プログラム終了")
-        print("  h     - このヘルプ情報を表示")
-        print("ショートカットキー：")
-        print("  Alt+Shift+A - 自動対話モード")
-        print("  Alt+Shift+X - 現在の対話を中断")
-        print("=====================\n")
+        self._write(_HELP_TEXT)
+
+    def _write(self, text: str):
+        """出力キューにテキストを追加（満杯の場合は最も古い出力を破棄）."""
+        while True:
+            try:
+                self._out_q.put_nowait(text)
+                return
+            except queue.Full:
+                try:
+                    self._out_q.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _output_writer(self):
+        """出力キューを消費して標準出力に書き込むスレッド."""
+        while True:
+            text = self._out_q.get()
+            try:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+            except Exception as e:
+                self.logger.error(f"標準出力への書き込みエラー: {e}")
 
     def _keyboard_listener(self):
-        """キーボード監視スレッド."""
+        """キーボード監視スレッド（aioconsoleが利用できない場合のフォールバック）."""
         try:
             while self.running:
                 cmd = input().lower().strip()
-                if cmd == "q":
-                    self.on_close()
+                if not self._handle_command(cmd):
+                    break
+        except Exception as e:
+            self.logger.error(f"キーボード監視エラー: {e}")
+
+    async def _cli_reader(self):
+        """アプリケーションのイベントループ上でコマンド入力を非同期に読み取る."""
+        try:
+            while self.running:
+                cmd = (await aioconsole.ainput()).lower().strip()
+                if not self._handle_command(cmd):
                     break
-                elif cmd == "h":
-                    self._print_help()
-                elif cmd == "r":
-                    if self.auto_callback:
-                        self.auto_callback()
-                elif cmd == "x":
-                    if self.abort_callback:
-                        self.abort_callback()
-                elif cmd == "s":
-                    self._print_current_status()
-                elif cmd.startswith("v "):  # 音量コマンド処理を追加
-                    try:
-                        volume = int(cmd.split()[1])  # 音量値を取得
-                        if 0 <= volume <= 100:
-                            self.update_volume(volume)
-                            print(f"音量が設定されました: {volume}%")
-                        else:
-                            print("音量は0-100の間である必要があります")
-                    except (IndexError, ValueError):
-                        print("無効な音量値です。形式：v <0-100>")
-                else:
-                    if self.send_text_callback:
-                        # アプリケーションのイベントループを取得してその中でコルーチンを実行
-                        from src.application import Application
-
-                        app = Application.get_instance()
-                        if app and app.loop:
-                            asyncio.run_coroutine_threadsafe(
-                                self.send_text_callback(cmd), app.loop
-                            )
-                        else:
-                            print("アプリケーションインスタンスまたはイベントループが利用できません")
         except Exception as e:
             self.logger.error(f"キーボード監視エラー: {e}")
 
+    def _handle_command(self, cmd: str) -> bool:
+        """入力されたコマンドを処理.
+
+        Returns:
+            bool: 入力の読み取りを継続する場合はTrue
+        """
+        if cmd == "q":
+            self.on_close()
+            return False
+        elif cmd == "h":
+            self._print_help()
+        elif cmd == "r":
+            if self.auto_callback:
+                self.auto_callback()
+        elif cmd == "x":
+            if self.abort_callback:
+                self.abort_callback()
+        elif cmd == "s":
+            self._print_current_status()
+        elif cmd.startswith("v "):  # 音量コマンド処理を追加
+            try:
+                volume = int(cmd.split()[1])  # 音量値を取得
+                if 0 <= volume <= 100:
+                    self.update_volume(volume)
+                    self._write(f"音量が設定されました: {volume}%\n")
+                else:
+                    self._write("音量は0-100の間である必要があります\n")
+            except (IndexError, ValueError):
+                self._write("無効な音量値です。形式：v <0-100>\n")
+        else:
+            if self.send_text_callback:
+                # アプリケーションのイベントループを取得してその中でコルーチンを実行
+                from src.application import Application
+
+                app = Application.get_instance()
+                if app and app.loop:
+                    # 結果は待たず、送信エラーは完了コールバックでログに記録する
+                    future = asyncio.run_coroutine_threadsafe(
+                        self.send_text_callback(cmd), app.loop
+                    )
+                    future.add_done_callback(self._log_send_error)
+                else:
+                    self._write("アプリケーションインスタンスまたはイベントループが利用できません\n")
+        return True
+
+    def _log_send_error(self, future):
+        """テキスト送信の失敗をログに記録."""
+        if not future.cancelled() and future.exception() is not None:
+            self.logger.error(f"テキストの送信に失敗しました: {future.exception()}")
+
+    def mark_dirty(self, *fields: str):
+        """状態の変化を通知し、更新スレッドに再取得させる."""
+        for field in fields:
+            if field == "status":
+                self._status_dirty.set()
+            elif field == "text":
+                self._text_dirty.set()
+            elif field == "emotion":
+                self._emotion_dirty.set()
+        self._dirty.set()
+
     def start_update_threads(self):
         """更新スレッドを開始."""
 
         def update_loop():
             while self.running:
+                # いずれかの状態が変化するまで待機（終了確認のためタイムアウト付き）
+                if not self._dirty.wait(timeout=0.1):
+                    continue
+                self._dirty.clear()
                 try:
                     # ステータスを更新
-                    if self.status_callback:
+                    if self.status_callback and self._status_dirty.is_set():
+                        self._status_dirty.clear()
                         status = self.status_callback()
                         if status and status != self.current_status:
                             self.update_status(status)
 
                     # テキストを更新
-                    if self.text_callback:
+                    if self.text_callback and self._text_dirty.is_set():
+                        self._text_dirty.clear()
                         text = self.text_callback()
                         if text and text != self.current_text:
                             self.update_text(text)
 
                     # 表情を更新
-                    if self.emotion_callback:
+                    if self.emotion_callback and self._emotion_dirty.is_set():
+                        self._emotion_dirty.clear()
                         emotion = self.emotion_callback()
                         if emotion and emotion != self.current_emotion:
                             self.update_emotion(emotion)
 
                 except Exception as e:
                     self.logger.error(f"ステータス更新エラー: {e}")
-                time.sleep(0.1)
+
+        # 初回は全ての状態を取得する
+        self.mark_dirty("status", "text", "emotion")
 
         # 更新スレッドを開始
         threading.Thread(target=update_loop, daemon=True).start()
@@ -310,23 +457,24 @@ class CliDisplay(BaseDisplay):
     def _print_current_status(self):
         """現在のステータスを表示."""
         # ステータスの変化があるかチェック
-        status_changed = (
-            self.current_status != self.last_status
-            or self.current_text != self.last_text
-            or self.current_emotion != self.last_emotion
-            or self.current_volume != self.last_volume
+        state = (
+            self.current_status,
+            self.current_text,
+            self.current_emotion,
+            self.current_volume,
+        )
+        if state == self._last_state:
+            return
+
+        status, text, emotion, volume = state
+        self._write(
+            f"\n=== 現在のステータス ===\n"
+            f"ステータス: {status}\n"
+            f"テキスト: {text}\n"
+            f"表情: {emotion}\n"
+            f"音量: {volume}%\n"
+            f"===============\n\n"
         )
 
-        if status_changed:
-            print("\n=== 現在のステータス ===")
-            print(f"ステータス: {self.current_status}")
-            print(f"テキスト: {self.current_text}")
-            print(f"表情: {self.current_emotion}")
-            print(f"音量: {self.current_volume}%")
-            print("===============\n")
-
-            # キャッシュを更新
-            self.last_status = self.current_status
-            self.last_text = self.current_text
-            self.last_emotion = self.current_emotion
-            self.last_volume = self.current_volume
+        # キャッシュを更新
+        self._last_state = state
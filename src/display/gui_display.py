@@ -1,23 +1,33 @@
 import logging
+import asyncio
+import collections
+import json
 import os
-import platform
-import queue
+import re
+import subprocess
 import sys
 import threading
-import time
+from abc import ABCMeta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 from urllib.parse import urlparse
 
 from PyQt5.QtCore import (
     Q_ARG,
+    QCoreApplication,
     QEvent,
     QMetaObject,
     QObject,
     QPropertyAnimation,
+    QRunnable,
+    QSignalBlocker,
     Qt,
     QThread,
+    QThreadPool,
     QTimer,
+    pyqtSignal,
     pyqtSlot,
 )
 from PyQt5.QtGui import (
@@ -25,8 +35,8 @@ from PyQt5.QtGui import (
     QColor,
     QFont,
     QIcon,
+    QImageReader,
     QMouseEvent,
-    QMovie,
     QPainter,
     QPixmap,
 )
@@ -55,23 +65,307 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+import requests
+from requests.adapters import HTTPAdapter
 
+from src.constants.constants import DeviceState
+from src.display.base_display import BaseDisplay
 from src.utils.config_manager import ConfigManager
+from src.utils.resource_finder import get_project_root
+
+# 実行環境の判定（モジュール読み込み時に一度だけ行う）
+_IS_WINDOWS = sys.platform.startswith("win")
+_HAS_DISPLAY = bool(os.environ.get("DISPLAY"))
 
 # 異なるOSでのpynputインポートを処理
 try:
-    if platform.system() == "Windows":
-        from pynput import keyboard as pynput_keyboard
-    elif os.environ.get("DISPLAY"):
+    if _IS_WINDOWS or _HAS_DISPLAY:
         from pynput import keyboard as pynput_keyboard
     else:
         pynput_keyboard = None
 except ImportError:
     pynput_keyboard = None
 
-from abc import ABCMeta
 
-from src.display.base_display import BaseDisplay
+# GIFフレームの再生速度（%）。少し速めに再生してアニメーションを滑らかにする
+_GIF_SPEED = 105
+
+# デコード済みGIFを保持する最大数（再生中と直前・直後の表情程度に抑えてメモリを節約）
+_GIF_CACHE_MAX = 3
+
+
+def _decode_gif(gif_path):
+    """GIFファイルを全フレームデコードする.
+
+    Returns:
+        (QImageのリスト, 各フレームの表示時間(ms)のリスト)。読み込めない場合はNone
+    """
+    reader = QImageReader(gif_path)
+    if not reader.canRead():
+        return None
+
+    images = []
+    delays = []
+    while True:
+        image = reader.read()
+        if image.isNull():
+            break
+        images.append(image)
+        # 遅延が0や負のGIFもあるため最小値を設ける
+        delay = max(reader.nextImageDelay(), 20)
+        delays.append(delay * 100 // _GIF_SPEED)
+
+    if not images:
+        return None
+    return images, delays
+
+
+class _GifDecodeSignals(QObject):
+    """GIFデコードタスクの完了通知用シグナル."""
+
+    finished = pyqtSignal(str, object)
+
+
+class _GifDecodeTask(QRunnable):
+    """QThreadPoolでGIFをデコードするタスク.
+
+    QPixmapはメインスレッドでしか作成できないため、QImageのまま通知する。
+    """
+
+    def __init__(self, gif_path, signals):
+        super().__init__()
+        self.gif_path = gif_path
+        self.signals = signals
+
+    def run(self):
+        self.signals.finished.emit(self.gif_path, _decode_gif(self.gif_path))
+
+
+class _EmotionEvent(QEvent):
+    """他スレッドからGUIスレッドへ表情の変更を届けるカスタムイベント."""
+
+    TYPE = QEvent.Type(QEvent.registerEventType())
+
+    def __init__(self, path):
+        super().__init__(self.TYPE)
+        self.path = path
+
+
+# GUIスレッドで一度に実行する更新関数の最大数
+_UPDATE_BATCH_SIZE = 64
+
+# 音量ラベルの表示文字列（0%〜100%）
+_VOLUME_TEXTS = tuple(f"{i}%" for i in range(101))
+
+
+@lru_cache(maxsize=None)
+def _status_text(status):
+    """ステータスラベルの表示文字列（ステータスの種類は少ないためキャッシュする）."""
+    return f"状态: {status}"
+
+
+@lru_cache(maxsize=None)
+def _tray_tooltip(status):
+    """システムトレイのツールチップ文字列."""
+    return f"小智AI助手 - {status}"
+
+
+# 設定ページのプロトコル選択肢
+_WS_PROTOCOLS = ["wss://", "ws://"]
+_OTA_PROTOCOLS = ["https://", "http://"]
+_HA_PROTOCOLS = ["http://", "https://"]
+# URLスキーム -> 選択肢のインデックス（findTextによる線形検索を避けるため）
+_WS_PROTOCOL_INDEX = {p[:-3]: i for i, p in enumerate(_WS_PROTOCOLS)}
+_OTA_PROTOCOL_INDEX = {p[:-3]: i for i, p in enumerate(_OTA_PROTOCOLS)}
+_HA_PROTOCOL_INDEX = {p[:-3]: i for i, p in enumerate(_HA_PROTOCOLS)}
+
+
+def _set_text(edit, text):
+    """値が変わる場合のみ入力欄のテキストを設定（不要なシグナル発火を避ける）."""
+    if edit.text() != text:
+        edit.setText(text)
+
+
+def _set_index(combo, index):
+    """値が変わる場合のみコンボボックスの選択インデックスを設定."""
+    if combo.currentIndex() != index:
+        combo.setCurrentIndex(index)
+
+
+@lru_cache(maxsize=1)
+def _ha_script_path():
+    """Home Assistant设备管理器脚本的路径及其是否存在."""
+    script_path = get_project_root() / "src" / "ui" / "ha_device_manager" / "index.py"
+    return script_path, script_path.exists()
+
+
+# 唤醒词输入框的分隔（逗号及其前后的空白）
+_WAKE_WORD_SPLIT = re.compile(r"\s*,\s*")
+
+# Home Assistantの状態取得に使うワーカースレッド数
+_HA_FETCH_WORKERS = 4
+# Home Assistantイベントストリームの再接続間隔（秒、失敗するごとに倍増）
+_HA_STREAM_RETRY_MIN = 5
+_HA_STREAM_RETRY_MAX = 60
+
+# IOTページ全体のスタイルシート（スクロール領域に一度だけ設定し、各ウィジェットは
+# objectNameと動的プロパティstateStyleで選択する）
+_IOT_QSS = """
+    QScrollArea {
+        border: none;
+        background-color: transparent;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background-color: #F5F5F5;
+        width: 8px;
+        border-radius: 4px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: #BDBDBD;
+        border-radius: 4px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QWidget#haDeviceContainer {
+        background: transparent;
+    }
+    #haDeviceCard, #haDeviceCard QFrame {
+        border-radius: 5px;
+        background-color: rgba(255, 255, 255, 0.7);
+        border: none;
+    }
+    QFrame#haDeviceSeparator {
+        background-color: #E0E0E0;
+    }
+    QLabel#haDeviceLocation {
+        color: #666666;
+    }
+    QLabel#haDeviceState {
+        color: #2196F3;
+    }
+    QLabel#haDeviceState[stateStyle="on"] {
+        color: #4CAF50;
+    }
+    QLabel#haDeviceState[stateStyle="off"] {
+        color: #9E9E9E;
+    }
+    QLabel#haDeviceState[stateStyle="temperature"] {
+        color: #FF9800;
+    }
+    QLabel#haDeviceState[stateStyle="humidity"] {
+        color: #03A9F4;
+    }
+    QLabel#haDeviceState[stateStyle="low_battery"] {
+        color: #F44336;
+    }
+"""
+
+# デバイス種別（カード作成時にentity_idから一度だけ判定）
+_KIND_ON_OFF = 0
+_KIND_TEMPERATURE = 1
+_KIND_HUMIDITY = 2
+_KIND_BATTERY = 3
+_KIND_OTHER = 4
+
+
+def _classify_entity(entity_id):
+    """entity_idから状態表示用のデバイス種別を判定."""
+    if "light" in entity_id or "switch" in entity_id:
+        return _KIND_ON_OFF
+    if "temperature" in entity_id:
+        return _KIND_TEMPERATURE
+    if "humidity" in entity_id:
+        return _KIND_HUMIDITY
+    if "battery" in entity_id:
+        return _KIND_BATTERY
+    return _KIND_OTHER
+
+
+def _format_on_off(state):
+    """ライト/スイッチの状態表示."""
+    if state == "on":
+        return "状态: 开启", "on"  # 绿色表示开启
+    return "状态: 关闭", "off"  # 灰色表示关闭
+
+
+def _format_temperature(state):
+    """温度センサーの状態表示."""
+    try:
+        return f"{float(state):.1f}℃", "temperature"
+    except ValueError:
+        return state, None
+
+
+def _format_humidity(state):
+    """湿度センサーの状態表示."""
+    try:
+        return f"{float(state):.0f}%", "humidity"
+    except ValueError:
+        return state, None
+
+
+def _format_battery(state):
+    """バッテリー残量の状態表示."""
+    try:
+        battery = float(state)
+    except ValueError:
+        return state, None
+    # 根据电池电量设置不同颜色
+    if battery < 20:
+        return f"{battery:.0f}%", "low_battery"
+    return f"{battery:.0f}%", "on"
+
+
+def _format_other(state):
+    """その他のデバイスの状態表示."""
+    return f"状态: {state}", "default"
+
+
+# デバイス種別 -> (表示テキスト, stateStyle) を返す整形関数（Noneは現在のスタイルを維持）
+_STATE_FORMATTERS = (
+    _format_on_off,
+    _format_temperature,
+    _format_humidity,
+    _format_battery,
+    _format_other,
+)
+
+# トレイアイコンの状態色
+_TRAY_GRAY = QColor(128, 128, 128)
+_TRAY_RED = QColor(255, 0, 0)
+_TRAY_YELLOW = QColor(255, 200, 0)
+_TRAY_BLUE = QColor(0, 120, 255)
+_TRAY_GREEN = QColor(0, 180, 0)
+_TRAY_COLORS = (_TRAY_GRAY, _TRAY_RED, _TRAY_YELLOW, _TRAY_BLUE, _TRAY_GREEN)
+
+# ステータス文字列（Application.set_device_stateが設定する値）-> トレイアイコンの色
+_STATUS_COLORS = {
+    "リスニング中...": _TRAY_YELLOW,  # 聆听中状态
+    "話しています...": _TRAY_BLUE,  # 说话中状态
+    "错误": _TRAY_RED,  # 错误状态
+}
+
+
+# ナビゲーションタブのインデックスとrouteKeyの対応
+_INDEX_TO_ROUTE = ("mainInterface", "iotInterface", "settingInterface")
+
+# ショートカット判定用の押下キービット（押下状態は整数ビットマスクで保持）
+_KEY_ALT = 1
+_KEY_SHIFT = 2
+_KEY_MODIFIERS = _KEY_ALT | _KEY_SHIFT
+_CHAR_BITS = {"v": 4, "a": 8, "x": 16, "m": 32}
+# pynputが使えない場合にウィンドウ内で使うQtキーコード -> キービット
+_QT_KEY_BITS = {
+    Qt.Key_Alt: _KEY_ALT,
+    Qt.Key_Shift: _KEY_SHIFT,
+    Qt.Key_V: _CHAR_BITS["v"],
+    Qt.Key_A: _CHAR_BITS["a"],
+    Qt.Key_X: _CHAR_BITS["x"],
+    Qt.Key_M: _CHAR_BITS["m"],
+}
+_QT_KEY_EVENTS = (QEvent.KeyPress, QEvent.KeyRelease, QEvent.WindowDeactivate)
 
 
 def restart_program():
@@ -88,10 +382,8 @@ def restart_program():
         # パッケージ環境では異なる再起動方法を使用
         if getattr(sys, "frozen", False):
             # パッケージ環境ではsubprocessで新しいプロセスを開始
-            import subprocess
-
             # 完全なコマンドラインを構築
-            if sys.platform.startswith("win"):
+            if _IS_WINDOWS:
                 # Windowsではdetachedで独立プロセスを作成
                 executable = os.path.abspath(sys.executable)
                 subprocess.Popen(
@@ -127,7 +419,18 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
     音量制御、ステータス表示、感情アニメーション、
     システムトレイ等の機能を提供します。
     """
-    
+
+    # ショートカット（Alt+Shift+キー）の押下ビットマスク
+    _COMBO_V = _KEY_MODIFIERS | _CHAR_BITS["v"]  # 長押しで話す
+    _COMBO_A = _KEY_MODIFIERS | _CHAR_BITS["a"]  # 自動対話
+    _COMBO_X = _KEY_MODIFIERS | _CHAR_BITS["x"]  # 中断
+    _COMBO_M = _KEY_MODIFIERS | _CHAR_BITS["m"]  # モード切り替え
+
+    # 更新キューに処理待ちが発生したことをGUIスレッドに通知するシグナル
+    _update_kick = pyqtSignal()
+    # Home Assistantの状態更新をまとめて反映するようGUIスレッドに通知するシグナル
+    _device_states_kick = pyqtSignal()
+
     def __init__(self):
         # 重要：多重継承を処理するためにsuper()を呼び出し
         super().__init__()
@@ -138,6 +441,8 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
         self.app = None
         self.root = None
+        self._application = None  # Applicationインスタンス（set_callbacksで設定）
+        self._by_name = {}  # オブジェクト名 -> UI内のオブジェクト
 
         # 事前初期化する変数
         self.status_label = None
@@ -151,17 +456,35 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.mute = None
         self.stackedWidget = None
         self.nav_tab_bar = None
-
-        # 感情アニメーションオブジェクトを追加
-        self.emotion_movie = None
+        self._last_nav_index = None  # 最後に表示したナビゲーションインデックス
+
+        # 感情アニメーション（デコード済みフレームを1つのタイマーで再生）
+        self.emotion_timer = None  # フレーム切り替え用タイマー（start()で作成）
+        self.emotion_frames = None  # 再生中のフレーム(QPixmap)リスト
+        self.emotion_delays = None  # 各フレームの表示時間(ms)
+        self.emotion_frame_index = 0
+        self.emotion_gif_path = None  # 再生中のGIFパス
+        # GIFパス -> (デコード済みQImageリスト, 表示時間リスト)。最近使ったものだけ保持（LRU）
+        self._gif_images = collections.OrderedDict()
+        self._gif_decoding = set()  # デコード中のGIFパス
+        # GIFパス -> ((幅, 高さ), QPixmapリスト, 表示時間リスト)。GIFごとに現在のサイズのみ保持
+        self._gif_cache = {}
+        self._last_emotion_path = None  # 最後に要求された表情のパス
+        self._label_gif_path = None  # 表情ラベルに設定したGIFパス
+        self._gif_decode_signals = None  # デコード完了通知（start()で作成）
+        self._pending_gif = None  # デコード完了後に表示する(ラベル, GIFパス)
         # 感情アニメーションエフェクト関連変数を新規追加
         self.emotion_effect = None  # 感情の透明度エフェクト
-        self.emotion_animation = None  # 感情アニメーションオブジェクト
+        self.emotion_animation = None  # 感情アニメーションオブジェクト（start()で作成）
+        self._fade_out_target = None  # フェードアウト完了後に表示する(ラベル, GIFパス)
         self.next_emotion_path = None  # 次に表示する感情
         self.is_emotion_animating = False  # 感情切り替えアニメーション実行中かどうか
 
         # 音量制御関連
         self.volume_label = None  # 音量パーセントラベル
+        self._volume_min = 0  # 音量スライダーの最小値
+        self._volume_range = 100  # 音量スライダーの値の範囲
+        self._volume_groove_rect = None  # 音量スライダーのトラック領域（キャッシュ）
         self.volume_control_available = False  # システム音量制御が利用可能かどうか
         self.volume_controller_failed = False  # 音量制御が失敗したかどうかをマーク
 
@@ -185,6 +508,7 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.ha_port = None
         self.ha_key = None
         self.Add_ha_devices = None
+        self._settings_initialized = False  # 设置页面控件是否已初始化
 
         self.is_muted = False
         self.pre_mute_volume = self.current_volume
@@ -203,8 +527,13 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.abort_callback = None
         self.send_text_callback = None
 
-        # 更新キュー
-        self.update_queue = queue.Queue()
+        # 更新キュー（メインスレッドで実行する関数）
+        # deque.append/popleftはスレッドセーフなため、ロックは使用しない
+        self._pending = collections.deque()
+        self._process_requested = False  # GUIスレッドへの処理依頼が未処理かどうか
+        # ラベル更新は最新値のみ保持し、同じラベルへの重複更新をまとめる
+        self._latest_updates = {}
+        self._last_text = None  # 最後に表示したTTSテキスト
 
         # 実行フラグ
         self._running = True
@@ -212,14 +541,25 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         # キーボードリスナー
         self.keyboard_listener = None
         # キー状態セットを追加
-        self.pressed_keys = set()
+        self._pressed_mask = 0  # 押下中のキーのビットマスク
+        # ショートカットのビットマスク -> 処理関数
+        self._combo_handlers = {
+            self._COMBO_V: self._on_talk_combo,
+            self._COMBO_A: self._on_auto_combo,
+            self._COMBO_X: self._on_abort_combo,
+            self._COMBO_M: self._on_mode_button_click,
+        }
+        self._qt_key_handling = False  # Qtのキーイベントでショートカットを処理中か
 
         # スライドジェスチャー関連
         self.last_mouse_pos = None
 
         # 破棄されることを防ぐためタイマーの参照を保存
-        self.update_timer = None
         self.volume_update_timer = None
+        self._pending_volume = None  # 节流中等待应用的音量值
+        self._tray_throttle = None  # トレイアイコン更新の間引きタイマー
+        self._pending_tray_status = None  # 間引き期間終了後に反映するステータス
+        self._tray_icons = {}  # 色(RGB値) -> 描画済みトレイアイコン
 
         # アニメーション関連
         self.current_effect = None
@@ -237,12 +577,32 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.get_current_volume()
 
         # 新規iotPage関連変数
-        self.devices_list = []
         self.device_labels = {}
+        # デバイスカードの再利用プール（entity_id -> (カード, 名称, 位置, 状態ラベル)）
+        self._card_pool = {}
+        self._card_order = []
+        self._device_grid = None
+        self._font12 = None  # デバイスカード用フォント（IOTページ構築時に作成）
+        self._font14 = None
         self.history_title = None
         self.iot_card = None
         self.ha_update_timer = None
         self.device_states = {}
+        # Home Assistant状态查询（复用HTTP会话和固定数量的工作线程）
+        self._ha_session = None
+        self._ha_session_token = None
+        self._ha_executor = None
+        self._ha_in_flight = set()  # 正在查询状态的实体ID
+        # 待反映到界面的设备状态（entity_id -> (state, label)），每批只投递一次刷新
+        self._ha_pending_states = {}
+        self._ha_flush_requested = False
+        # Home Assistant事件流（连接成功后停止轮询，断开后恢复轮询）
+        self._ha_stream_stop = None  # 当前事件流线程的停止事件
+        self._ha_streaming = False
+        # Home Assistant配置缓存（None表示尚未读取）
+        self._ha_url = None
+        self._ha_token = None
+        self._ha_devices = None
 
         # 新規システムトレイ関連変数
         self.tray_icon = None
@@ -251,56 +611,92 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.is_connected = True  # 接続状態フラグ
 
     def eventFilter(self, source, event):
-        """イベントフィルター。音量スライダーのクリック処理をカストマイズします。"""
-        if source == self.volume_scale and event.type() == QEvent.MouseButtonPress:
-            if event.button() == Qt.LeftButton:
-                slider = self.volume_scale
-                opt = QStyleOptionSlider()
-                slider.initStyleOption(opt)
-
-                # スライダーのハンドルとトラックの矩形領域を取得
-                handle_rect = slider.style().subControlRect(
-                    QStyle.CC_Slider, opt, QStyle.SC_SliderHandle, slider
-                )
-                groove_rect = slider.style().subControlRect(
-                    QStyle.CC_Slider, opt, QStyle.SC_SliderGroove, slider
-                )
-
-                # ハンドルをクリックした場合、デフォルトハンドラーにドラッグ処理を任せる
-                if handle_rect.contains(event.pos()):
-                    return False
-
-                # クリック位置がトラックに対して相対的にどこにあるか計算
-                if slider.orientation() == Qt.Horizontal:
-                    # クリックが有効なトラック範囲内であることを確認
-                    if (
-                        event.pos().x() < groove_rect.left()
-                        or event.pos().x() > groove_rect.right()
-                    ):
-                        return False  # トラック外でのクリック
-                    pos = event.pos().x() - groove_rect.left()
-                    max_pos = groove_rect.width()
-                else:
-                    if (
-                        event.pos().y() < groove_rect.top()
-                        or event.pos().y() > groove_rect.bottom()
-                    ):
-                        return False  # トラック外でのクリック
-                    pos = groove_rect.bottom() - event.pos().y()
-                    max_pos = groove_rect.height()
-
-                if max_pos > 0:  # ゼロ除算を防ぐ
-                    value_range = slider.maximum() - slider.minimum()
-                    # クリック位置に基づいて新しい値を計算
-                    new_value = slider.minimum() + round((value_range * pos) / max_pos)
-
-                    # スライダーの値を直接設定
-                    slider.setValue(int(new_value))
-
-                    return True  # イベントが処理されたことを示す
+        """イベントフィルター。主ウィンドウのマウス/クローズイベントや
+        音量スライダーのクリック処理をカストマイズします。"""
+        if source is self.root:
+            event_type = event.type()
+            if event_type == QEvent.MouseButtonPress:
+                self.mousePressEvent(event)
+            elif event_type == QEvent.MouseButtonRelease:
+                self.mouseReleaseEvent(event)
+            elif event_type == QEvent.Close:
+                # QWidget既定のcloseEventは常に受理するため、ここで処理を完結させる
+                self._closeEvent(event)
+                return True
+            elif self._qt_key_handling and event_type in _QT_KEY_EVENTS:
+                self._handle_qt_key_event(event)
+            return False
+
+        if source == self.emotion_label and event.type() == QEvent.Resize:
+            self._on_emotion_label_resized()
+            return False
+
+        if source == self.volume_scale:
+            event_type = event.type()
+            if event_type == QEvent.Resize:
+                # トラック領域はサイズ変更時のみ変わるため、次回クリック時に再計算する
+                self._volume_groove_rect = None
+            elif (
+                event_type == QEvent.MouseButtonPress
+                and event.button() == Qt.LeftButton
+            ):
+                return self._on_volume_scale_click(event.pos())
 
         return super().eventFilter(source, event)
 
+    def _on_volume_scale_click(self, click_pos):
+        """音量スライダーのトラッククリックをその位置の値へのジャンプとして処理.
+
+        Returns:
+            bool: イベントを処理した場合はTrue
+        """
+        slider = self.volume_scale
+        opt = QStyleOptionSlider()
+        slider.initStyleOption(opt)
+        style = slider.style()
+
+        # ハンドルをクリックした場合、デフォルトハンドラーにドラッグ処理を任せる
+        handle_rect = style.subControlRect(
+            QStyle.CC_Slider, opt, QStyle.SC_SliderHandle, slider
+        )
+        if handle_rect.contains(click_pos):
+            return False
+
+        groove_rect = self._volume_groove_rect
+        if groove_rect is None:
+            groove_rect = style.subControlRect(
+                QStyle.CC_Slider, opt, QStyle.SC_SliderGroove, slider
+            )
+            self._volume_groove_rect = groove_rect
+
+        # クリック位置がトラックに対して相対的にどこにあるか計算
+        if slider.orientation() == Qt.Horizontal:
+            x = click_pos.x()
+            if x < groove_rect.left() or x > groove_rect.right():
+                return False  # トラック外でのクリック
+            pos = x - groove_rect.left()
+            max_pos = groove_rect.width()
+        else:
+            y = click_pos.y()
+            if y < groove_rect.top() or y > groove_rect.bottom():
+                return False  # トラック外でのクリック
+            pos = groove_rect.bottom() - y
+            max_pos = groove_rect.height()
+
+        if max_pos <= 0:  # ゼロ除算を防ぐ
+            return False
+
+        # 整数演算で四捨五入して新しい値を計算し、スライダーに直接設定
+        slider.setValue(
+            self._volume_min + (self._volume_range * pos + max_pos // 2) // max_pos
+        )
+        return True  # イベントが処理されたことを示す
+
+    def _find(self, cls, name):
+        """名前と型でUI内のオブジェクトを検索（findChildの辞書版）."""
+        obj = self._by_name.get(name)
+        return obj if isinstance(obj, cls) else None
+
     def _setup_navigation(self):
         """ナビゲーションタブバー(QTabBar)を設定します。"""
         # addTabでタブを追加
@@ -312,27 +708,31 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.nav_tab_bar.currentChanged.connect(self._on_navigation_index_changed)
 
         # デフォルト選択項目を設定（インデックス経由）
+        # 初期化時はスロットを発火させず、ページ側も直接合わせる
+        blocker = QSignalBlocker(self.nav_tab_bar)
         self.nav_tab_bar.setCurrentIndex(0)  # デフォルトで第1タブを選択
+        blocker.unblock()
+        if self.stackedWidget:
+            self.stackedWidget.setCurrentIndex(0)
+        self._last_nav_index = 0
 
     def _on_navigation_index_changed(self, index: int):
         """ナビゲーションタブの変更を処理（インデックス経由）。"""
-        # アニメーションと読み込みロジックを再利用するためにrouteKeyにマッピング
-        index_to_routeKey = {
-            0: "mainInterface",
-            1: "iotInterface",
-            2: "settingInterface",
-        }
-        routeKey = index_to_routeKey.get(index)
+        if index == self._last_nav_index:
+            return
 
-        if routeKey is None:
+        # アニメーションと読み込みロジックを再利用するためにrouteKeyにマッピング
+        if not 0 <= index < len(_INDEX_TO_ROUTE):
             self.logger.warning(f"不明なナビゲーションインデックス: {index}")
             return
+        routeKey = _INDEX_TO_ROUTE[index]
 
         target_index = index  # インデックスを直接使用
         if target_index == self.stackedWidget.currentIndex():
             return
 
         self.stackedWidget.setCurrentIndex(target_index)
+        self._last_nav_index = target_index
 
         # 設定ページに切り替えた場合、設定を読み込み
         if routeKey == "settingInterface":
@@ -370,17 +770,16 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
         # 初期化後に状態監視をアプリケーションの状態変更コールバックに追加
         # これによりデバイス状態が変更されたときにシステムトレイアイコンを更新できる
+        # src.applicationはこのモジュールをインポートするため、ここで一度だけ解決して保持する
         from src.application import Application
 
-        app = Application.get_instance()
-        if app:
-            app.on_state_changed_callbacks.append(self._on_state_changed)
+        self._application = Application.get_instance()
+        if self._application:
+            self._application.on_state_changed_callbacks.append(self._on_state_changed)
 
     def _on_state_changed(self, state):
         """监听设备状态变化."""
         # 接続状態フラグを設定
-        from src.constants.constants import DeviceState
-
         # 接続中または接続済みかをチェック
         # (CONNECTING, LISTENING, SPEAKING は接続済みを表示)
         if state == DeviceState.CONNECTING:
@@ -389,9 +788,7 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             self.is_connected = True
         elif state == DeviceState.IDLE:
             # アプリケーションからプロトコルインスタンスを取得し、WebSocket接続状態をチェック
-            from src.application import Application
-
-            app = Application.get_instance()
+            app = self._application
             if app and app.protocol:
                 # プロトコルが接続しているかチェック
                 self.is_connected = app.protocol.is_audio_channel_opened()
@@ -400,22 +797,55 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
         # ステータス更新の処理はすでに update_status メソッド内で完了
 
+    def _schedule_update(self, update_func):
+        """メインスレッドで実行する更新関数をキューに追加."""
+        self._pending.append(update_func)
+        self._request_process()
+
+    def _set_latest_update(self, key, value):
+        """最新値のみ反映すればよい更新（ステータス/テキスト）を登録."""
+        self._latest_updates[key] = value
+        self._request_process()
+
+    def _request_process(self):
+        """GUIスレッドに更新キューの処理を依頼（依頼済みの場合は何もしない）.
+
+        キューへの追加後にフラグを確認するため、処理側がフラグを下ろしてから
+        キューを取り出すまでの間に追加された更新も取りこぼさない。
+        """
+        if not self._process_requested:
+            self._process_requested = True
+            self._update_kick.emit()
+
     def _process_updates(self):
-        """更新キューを処理."""
+        """更新キューを処理（_update_kickによりGUIスレッドで呼び出される）."""
+        # 取り出す前にフラグを下ろす（以降に追加された更新は新たに依頼される）
+        self._process_requested = False
         if not self._running:
             return
 
-        try:
-            while True:
-                try:
-                    # ノンブロッキング方式で更新を取得
-                    update_func = self.update_queue.get_nowait()
-                    update_func()
-                    self.update_queue.task_done()
-                except queue.Empty:
-                    break
-        except Exception as e:
-            self.logger.error(f"更新キュー処理中にエラーが発生: {e}")
+        latest = self._latest_updates
+        status = latest.pop("status", None)
+        if status is not None:
+            self._safe_update_label(self.status_label, _status_text(status))
+        text = latest.pop("text", None)
+        if text is not None:
+            self._safe_update_label(self.tts_text_label, text)
+
+        # 一度に処理する件数を制限し、残りはイベントループに制御を戻してから処理する
+        pending = self._pending
+        for _ in range(_UPDATE_BATCH_SIZE):
+            try:
+                update_func = pending.popleft()
+            except IndexError:
+                return
+            try:
+                update_func()
+            except Exception as e:
+                self.logger.error(f"更新キュー処理中にエラーが発生: {e}")
+
+        if pending:
+            self._request_process()
 
     def _on_manual_button_press(self):
         """手動モードボタン押下イベント処理."""
@@ -474,23 +904,29 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.update_mode_button_status("自动对话")
 
                 # 手動ボタンを非表示、自動ボタンを表示
-                self.update_queue.put(self._switch_to_auto_mode)
+                QMetaObject.invokeMethod(
+                    self, "_switch_to_auto_mode", Qt.QueuedConnection
+                )
             else:
                 # 手動モードに切り替え
                 self.update_mode_button_status("手动对话")
 
                 # 自動ボタンを非表示、手動ボタンを表示
-                self.update_queue.put(self._switch_to_manual_mode)
+                QMetaObject.invokeMethod(
+                    self, "_switch_to_manual_mode", Qt.QueuedConnection
+                )
 
         except Exception as e:
             self.logger.error(f"モード切り替えボタンコールバック実行失敗: {e}")
 
+    @pyqtSlot()
     def _switch_to_auto_mode(self):
         """自動モードにUI切り替え更新."""
         if self.manual_btn and self.auto_btn:
             self.manual_btn.hide()
             self.auto_btn.show()
 
+    @pyqtSlot()
     def _switch_to_manual_mode(self):
         """手動モードにUI切り替え更新."""
         if self.manual_btn and self.auto_btn:
@@ -499,29 +935,54 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
     def update_status(self, status: str):
         """ステータステキストを更新 (メインステータスのみ更新)"""
-        full_status_text = f"状态: {status}"
-        self.update_queue.put(
-            lambda: self._safe_update_label(self.status_label, full_status_text)
+        if status == self.current_status:
+            return
+        self.current_status = status
+
+        self._set_latest_update("status", status)
+
+        # システムトレイアイコンを更新（短時間の連続変化は最後の状態のみ反映）
+        QMetaObject.invokeMethod(
+            self, "_schedule_tray_update", Qt.QueuedConnection, Q_ARG(str, status)
         )
 
-        # システムトレイアイコンを更新
-        if status != self.current_status:
-            self.current_status = status
-            self.update_queue.put(lambda: self._update_tray_icon(status))
+    @pyqtSlot(str)
+    def _schedule_tray_update(self, status):
+        """トレイアイコンを更新（GUIスレッドで実行）.
+
+        直前の更新から間引き期間内であれば最新のステータスだけを記録し、
+        期間終了時にまとめて反映する。
+        """
+        throttle = self._tray_throttle
+        if throttle is None:
+            self._update_tray_icon(status)
+        elif throttle.isActive():
+            self._pending_tray_status = status
+        else:
+            self._pending_tray_status = None
+            self._update_tray_icon(status)
+            throttle.start()
+
+    def _flush_tray_update(self):
+        """間引き期間終了後、保留中の最新ステータスでトレイアイコンを更新."""
+        status = self._pending_tray_status
+        if status is not None:
+            self._pending_tray_status = None
+            self._update_tray_icon(status)
+            self._tray_throttle.start()
 
     def update_text(self, text: str):
         """TTSテキストを更新."""
-        self.update_queue.put(
-            lambda: self._safe_update_label(self.tts_text_label, text)
-        )
+        if text == self._last_text:
+            return
+        self._last_text = text
+
+        self._set_latest_update("text", text)
 
     def update_emotion(self, emotion_path: str):
         """表情アニメーションを更新."""
         # パスが同じ場合、表情を重複設定しない
-        if (
-            hasattr(self, "_last_emotion_path")
-            and self._last_emotion_path == emotion_path
-        ):
+        if self._last_emotion_path == emotion_path:
             return
 
         # 現在設定されているパスを記録
@@ -529,17 +990,19 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
         # メインスレッドでUI更新を処理することを保証
         if QApplication.instance().thread() != QThread.currentThread():
-            # メインスレッドにいない場合、シグナルスロット方式またはQMetaObject呼び出しでメインスレッドで実行
-            QMetaObject.invokeMethod(
-                self,
-                "_update_emotion_safely",
-                Qt.QueuedConnection,
-                Q_ARG(str, emotion_path),
-            )
+            # メインスレッドにいない場合、カスタムイベントでメインスレッドに届ける
+            QCoreApplication.postEvent(self, _EmotionEvent(emotion_path))
         else:
             # すでにメインスレッド、直接実行
             self._update_emotion_safely(emotion_path)
 
+    def customEvent(self, event):
+        """他スレッドから投稿された表情変更イベントを処理."""
+        if event.type() == _EmotionEvent.TYPE:
+            self._update_emotion_safely(event.path)
+        else:
+            super().customEvent(event)
+
     # メインスレッドで安全に表情を更新するためのスロット関数を新規追加
     @pyqtSlot(str)
     def _update_emotion_safely(self, emotion_path: str):
@@ -558,19 +1021,15 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             return
 
         # 現在のラベルにGIFがすでに表示されているかチェック
-        if hasattr(label, "current_gif_path") and label.current_gif_path == gif_path:
+        if self._label_gif_path == gif_path:
             return
 
-        # 現在のGIFパスをラベルオブジェクトに記録
-        label.current_gif_path = gif_path
+        # 現在のGIFパスを記録
+        self._label_gif_path = gif_path
 
         try:
-            # 如果当前已经设置了相同路径的动画，且正在播放，则不重复设置
-            if (
-                self.emotion_movie
-                and getattr(self.emotion_movie, "_gif_path", None) == gif_path
-                and self.emotion_movie.state() == QMovie.Running
-            ):
+            # 如果当前已经设置了相同路径的动画，则不重复设置
+            if self.emotion_frames and self.emotion_gif_path == gif_path:
                 return
 
             # 如果正在进行动画，则只记录下一个待显示的表情，等当前动画完成后再切换
@@ -582,38 +1041,11 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             self.is_emotion_animating = True
 
             # 如果已有动画在播放，先淡出当前动画
-            if self.emotion_movie and label.movie() == self.emotion_movie:
-                # 创建透明度效果（如果尚未创建）
-                if not self.emotion_effect:
-                    self.emotion_effect = QGraphicsOpacityEffect(label)
-                    label.setGraphicsEffect(self.emotion_effect)
-                    self.emotion_effect.setOpacity(1.0)
-
-                # 创建淡出动画
-                self.emotion_animation = QPropertyAnimation(
-                    self.emotion_effect, b"opacity"
-                )
-                self.emotion_animation.setDuration(180)  # 设置动画持续时间（毫秒）
+            if self.emotion_frames and self.emotion_animation:
+                # フェードアウト完了後、新しいGIFを設定してフェードインを開始
+                self._fade_out_target = (label, gif_path)
                 self.emotion_animation.setStartValue(1.0)
                 self.emotion_animation.setEndValue(0.25)
-
-                # フェードアウト完了後、新しいGIFを設定してフェードインを開始
-                def on_fade_out_finished():
-                    try:
-                        # 現在のGIFを停止
-                        if self.emotion_movie:
-                            self.emotion_movie.stop()
-
-                        # 新しいGIFを設定してフェードイン
-                        self._set_new_emotion_gif(label, gif_path)
-                    except Exception as e:
-                        self.logger.error(f"淡出动画完成后设置GIF失败: {e}")
-                        self.is_emotion_animating = False
-
-                # 连接淡出完成信号
-                self.emotion_animation.finished.connect(on_fade_out_finished)
-
-                # 开始淡出动画
                 self.emotion_animation.start()
             else:
                 # 以前のアニメーションがない場合、直接新しいGIFを設定してフェードイン
@@ -631,80 +1063,48 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
     def _set_new_emotion_gif(self, label, gif_path):
         """设置新的GIF动画并执行淡入效果."""
         try:
-            # GIFキャッシュを維持
-            if not hasattr(self, "_gif_cache"):
-                self._gif_cache = {}
-
             # キャッシュにこのGIFがあるかチェック
-            if gif_path in self._gif_cache:
-                movie = self._gif_cache[gif_path]
+            if gif_path in self._gif_images:
+                self._gif_images.move_to_end(gif_path)
             else:
-                # 记录日志(只在首次加载时记录)
-                self.logger.info(f"加载GIF文件: {gif_path}")
-                # 创建动画对象
-                movie = QMovie(gif_path)
-                if not movie.isValid():
-                    self.logger.error(f"无效的GIF文件: {gif_path}")
-                    label.setText("😊")
-                    self.is_emotion_animating = False
-                    return
-
-                # 配置动画并存入缓存
-                movie.setCacheMode(QMovie.CacheAll)
-                self._gif_cache[gif_path] = movie
-
-            # GIFパスをmovieオブジェクトに保存、比較用
-            movie._gif_path = gif_path
-
-            # 连接信号
-            movie.error.connect(
-                lambda: self.logger.error(f"GIF播放错误: {movie.lastError()}")
-            )
+                # 初回はワーカースレッドでデコードし、完了後に再度この関数を呼び出す
+                # （それまでは現在の表示をそのまま残す）
+                self._pending_gif = (label, gif_path)
+                if gif_path not in self._gif_decoding:
+                    # 记录日志(只在开始解码时记录)
+                    self.logger.info(f"加载GIF文件: {gif_path}")
+                    self._gif_decoding.add(gif_path)
+                    QThreadPool.globalInstance().start(
+                        _GifDecodeTask(gif_path, self._gif_decode_signals)
+                    )
+                return
 
-            # 保存新的动画对象
-            self.emotion_movie = movie
+            frames, delays = self._get_emotion_frames(gif_path, label)
 
             # 设置标签大小策略
             label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             label.setAlignment(Qt.AlignCenter)
 
-            # 设置动画到标签
-            label.setMovie(movie)
+            # 切换到新的帧序列
+            self.emotion_timer.stop()
+            self.emotion_frames = frames
+            self.emotion_delays = delays
+            self.emotion_frame_index = 0
+            self.emotion_gif_path = gif_path
+            label.setPixmap(frames[0])
 
-            # QMovieの速度を105に設定、アニメーションをよりスムーズに(デフォルトは100)
-            movie.setSpeed(105)
+            # 开始播放动画（单帧GIF不需要定时器）
+            if len(frames) > 1:
+                self.emotion_timer.start(delays[0])
 
-            # 不透明度が0（完全透明）であることを保証
-            if self.emotion_effect:
-                self.emotion_effect.setOpacity(0.0)
+            # 开始淡入动画
+            if self.emotion_animation:
+                self._fade_out_target = None
+                self.emotion_animation.setStartValue(0.25)
+                self.emotion_animation.setEndValue(1.0)
+                self.emotion_animation.start()
             else:
-                self.emotion_effect = QGraphicsOpacityEffect(label)
-                label.setGraphicsEffect(self.emotion_effect)
-                self.emotion_effect.setOpacity(0.0)
-
-            # 开始播放动画
-            movie.start()
-
-            # 创建淡入动画
-            self.emotion_animation = QPropertyAnimation(self.emotion_effect, b"opacity")
-            self.emotion_animation.setDuration(180)  # 淡入时间（毫秒）
-            self.emotion_animation.setStartValue(0.25)
-            self.emotion_animation.setEndValue(1.0)
-
-            # 淡入完成后检查是否有下一个待显示的表情
-            def on_fade_in_finished():
                 self.is_emotion_animating = False
-                # 如果有下一个待显示的表情，则继续切换
-                if self.next_emotion_path:
-                    next_path = self.next_emotion_path
-                    self.next_emotion_path = None
-                    self._set_emotion_gif(label, next_path)
-
-            # 连接淡入完成信号
-            self.emotion_animation.finished.connect(on_fade_in_finished)
-
-            # 开始淡入动画
-            self.emotion_animation.start()
 
         except Exception as e:
             self.logger.error(f"设置新的GIF动画失败: {e}")
@@ -715,6 +1115,118 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             except Exception:
                 pass
 
+    def _on_emotion_fade_finished(self):
+        """表情のフェードアウト/フェードイン完了を処理."""
+        target = self._fade_out_target
+        if target is not None:
+            # フェードアウト完了：現在のGIFを停止して新しいGIFをフェードイン
+            self._fade_out_target = None
+            try:
+                self.emotion_timer.stop()
+                self._set_new_emotion_gif(*target)
+            except Exception as e:
+                self.logger.error(f"淡出动画完成后设置GIF失败: {e}")
+                self.is_emotion_animating = False
+            return
+
+        # フェードイン完了：次に表示する表情があれば続けて切り替え
+        self.is_emotion_animating = False
+        if self.next_emotion_path:
+            next_path = self.next_emotion_path
+            self.next_emotion_path = None
+            self._set_emotion_gif(self.emotion_label, next_path)
+
+    def _on_gif_decoded(self, gif_path, decoded):
+        """ワーカースレッドでのGIFデコード完了を処理（メインスレッドで実行）."""
+        self._gif_decoding.discard(gif_path)
+        pending = self._pending_gif
+        if decoded is None:
+            self.logger.error(f"无效的GIF文件: {gif_path}")
+            if pending and pending[1] == gif_path:
+                self._pending_gif = None
+                pending[0].setText("😊")
+                self.is_emotion_animating = False
+            return
+
+        self._remember_gif(gif_path, decoded)
+
+        # このGIFの表示を待っている場合は再生を開始
+        if pending and pending[1] == gif_path:
+            self._pending_gif = None
+            self._set_new_emotion_gif(pending[0], gif_path)
+
+    def _remember_gif(self, gif_path, decoded):
+        """デコード済みGIFを保持し、古いものから破棄して_GIF_CACHE_MAX件に抑える.
+
+        再生中のGIFは破棄しない。破棄したGIFの縮小済みフレームも合わせて解放する。
+        """
+        images = self._gif_images
+        images[gif_path] = decoded
+        images.move_to_end(gif_path)
+        while len(images) > _GIF_CACHE_MAX:
+            oldest = next(iter(images))
+            if oldest == self.emotion_gif_path:
+                images.move_to_end(oldest)
+                oldest = next(iter(images))
+            del images[oldest]
+            self._gif_cache.pop(oldest, None)
+
+    def _get_emotion_frames(self, gif_path, label):
+        """ラベルの表示領域に合わせたフレーム(QPixmap)と表示時間を取得.
+
+        フレームが表示領域より大きい場合のみ一度だけ縮小してキャッシュする。
+        描画ごとの拡縮を避けるため。キャッシュはGIFごとに最新のサイズ1つだけを保持し、
+        ウィンドウのリサイズでサイズ違いのフレームが溜まらないようにする。
+        """
+        images, delays = self._gif_images[gif_path]
+        area = label.contentsRect().size()
+        frame_size = images[0].size()
+        if frame_size.width() <= area.width() and frame_size.height() <= area.height():
+            target = frame_size
+        else:
+            target = frame_size.scaled(area, Qt.KeepAspectRatio)
+
+        size = (target.width(), target.height())
+        cached = self._gif_cache.get(gif_path)
+        if cached is None or cached[0] != size:
+            if target == frame_size:
+                frames = [QPixmap.fromImage(image) for image in images]
+            else:
+                frames = [
+                    QPixmap.fromImage(
+                        image.scaled(
+                            target, Qt.KeepAspectRatio, Qt.SmoothTransformation
+                        )
+                    )
+                    for image in images
+                ]
+            # 同じGIFの別サイズのフレームは置き換えて破棄する
+            cached = self._gif_cache[gif_path] = (size, frames, delays)
+        return cached[1], cached[2]
+
+    def _on_emotion_label_resized(self):
+        """表情ラベルのサイズ変更時に、表示サイズに合ったフレームに切り替える."""
+        gif_path = self.emotion_gif_path
+        if not gif_path or gif_path not in self._gif_images:
+            return
+        frames, delays = self._get_emotion_frames(gif_path, self.emotion_label)
+        if frames is self.emotion_frames:
+            return
+        self.emotion_frames = frames
+        self.emotion_delays = delays
+        self.emotion_frame_index %= len(frames)
+        self.emotion_label.setPixmap(frames[self.emotion_frame_index])
+
+    def _advance_emotion_frame(self):
+        """表情GIFの次のフレームを表示."""
+        frames = self.emotion_frames
+        if not frames or not self.emotion_label:
+            return
+        index = (self.emotion_frame_index + 1) % len(frames)
+        self.emotion_frame_index = index
+        self.emotion_label.setPixmap(frames[index])
+        self.emotion_timer.start(self.emotion_delays[index])
+
     def _safe_update_label(self, label, text):
         """安全地更新标签文本."""
         if label and not self.root.isHidden():
@@ -723,38 +1235,29 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             except RuntimeError as e:
                 self.logger.error(f"更新标签失败: {e}")
 
-    def start_update_threads(self):
-        """启动更新线程."""
-        # 初始化表情缓存
-        self.last_emotion_path = None
-
-        def update_loop():
-            while self._running:
-                try:
-                    # 更新状态
-                    if self.status_update_callback:
-                        status = self.status_update_callback()
-                        if status:
-                            self.update_status(status)
-
-                    # 更新文本
-                    if self.text_update_callback:
-                        text = self.text_update_callback()
-                        if text:
-                            self.update_text(text)
-
-                    # 更新表情 - 只在表情变化时更新
-                    if self.emotion_update_callback:
-                        emotion = self.emotion_update_callback()
-                        if emotion:
-                            # update_emotionメソッドを直接呼び出し、重複チェックを処理
-                            self.update_emotion(emotion)
-
-                except Exception as e:
-                    self.logger.error(f"更新失败: {e}")
-                time.sleep(0.1)
-
-        threading.Thread(target=update_loop, daemon=True).start()
+    def _sync_from_callbacks(self):
+        """回调函数から現在の状態を一度だけ取得して表示に反映.
+
+        以降の更新はApplicationからupdate_status/update_text/update_emotionが
+        状態変化時に直接呼び出されるため、定期的なポーリングは行わない。
+        """
+        try:
+            if self.status_update_callback:
+                status = self.status_update_callback()
+                if status:
+                    self.update_status(status)
+
+            if self.text_update_callback:
+                text = self.text_update_callback()
+                if text:
+                    self.update_text(text)
+
+            if self.emotion_update_callback:
+                emotion = self.emotion_update_callback()
+                if emotion:
+                    self.update_emotion(emotion)
+        except Exception as e:
+            self.logger.error(f"更新失败: {e}")
 
     def on_close(self):
         """关闭窗口处理."""
@@ -763,21 +1266,17 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         # 确保在主线程中停止定时器
         if QThread.currentThread() != QApplication.instance().thread():
             # 非メインスレッドの場合、QMetaObject.invokeMethodを使用してメインスレッドで実行
-            if self.update_timer:
-                QMetaObject.invokeMethod(self.update_timer, "stop", Qt.QueuedConnection)
-
             if self.ha_update_timer:
                 QMetaObject.invokeMethod(
                     self.ha_update_timer, "stop", Qt.QueuedConnection
                 )
         else:
             # すでにメインスレッド内、直接停止
-            if self.update_timer:
-                self.update_timer.stop()
-
             if self.ha_update_timer:
                 self.ha_update_timer.stop()
 
+        self._shutdown_ha_fetch()
+
         if self.tray_icon:
             self.tray_icon.hide()
         if self.root:
@@ -807,19 +1306,45 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
             uic.loadUi(str(ui_path), self.root)
 
+            # 名前付きオブジェクトを一度の走査で収集し、以降の検索は辞書で行う
+            self._by_name = {
+                obj.objectName(): obj
+                for obj in self.root.findChildren(QObject)
+                if obj.objectName()
+            }
+
             # UI内のコントロールを取得
-            self.status_label = self.root.findChild(QLabel, "status_label")
-            self.emotion_label = self.root.findChild(QLabel, "emotion_label")
-            self.tts_text_label = self.root.findChild(QLabel, "tts_text_label")
-            self.manual_btn = self.root.findChild(QPushButton, "manual_btn")
-            self.abort_btn = self.root.findChild(QPushButton, "abort_btn")
-            self.auto_btn = self.root.findChild(QPushButton, "auto_btn")
-            self.mode_btn = self.root.findChild(QPushButton, "mode_btn")
+            self.status_label = self._find(QLabel, "status_label")
+            self.emotion_label = self._find(QLabel, "emotion_label")
+            self.tts_text_label = self._find(QLabel, "tts_text_label")
+            self.manual_btn = self._find(QPushButton, "manual_btn")
+            self.abort_btn = self._find(QPushButton, "abort_btn")
+            self.auto_btn = self._find(QPushButton, "auto_btn")
+            self.mode_btn = self._find(QPushButton, "mode_btn")
+
+            # 表情アニメーションのフレーム切り替えタイマー
+            self.emotion_timer = QTimer()
+            self.emotion_timer.setSingleShot(True)
+            self.emotion_timer.timeout.connect(self._advance_emotion_frame)
+            self._gif_decode_signals = _GifDecodeSignals()
+            self._gif_decode_signals.finished.connect(self._on_gif_decoded)
+            if self.emotion_label:
+                self.emotion_label.installEventFilter(self)
+
+                # 表情切り替え用の透明度エフェクトとアニメーションは一度だけ作成して再利用
+                self.emotion_effect = QGraphicsOpacityEffect(self.emotion_label)
+                self.emotion_effect.setOpacity(1.0)
+                self.emotion_label.setGraphicsEffect(self.emotion_effect)
+                self.emotion_animation = QPropertyAnimation(
+                    self.emotion_effect, b"opacity", self
+                )
+                self.emotion_animation.setDuration(180)  # アニメーション時間（ミリ秒）
+                self.emotion_animation.finished.connect(self._on_emotion_fade_finished)
 
             # 添加快捷键提示标签
             try:
                 # メインインターフェースのレイアウトを検索
-                main_page = self.root.findChild(QWidget, "mainPage")
+                main_page = self._find(QWidget, "mainPage")
                 if main_page:
                     main_layout = main_page.layout()
                     if main_layout:
@@ -847,17 +1372,14 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.logger.warning(f"添加快捷键提示标签失败: {e}")
 
             # IOTページコントロールを取得
-            self.iot_card = self.root.findChild(
-                QFrame, "iotPage"
-            )  # ここでは "iotPage" をIDとして使用していることに注意
+            # ここでは "iotPage" をIDとして使用していることに注意
+            self.iot_card = self._find(QFrame, "iotPage")
             if self.iot_card is None:
                 # iotPageが見つからない場合、他の可能な名前を試す
-                self.iot_card = self.root.findChild(QFrame, "iot_card")
+                self.iot_card = self._find(QFrame, "iot_card")
                 if self.iot_card is None:
                     # まだ見つからない場合、stackedWidgetで第2ページをiot_cardとして取得しようと試みる
-                    self.stackedWidget = self.root.findChild(
-                        QStackedWidget, "stackedWidget"
-                    )
+                    self.stackedWidget = self._find(QStackedWidget, "stackedWidget")
                     if self.stackedWidget and self.stackedWidget.count() > 1:
                         self.iot_card = self.stackedWidget.widget(
                             1
@@ -871,23 +1393,23 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.logger.info(f"找到 iot_card: {self.iot_card}")
 
             # 音量控制组件页面
-            self.volume_page = self.root.findChild(QWidget, "volume_page")
+            self.volume_page = self._find(QWidget, "volume_page")
 
             # 音量控制组件
-            self.volume_scale = self.root.findChild(QSlider, "volume_scale")
-            self.mute = self.root.findChild(QPushButton, "mute")
+            self.volume_scale = self._find(QSlider, "volume_scale")
+            self.mute = self._find(QPushButton, "mute")
 
             if self.mute:
                 self.mute.setCheckable(True)
                 self.mute.clicked.connect(self._on_mute_click)
 
             # 获取或创建音量百分比标签
-            self.volume_label = self.root.findChild(QLabel, "volume_label")
+            self.volume_label = self._find(QLabel, "volume_label")
             if not self.volume_label and self.volume_scale:
                 # 如果UI中没有音量标签，动态创建一个
-                volume_layout = self.root.findChild(QHBoxLayout, "volume_layout")
+                volume_layout = self._find(QHBoxLayout, "volume_layout")
                 if volume_layout:
-                    self.volume_label = QLabel(f"{self.current_volume}%")
+                    self.volume_label = QLabel(_VOLUME_TEXTS[self.current_volume])
                     self.volume_label.setObjectName("volume_label")
                     self.volume_label.setMinimumWidth(40)
                     self.volume_label.setAlignment(Qt.AlignCenter)
@@ -910,65 +1432,22 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 # 正常设置音量滑块初始值
                 if self.volume_scale:
                     self.volume_scale.setRange(0, 100)
+                    self._volume_min = self.volume_scale.minimum()
+                    self._volume_range = self.volume_scale.maximum() - self._volume_min
                     self.volume_scale.setValue(self.current_volume)
+                    self.volume_update_timer = QTimer(self)
+                    self.volume_update_timer.setSingleShot(True)
+                    self.volume_update_timer.setInterval(300)
+                    self.volume_update_timer.timeout.connect(self._flush_volume)
                     self.volume_scale.valueChanged.connect(self._on_volume_change)
                     self.volume_scale.installEventFilter(self)  # 安装事件过滤器
                 # 更新音量百分比显示
                 if self.volume_label:
-                    self.volume_label.setText(f"{self.current_volume}%")
-
-            # 获取设置页面控件
-            self.wakeWordEnableSwitch = self.root.findChild(
-                QCheckBox, "wakeWordEnableSwitch"
-            )
-            self.wakeWordsLineEdit = self.root.findChild(QLineEdit, "wakeWordsLineEdit")
-            self.saveSettingsButton = self.root.findChild(
-                QPushButton, "saveSettingsButton"
-            )
-            # 获取新增的控件
-            # 使用 PyQt 标准控件替换
-            self.deviceIdLineEdit = self.root.findChild(QLineEdit, "deviceIdLineEdit")
-            self.wsProtocolComboBox = self.root.findChild(
-                QComboBox, "wsProtocolComboBox"
-            )
-            self.wsAddressLineEdit = self.root.findChild(QLineEdit, "wsAddressLineEdit")
-            self.wsTokenLineEdit = self.root.findChild(QLineEdit, "wsTokenLineEdit")
-            # Home Assistant 控件引用
-            self.haProtocolComboBox = self.root.findChild(
-                QComboBox, "haProtocolComboBox"
-            )
-            self.ha_server = self.root.findChild(QLineEdit, "ha_server")
-            self.ha_port = self.root.findChild(QLineEdit, "ha_port")
-            self.ha_key = self.root.findChild(QLineEdit, "ha_key")
-            self.Add_ha_devices = self.root.findChild(QPushButton, "Add_ha_devices")
-
-            # 获取 OTA 相关控件
-            self.otaProtocolComboBox = self.root.findChild(
-                QComboBox, "otaProtocolComboBox"
-            )
-            self.otaAddressLineEdit = self.root.findChild(
-                QLineEdit, "otaAddressLineEdit"
-            )
-
-            # 显式添加 ComboBox 选项，以防 UI 文件加载问题
-            if self.wsProtocolComboBox:
-                # 先清空，避免重复添加 (如果 .ui 文件也成功加载了选项)
-                self.wsProtocolComboBox.clear()
-                self.wsProtocolComboBox.addItems(["wss://", "ws://"])
-
-            # 显式添加OTA ComboBox选项
-            if self.otaProtocolComboBox:
-                self.otaProtocolComboBox.clear()
-                self.otaProtocolComboBox.addItems(["https://", "http://"])
-
-            # 显式添加 Home Assistant 协议下拉框选项
-            if self.haProtocolComboBox:
-                self.haProtocolComboBox.clear()
-                self.haProtocolComboBox.addItems(["http://", "https://"])
+                    self.volume_label.setText(_VOLUME_TEXTS[self.current_volume])
 
             # 获取导航控件
-            self.stackedWidget = self.root.findChild(QStackedWidget, "stackedWidget")
-            self.nav_tab_bar = self.root.findChild(QTabBar, "nav_tab_bar")
+            self.stackedWidget = self._find(QStackedWidget, "stackedWidget")
+            self.nav_tab_bar = self._find(QTabBar, "nav_tab_bar")
 
             # 初始化导航标签栏
             self._setup_navigation()
@@ -987,41 +1466,34 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.mode_btn.clicked.connect(self._on_mode_button_click)
 
             # 初始化文本输入框和发送按钮
-            self.text_input = self.root.findChild(QLineEdit, "text_input")
-            self.send_btn = self.root.findChild(QPushButton, "send_btn")
+            self.text_input = self._find(QLineEdit, "text_input")
+            self.send_btn = self._find(QPushButton, "send_btn")
             if self.text_input and self.send_btn:
                 self.send_btn.clicked.connect(self._on_send_button_click)
                 # 绑定Enter键发送文本
                 self.text_input.returnPressed.connect(self._on_send_button_click)
 
-            # 连接设置保存按钮事件
-            if self.saveSettingsButton:
-                self.saveSettingsButton.clicked.connect(self._save_settings)
-
-            # 连接Home Assistant设备导入按钮事件
-            if self.Add_ha_devices:
-                self.Add_ha_devices.clicked.connect(self._on_add_ha_devices_click)
-
-            # 设置鼠标事件
-            self.root.mousePressEvent = self.mousePressEvent
-            self.root.mouseReleaseEvent = self.mouseReleaseEvent
-
-            # 设置窗口关闭事件
-            self.root.closeEvent = self._closeEvent
+            # 通过事件过滤器处理主窗口的鼠标事件（滑动切换页面）和关闭事件
+            self.root.installEventFilter(self)
 
             # 初始化系统托盘
-            self._setup_tray_icon()
-
-            # 启动键盘监听
-            self.start_keyboard_listener()
-
-            # 启动更新线程
-            self.start_update_threads()
-
-            # 定时器处理更新队列
-            self.update_timer = QTimer()
-            self.update_timer.timeout.connect(self._process_updates)
-            self.update_timer.start(100)
+            self._tray_throttle = QTimer(self)
+            self._tray_throttle.setSingleShot(True)
+            self._tray_throttle.setInterval(5000)  # 最多每5秒更新一次托盘图标
+            self._tray_throttle.timeout.connect(self._flush_tray_update)
+
+            # 托盘图标和键盘监听在窗口显示后再初始化，缩短启动时间
+            QTimer.singleShot(0, self._post_show_init)
+
+            # 初始状态同步：在GUI线程的事件循环中执行一次（之后由Application推送更新）
+            QTimer.singleShot(0, self._sync_from_callbacks)
+
+            # 更新キューはキューへの追加時にのみGUIスレッドで処理する（ポーリングしない）
+            self._update_kick.connect(self._process_updates, Qt.QueuedConnection)
+            self._update_kick.emit()  # 起動前に溜まった更新を反映
+            self._device_states_kick.connect(
+                self._flush_device_states, Qt.QueuedConnection
+            )
 
             # 在主线程中运行主循环
             self.logger.info("开始启动GUI主循环")
@@ -1034,6 +1506,62 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             print(f"GUI启动失败: {e}，请尝试使用CLI模式")
             raise
 
+    def _post_show_init(self):
+        """窗口显示后初始化系统托盘和键盘监听."""
+        self._setup_tray_icon()
+        self.start_keyboard_listener()
+
+    def _init_settings_widgets(self):
+        """首次打开设置页面时获取设置页面控件并连接事件."""
+        if self._settings_initialized:
+            return
+        self._settings_initialized = True
+
+        # 获取设置页面控件
+        self.wakeWordEnableSwitch = self._find(QCheckBox, "wakeWordEnableSwitch")
+        self.wakeWordsLineEdit = self._find(QLineEdit, "wakeWordsLineEdit")
+        self.saveSettingsButton = self._find(QPushButton, "saveSettingsButton")
+        # 获取新增的控件
+        # 使用 PyQt 标准控件替换
+        self.deviceIdLineEdit = self._find(QLineEdit, "deviceIdLineEdit")
+        self.wsProtocolComboBox = self._find(QComboBox, "wsProtocolComboBox")
+        self.wsAddressLineEdit = self._find(QLineEdit, "wsAddressLineEdit")
+        self.wsTokenLineEdit = self._find(QLineEdit, "wsTokenLineEdit")
+        # Home Assistant 控件引用
+        self.haProtocolComboBox = self._find(QComboBox, "haProtocolComboBox")
+        self.ha_server = self._find(QLineEdit, "ha_server")
+        self.ha_port = self._find(QLineEdit, "ha_port")
+        self.ha_key = self._find(QLineEdit, "ha_key")
+        self.Add_ha_devices = self._find(QPushButton, "Add_ha_devices")
+
+        # 获取 OTA 相关控件
+        self.otaProtocolComboBox = self._find(QComboBox, "otaProtocolComboBox")
+        self.otaAddressLineEdit = self._find(QLineEdit, "otaAddressLineEdit")
+
+        # 显式添加 ComboBox 选项，以防 UI 文件加载问题
+        # 先清空，避免重复添加 (如果 .ui 文件也成功加载了选项)
+        self._fill_combo(self.wsProtocolComboBox, _WS_PROTOCOLS)
+        self._fill_combo(self.otaProtocolComboBox, _OTA_PROTOCOLS)
+        self._fill_combo(self.haProtocolComboBox, _HA_PROTOCOLS)
+
+        # 连接设置保存按钮事件
+        if self.saveSettingsButton:
+            self.saveSettingsButton.clicked.connect(self._save_settings)
+
+        # 连接Home Assistant设备导入按钮事件
+        if self.Add_ha_devices:
+            self.Add_ha_devices.clicked.connect(self._on_add_ha_devices_click)
+
+    @staticmethod
+    def _fill_combo(combo, items):
+        """下拉框选项填充（填充期间屏蔽信号，避免触发中间状态的槽函数）."""
+        if not combo:
+            return
+        blocker = QSignalBlocker(combo)
+        combo.clear()
+        combo.addItems(items)
+        blocker.unblock()
+
     def _setup_tray_icon(self):
         """设置系统托盘图标."""
         try:
@@ -1058,6 +1586,10 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             quit_action.triggered.connect(self._quit_application)
             self.tray_menu.addAction(quit_action)
 
+            # 预先绘制各状态颜色的图标
+            for color in _TRAY_COLORS:
+                self._tray_icons[color.rgb()] = self._render_tray_icon(color)
+
             # 创建系统托盘图标
             self.tray_icon = QSystemTrayIcon(self.root)
             self.tray_icon.setContextMenu(self.tray_menu)
@@ -1075,6 +1607,7 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         except Exception as e:
             self.logger.error(f"初始化系统托盘图标失败: {e}", exc_info=True)
 
+    @pyqtSlot(str)
     def _update_tray_icon(self, status):
         """根据不同状态更新托盘图标颜色.
 
@@ -1090,43 +1623,41 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         try:
             icon_color = self._get_status_color(status)
 
-            # 创建指定颜色的图标
-            pixmap = QPixmap(16, 16)
-            pixmap.fill(Qt.transparent)
-
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setBrush(QBrush(icon_color))
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(2, 2, 12, 12)
-            painter.end()
-
-            # 设置图标
-            self.tray_icon.setIcon(QIcon(pixmap))
+            # 设置图标（每种颜色只绘制一次）
+            icon = self._tray_icons.get(icon_color.rgb())
+            if icon is None:
+                icon = self._tray_icons[icon_color.rgb()] = self._render_tray_icon(
+                    icon_color
+                )
+            self.tray_icon.setIcon(icon)
 
             # 设置提示文本
-            tooltip = f"小智AI助手 - {status}"
-            self.tray_icon.setToolTip(tooltip)
+            self.tray_icon.setToolTip(_tray_tooltip(status))
 
         except Exception as e:
             self.logger.error(f"更新系统托盘图标失败: {e}")
 
+    @staticmethod
+    def _render_tray_icon(color):
+        """绘制指定颜色的圆形托盘图标."""
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(QBrush(color))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(2, 2, 12, 12)
+        painter.end()
+        return QIcon(pixmap)
+
     def _get_status_color(self, status):
         """根据状态返回对应的颜色."""
         if not self.is_connected:
-            return QColor(128, 128, 128)  # 灰色 - 未连接
-
-        if "错误" in status:
-            return QColor(255, 0, 0)  # 红色 - 错误状态
-
-        elif "聆听中" in status:
-            return QColor(255, 200, 0)  # 黄色 - 聆听中状态
+            return _TRAY_GRAY  # 灰色 - 未连接
 
-        elif "说话中" in status:
-            return QColor(0, 120, 255)  # 蓝色 - 说话中状态
-
-        else:
-            return QColor(0, 180, 0)  # 绿色 - 待命/已启动状态
+        # 其他状态（待命/已启动等）为绿色
+        return _STATUS_COLORS.get(status, _TRAY_GREEN)
 
     def _tray_icon_activated(self, reason):
         """处理托盘图标点击事件."""
@@ -1147,11 +1678,9 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         """退出应用程序."""
         self._running = False
         # 停止所有线程和计时器
-        if self.update_timer:
-            self.update_timer.stop()
-
         if self.ha_update_timer:
             self.ha_update_timer.stop()
+        self._shutdown_ha_fetch()
 
         # 停止键盘监听
         self.stop_keyboard_listener()
@@ -1182,13 +1711,13 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
     def update_mode_button_status(self, text: str):
         """更新模式按钮状态."""
-        self.update_queue.put(lambda: self._safe_update_button(self.mode_btn, text))
+        self._schedule_update(lambda: self._safe_update_button(self.mode_btn, text))
 
     def update_button_status(self, text: str):
         """更新按钮状态 - 保留此方法以满足抽象基类要求"""
         # 根据当前模式更新相应的按钮
         if self.auto_mode:
-            self.update_queue.put(lambda: self._safe_update_button(self.auto_btn, text))
+            self._schedule_update(lambda: self._safe_update_button(self.auto_btn, text))
         else:
             # 在手动模式下，不通过此方法更新按钮文本
             # 因为按钮文本由按下/释放事件直接控制
@@ -1204,23 +1733,17 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
     def _on_volume_change(self, value):
         """处理音量滑块变化，使用节流."""
-
-        def update_volume():
+        # 记录最新的值并重新开始计时，300ms 内没有新变化时才更新音量
+        self._pending_volume = value
+        if self.volume_update_timer:
+            self.volume_update_timer.start()
+        else:
             self.update_volume(value)
 
-        # 取消之前的定时器
-        if (
-            hasattr(self, "volume_update_timer")
-            and self.volume_update_timer
-            and self.volume_update_timer.isActive()
-        ):
-            self.volume_update_timer.stop()
-
-        # 设置新的定时器，300ms 后更新音量
-        self.volume_update_timer = QTimer()
-        self.volume_update_timer.setSingleShot(True)
-        self.volume_update_timer.timeout.connect(update_volume)
-        self.volume_update_timer.start(300)
+    def _flush_volume(self):
+        """节流结束后应用最新的音量值."""
+        if self._pending_volume is not None:
+            self.update_volume(self._pending_volume)
 
     def update_volume(self, volume: int):
         """重写父类的update_volume方法，确保UI同步更新."""
@@ -1237,97 +1760,59 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 if self.volume_scale:
                     self.volume_scale.setValue(volume)
                 if self.volume_label:
-                    self.volume_label.setText(f"{volume}%")
+                    self.volume_label.setText(_VOLUME_TEXTS[volume])
             except RuntimeError as e:
                 self.logger.error(f"更新音量UI失败: {e}")
 
-    def is_combo(self, *keys):
-        """判断是否同时按下了一组按键."""
-        return all(k in self.pressed_keys for k in keys)
+    def is_combo(self, mask):
+        """判断是否同时按下了一组按键（mask为按键位的组合）."""
+        return self._pressed_mask & mask == mask
 
     def start_keyboard_listener(self):
-        """启动键盘监听."""
-        # 如果 pynput 不可用，记录警告并返回
+        """启动键盘监听.
+
+        pynput 可用时使用全局快捷键；不可用或启动失败时，
+        改为在窗口获得焦点时通过 Qt 键盘事件处理快捷键。
+        """
+        # 如果 pynput 不可用，使用窗口内快捷键
         if pynput_keyboard is None:
             self.logger.warning(
-                "键盘监听不可用：pynput 库未能正确加载。快捷键功能将不可用。"
+                "全局键盘监听不可用：pynput 库未能正确加载。快捷键仅在窗口激活时有效。"
             )
+            self._start_qt_key_handling()
             return
 
         try:
+            keys = pynput_keyboard.Key
+            modifier_bits = {
+                keys.alt_l: _KEY_ALT,
+                keys.alt_r: _KEY_ALT,
+                keys.shift_l: _KEY_SHIFT,
+                keys.shift_r: _KEY_SHIFT,
+            }
+
+            # 监听器回调会收到系统中所有按键，常用对象预先绑定为局部变量
+            modifier_bit = modifier_bits.get
+            char_bit = _CHAR_BITS.get
+            key_press = self._on_shortcut_key_press
+            key_release = self._on_shortcut_key_release
+
+            def key_bit(key):
+                bit = modifier_bit(key)
+                if bit is None:
+                    char = getattr(key, "char", None)
+                    bit = char_bit(char.lower(), 0) if char else 0
+                return bit
 
             def on_press(key):
-                try:
-                    # 记录按下的键
-                    if (
-                        key == pynput_keyboard.Key.alt_l
-                        or key == pynput_keyboard.Key.alt_r
-                    ):
-                        self.pressed_keys.add("alt")
-                    elif (
-                        key == pynput_keyboard.Key.shift_l
-                        or key == pynput_keyboard.Key.shift_r
-                    ):
-                        self.pressed_keys.add("shift")
-                    elif hasattr(key, "char") and key.char:
-                        self.pressed_keys.add(key.char.lower())
-
-                    # 长按说话 - 在手动模式下处理
-                    if not self.auto_mode and self.is_combo("alt", "shift", "v"):
-                        if self.button_press_callback:
-                            self.button_press_callback()
-                            if self.manual_btn:
-                                self.update_queue.put(
-                                    lambda: self._safe_update_button(
-                                        self.manual_btn, "松开以停止"
-                                    )
-                                )
-
-                    # 自动对话模式
-                    if self.is_combo("alt", "shift", "a"):
-                        if self.auto_callback:
-                            self.auto_callback()
-
-                    # 打断
-                    if self.is_combo("alt", "shift", "x"):
-                        if self.abort_callback:
-                            self.abort_callback()
-
-                    # 模式切换
-                    if self.is_combo("alt", "shift", "m"):
-                        self._on_mode_button_click()
-
-                except Exception as e:
-                    self.logger.error(f"键盘事件处理错误: {e}")
+                bit = key_bit(key)
+                if bit:
+                    key_press(bit)
 
             def on_release(key):
-                try:
-                    # 清除释放的键
-                    if (
-                        key == pynput_keyboard.Key.alt_l
-                        or key == pynput_keyboard.Key.alt_r
-                    ):
-                        self.pressed_keys.discard("alt")
-                    elif (
-                        key == pynput_keyboard.Key.shift_l
-                        or key == pynput_keyboard.Key.shift_r
-                    ):
-                        self.pressed_keys.discard("shift")
-                    elif hasattr(key, "char") and key.char:
-                        self.pressed_keys.discard(key.char.lower())
-
-                    # 松开按键，停止语音输入（仅在手动模式下）
-                    if not self.auto_mode and not self.is_combo("alt", "shift", "v"):
-                        if self.button_release_callback:
-                            self.button_release_callback()
-                            if self.manual_btn:
-                                self.update_queue.put(
-                                    lambda: self._safe_update_button(
-                                        self.manual_btn, "按住后说话"
-                                    )
-                                )
-                except Exception as e:
-                    self.logger.error(f"键盘事件处理错误: {e}")
+                bit = key_bit(key)
+                if bit:
+                    key_release(bit)
 
             # 创建并启动监听器
             self.keyboard_listener = pynput_keyboard.Listener(
@@ -1337,6 +1822,85 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             self.logger.info("键盘监听器初始化成功")
         except Exception as e:
             self.logger.error(f"键盘监听器初始化失败: {e}")
+            self._start_qt_key_handling()
+
+    def _start_qt_key_handling(self):
+        """通过主窗口的 Qt 键盘事件处理快捷键（仅窗口激活时有效）."""
+        # 主窗口的事件过滤器已在start()中安装
+        self._qt_key_handling = True
+
+    def _handle_qt_key_event(self, event):
+        """处理主窗口的 Qt 键盘事件."""
+        event_type = event.type()
+        if event_type == QEvent.WindowDeactivate:
+            # 窗口失去焦点时收不到按键释放事件，清除按下状态
+            if self._pressed_mask:
+                self._on_shortcut_key_release(self._pressed_mask)
+            return
+        if event.isAutoRepeat():
+            return
+        bit = _QT_KEY_BITS.get(event.key(), 0)
+        if event_type == QEvent.KeyPress:
+            self._on_shortcut_key_press(bit)
+        else:
+            self._on_shortcut_key_release(bit)
+
+    def _on_shortcut_key_press(self, bit):
+        """快捷键相关按键按下处理（bit为按键对应的位）."""
+        try:
+            # 记录按下的键（未跟踪的按键不会触发快捷键，直接返回）
+            if not bit:
+                return
+            self._pressed_mask |= bit
+
+            # 快捷键组合包含于当前按下的键中即触发（多按了其他键或漏收释放事件时仍有效）
+            mask = self._pressed_mask
+            for combo, handler in self._combo_handlers.items():
+                if mask & combo == combo:
+                    handler()
+
+        except Exception as e:
+            self.logger.error(f"键盘事件处理错误: {e}")
+
+    def _on_talk_combo(self):
+        """长按说话快捷键 - 在手动模式下处理."""
+        if not self.auto_mode and self.button_press_callback:
+            self.button_press_callback()
+            if self.manual_btn:
+                self._schedule_update(
+                    lambda: self._safe_update_button(self.manual_btn, "松开以停止")
+                )
+
+    def _on_auto_combo(self):
+        """自动对话模式快捷键."""
+        if self.auto_callback:
+            self.auto_callback()
+
+    def _on_abort_combo(self):
+        """打断快捷键."""
+        if self.abort_callback:
+            self.abort_callback()
+
+    def _on_shortcut_key_release(self, bit):
+        """快捷键相关按键释放处理（bit为按键对应的位）."""
+        try:
+            # 清除释放的键（未跟踪的按键不影响快捷键状态）
+            if not bit:
+                return
+            self._pressed_mask &= ~bit
+
+            # 松开按键，停止语音输入（仅在手动模式下）
+            if not self.auto_mode and not self.is_combo(self._COMBO_V):
+                if self.button_release_callback:
+                    self.button_release_callback()
+                    if self.manual_btn:
+                        self._schedule_update(
+                            lambda: self._safe_update_button(
+                                self.manual_btn, "按住后说话"
+                            )
+                        )
+        except Exception as e:
+            self.logger.error(f"键盘事件处理错误: {e}")
 
     def stop_keyboard_listener(self):
         """停止键盘监听."""
@@ -1355,24 +1919,25 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         """鼠标释放事件处理 (修改为使用 QTabBar 索引)"""
-        if event.button() == Qt.LeftButton and self.last_mouse_pos is not None:
-            delta = event.pos().x() - self.last_mouse_pos.x()
-            self.last_mouse_pos = None
+        last_pos = self.last_mouse_pos
+        if last_pos is None or event.button() != Qt.LeftButton:
+            return
+        self.last_mouse_pos = None
 
-            if abs(delta) > 100:  # 滑动阈值
-                current_index = (
-                    self.nav_tab_bar.currentIndex() if self.nav_tab_bar else 0
-                )
-                tab_count = self.nav_tab_bar.count() if self.nav_tab_bar else 0
+        delta = event.pos().x() - last_pos.x()
+        if -100 <= delta <= 100:  # 未超过滑动阈值
+            return
+
+        tab_bar = self.nav_tab_bar
+        if not tab_bar:
+            return
+        current_index = tab_bar.currentIndex()
 
-                if delta > 0 and current_index > 0:  # 右滑
-                    new_index = current_index - 1
-                    if self.nav_tab_bar:
-                        self.nav_tab_bar.setCurrentIndex(new_index)
-                elif delta < 0 and current_index < tab_count - 1:  # 左滑
-                    new_index = current_index + 1
-                    if self.nav_tab_bar:
-                        self.nav_tab_bar.setCurrentIndex(new_index)
+        if delta > 0:  # 右滑
+            if current_index > 0:
+                tab_bar.setCurrentIndex(current_index - 1)
+        elif current_index < tab_bar.count() - 1:  # 左滑
+            tab_bar.setCurrentIndex(current_index + 1)
 
     def _on_mute_click(self):
         """静音按钮点击事件处理 (使用 isChecked 状态)"""
@@ -1398,13 +1963,14 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.update_volume(self.pre_mute_volume)
                 self.mute.setText("点击静音")  # 恢复文本
                 if self.volume_label:
-                    self.volume_label.setText(f"{self.pre_mute_volume}%")
+                    self.volume_label.setText(_VOLUME_TEXTS[self.pre_mute_volume])
 
         except Exception as e:
             self.logger.error(f"静音按钮点击事件处理失败: {e}")
 
     def _load_settings(self):
         """加载配置文件并更新设置页面UI (使用ConfigManager)"""
+        self._init_settings_widgets()
         try:
             # 使用ConfigManager获取配置
             config_manager = ConfigManager.get_instance()
@@ -1419,7 +1985,7 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.wakeWordEnableSwitch.setChecked(use_wake_word)
 
             if self.wakeWordsLineEdit:
-                self.wakeWordsLineEdit.setText(", ".join(wake_words))
+                _set_text(self.wakeWordsLineEdit, ", ".join(wake_words))
 
             # 获取系统选项
             device_id = config_manager.get_config("SYSTEM_OPTIONS.DEVICE_ID", "")
@@ -1434,110 +2000,85 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             )
 
             if self.deviceIdLineEdit:
-                self.deviceIdLineEdit.setText(device_id)
+                _set_text(self.deviceIdLineEdit, device_id)
 
             # 解析 WebSocket URL 并设置协议和地址
             if websocket_url and self.wsProtocolComboBox and self.wsAddressLineEdit:
-                try:
-                    parsed_url = urlparse(websocket_url)
-                    protocol = parsed_url.scheme
-
-                    # 保留URL末尾的斜杠
-                    address = parsed_url.netloc + parsed_url.path
-
-                    # 确保地址不以协议开头
-                    if address.startswith(f"{protocol}://"):
-                        address = address[len(f"{protocol}://") :]
-
-                    index = self.wsProtocolComboBox.findText(
-                        f"{protocol}://", Qt.MatchFixedString
-                    )
-                    if index >= 0:
-                        self.wsProtocolComboBox.setCurrentIndex(index)
-                    else:
-                        self.logger.warning(f"未知的 WebSocket 协议: {protocol}")
-                        self.wsProtocolComboBox.setCurrentIndex(0)  # 默认为 wss
-
-                    self.wsAddressLineEdit.setText(address)
-                except Exception as e:
-                    self.logger.error(
-                        f"解析 WebSocket URL 时出错: {websocket_url} - {e}"
-                    )
-                    self.wsProtocolComboBox.setCurrentIndex(0)
-                    self.wsAddressLineEdit.clear()
+                self._apply_url(
+                    self.wsProtocolComboBox,
+                    self.wsAddressLineEdit,
+                    websocket_url,
+                    _WS_PROTOCOL_INDEX,
+                    "WebSocket",
+                )
 
             if self.wsTokenLineEdit:
-                self.wsTokenLineEdit.setText(websocket_token)
+                _set_text(self.wsTokenLineEdit, websocket_token)
 
             # 解析OTA URL并设置协议和地址
             if ota_url and self.otaProtocolComboBox and self.otaAddressLineEdit:
-                try:
-                    parsed_url = urlparse(ota_url)
-                    protocol = parsed_url.scheme
-
-                    # 保留URL末尾的斜杠
-                    address = parsed_url.netloc + parsed_url.path
-
-                    # 确保地址不以协议开头
-                    if address.startswith(f"{protocol}://"):
-                        address = address[len(f"{protocol}://") :]
-
-                    if protocol == "https":
-                        self.otaProtocolComboBox.setCurrentIndex(0)
-                    elif protocol == "http":
-                        self.otaProtocolComboBox.setCurrentIndex(1)
-                    else:
-                        self.logger.warning(f"未知的OTA协议: {protocol}")
-                        self.otaProtocolComboBox.setCurrentIndex(0)  # 默认为https
-
-                    self.otaAddressLineEdit.setText(address)
-                except Exception as e:
-                    self.logger.error(f"解析OTA URL时出错: {ota_url} - {e}")
-                    self.otaProtocolComboBox.setCurrentIndex(0)
-                    self.otaAddressLineEdit.clear()
+                self._apply_url(
+                    self.otaProtocolComboBox,
+                    self.otaAddressLineEdit,
+                    ota_url,
+                    _OTA_PROTOCOL_INDEX,
+                    "OTA",
+                )
 
             # 加载Home Assistant配置
             ha_options = config_manager.get_config("HOME_ASSISTANT", {})
             ha_url = ha_options.get("URL", "")
             ha_token = ha_options.get("TOKEN", "")
 
-            # 解析Home Assistant URL并设置协议和地址
+            # 解析Home Assistant URL并设置协议和地址（地址部分不包含端口）
             if ha_url and self.haProtocolComboBox and self.ha_server:
-                try:
-                    parsed_url = urlparse(ha_url)
-                    protocol = parsed_url.scheme
-                    port = parsed_url.port
-                    # 地址部分不包含端口
-                    address = parsed_url.netloc
-                    if ":" in address:  # 如果地址中包含端口号
-                        address = address.split(":")[0]
-
-                    # 设置协议
-                    if protocol == "https":
-                        self.haProtocolComboBox.setCurrentIndex(1)
-                    else:  # http或其他协议，默认http
-                        self.haProtocolComboBox.setCurrentIndex(0)
-
-                    # 设置地址
-                    self.ha_server.setText(address)
-
-                    # 设置端口（如果有）
-                    if port and self.ha_port:
-                        self.ha_port.setText(str(port))
-                except Exception as e:
-                    self.logger.error(f"解析Home Assistant URL时出错: {ha_url} - {e}")
-                    # 出错时使用默认值
-                    self.haProtocolComboBox.setCurrentIndex(0)  # 默认为http
-                    self.ha_server.clear()
+                self._apply_url(
+                    self.haProtocolComboBox,
+                    self.ha_server,
+                    ha_url,
+                    _HA_PROTOCOL_INDEX,
+                    "Home Assistant",
+                    split_port=True,
+                )
 
             # 设置Home Assistant Token
             if self.ha_key:
-                self.ha_key.setText(ha_token)
+                _set_text(self.ha_key, ha_token)
 
         except Exception as e:
             self.logger.error(f"加载配置文件时出错: {e}", exc_info=True)
             QMessageBox.critical(self.root, "错误", f"加载设置失败: {e}")
 
+    def _apply_url(self, combo, edit, url, index_map, name, split_port=False):
+        """解析URL并设置协议下拉框和地址输入框.
+
+        split_port为True时，地址不包含端口，端口单独设置到ha_port输入框。
+        """
+        try:
+            parsed_url = urlparse(url)
+            protocol = parsed_url.scheme
+
+            index = index_map.get(protocol)
+            if index is None:
+                self.logger.warning(f"未知的{name}协议: {protocol}")
+                index = 0  # 默认为第一个协议
+            _set_index(combo, index)
+
+            if not split_port:
+                # 保留URL末尾的斜杠
+                _set_text(edit, parsed_url.netloc + parsed_url.path)
+                return
+
+            _set_text(edit, parsed_url.netloc.split(":")[0])
+            port = parsed_url.port
+            if port and self.ha_port:
+                _set_text(self.ha_port, str(port))
+        except Exception as e:
+            self.logger.error(f"解析{name} URL时出错: {url} - {e}")
+            # 出错时使用默认值
+            _set_index(combo, 0)
+            _set_text(edit, "")
+
     def _save_settings(self):
         """保存设置页面的更改到配置文件 (使用ConfigManager)"""
         try:
@@ -1555,7 +2096,7 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
                 self.wakeWordsLineEdit.text() if self.wakeWordsLineEdit else ""
             )
             wake_words = [
-                word.strip() for word in wake_words_text.split(",") if word.strip()
+                word for word in _WAKE_WORD_SPLIT.split(wake_words_text.strip()) if word
             ]
 
             # 系统选项
@@ -1616,75 +2157,36 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             else:
                 ha_url = ""
 
-            # 获取完整的当前配置
-            current_config = config_manager._config.copy()
-
-            # 通过 ConfigManager 获取最新的设备列表
-            try:
-                # 重新获取 ConfigManager 实例以确保获取最新配置
-                fresh_config_manager = ConfigManager.get_instance()
-                latest_devices = fresh_config_manager.get_config(
-                    "HOME_ASSISTANT.DEVICES", []
-                )
-                self.logger.info(f"从配置管理器读取了 {len(latest_devices)} 个设备")
-            except Exception as e:
-                self.logger.error(f"通过配置管理器读取设备列表失败: {e}")
-                # 如果读取失败，使用内存中的设备列表
-                if (
-                    "HOME_ASSISTANT" in current_config
-                    and "DEVICES" in current_config["HOME_ASSISTANT"]
-                ):
-                    latest_devices = current_config["HOME_ASSISTANT"]["DEVICES"]
-                else:
-                    latest_devices = []
-
-            # 更新配置对象（不写入文件）
-            # 1. 更新唤醒词配置
-            if "WAKE_WORD_OPTIONS" not in current_config:
-                current_config["WAKE_WORD_OPTIONS"] = {}
-            current_config["WAKE_WORD_OPTIONS"]["USE_WAKE_WORD"] = use_wake_word
-            current_config["WAKE_WORD_OPTIONS"]["WAKE_WORDS"] = wake_words
-
-            # 2. 更新系统选项
-            if "SYSTEM_OPTIONS" not in current_config:
-                current_config["SYSTEM_OPTIONS"] = {}
-            current_config["SYSTEM_OPTIONS"]["DEVICE_ID"] = new_device_id
-
-            if "NETWORK" not in current_config["SYSTEM_OPTIONS"]:
-                current_config["SYSTEM_OPTIONS"]["NETWORK"] = {}
-            current_config["SYSTEM_OPTIONS"]["NETWORK"][
-                "WEBSOCKET_URL"
-            ] = new_websocket_url
-            current_config["SYSTEM_OPTIONS"]["NETWORK"][
-                "WEBSOCKET_ACCESS_TOKEN"
-            ] = new_ws_token
-            current_config["SYSTEM_OPTIONS"]["NETWORK"]["OTA_VERSION_URL"] = new_ota_url
-
-            # 3. 更新Home Assistant配置
-            if "HOME_ASSISTANT" not in current_config:
-                current_config["HOME_ASSISTANT"] = {}
-            current_config["HOME_ASSISTANT"]["URL"] = ha_url
-            current_config["HOME_ASSISTANT"]["TOKEN"] = ha_key
-
-            # 使用最新的设备列表
-            current_config["HOME_ASSISTANT"]["DEVICES"] = latest_devices
-
-            # 一次性保存整个配置
-            save_success = config_manager._save_config(current_config)
+            # 只更新设置页面涉及的配置项，并一次性保存
+            # （Home Assistant设备列表等其他配置保持不变）
+            save_success = config_manager.update_configs(
+                {
+                    "WAKE_WORD_OPTIONS.USE_WAKE_WORD": use_wake_word,
+                    "WAKE_WORD_OPTIONS.WAKE_WORDS": wake_words,
+                    "SYSTEM_OPTIONS.DEVICE_ID": new_device_id,
+                    "SYSTEM_OPTIONS.NETWORK.WEBSOCKET_URL": new_websocket_url,
+                    "SYSTEM_OPTIONS.NETWORK.WEBSOCKET_ACCESS_TOKEN": new_ws_token,
+                    "SYSTEM_OPTIONS.NETWORK.OTA_VERSION_URL": new_ota_url,
+                    "HOME_ASSISTANT.URL": ha_url,
+                    "HOME_ASSISTANT.TOKEN": ha_key,
+                }
+            )
 
             if save_success:
                 self.logger.info("设置已成功保存到 config.json")
-                reply = QMessageBox.question(
-                    self.root,
+                self.invalidate_ha_cache()
+                # 使用非阻塞对话框询问是否重启，结果在 finished 信号中处理
+                box = QMessageBox(
+                    QMessageBox.Question,
                     "保存成功",
                     "设置已保存。\n部分设置需要重启应用程序才能生效。\n\n是否立即重启？",
                     QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.No,
+                    self.root,
                 )
-
-                if reply == QMessageBox.Yes:
-                    self.logger.info("用户选择重启应用程序。")
-                    restart_program()
+                box.setDefaultButton(QMessageBox.No)
+                box.setAttribute(Qt.WA_DeleteOnClose)
+                box.finished.connect(self._on_restart_prompt_finished)
+                box.open()
             else:
                 raise Exception("保存配置文件失败")
 
@@ -1692,18 +2194,21 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             self.logger.error(f"保存设置时发生未知错误: {e}", exc_info=True)
             QMessageBox.critical(self.root, "错误", f"保存设置失败: {e}")
 
+    def _on_restart_prompt_finished(self, result):
+        """处理保存设置后的重启确认对话框结果."""
+        if result == QMessageBox.Yes:
+            self.logger.info("用户选择重启应用程序。")
+            restart_program()
+
     def _on_add_ha_devices_click(self):
         """处理添加Home Assistant设备按钮点击事件."""
         try:
             self.logger.info("启动Home Assistant设备管理器...")
 
-            # 使用resource_finder查找脚本路径
-            from src.utils.resource_finder import get_project_root
-
-            project_root = get_project_root()
-            script_path = project_root / "src" / "ui" / "ha_device_manager" / "index.py"
+            # 使用resource_finder查找脚本路径（进程内只查找一次）
+            script_path, exists = _ha_script_path()
 
-            if not script_path.exists():
+            if not exists:
                 self.logger.error(f"设备管理器脚本不存在: {script_path}")
                 QMessageBox.critical(self.root, "错误", "设备管理器脚本不存在")
                 return
@@ -1712,8 +2217,6 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             cmd = [sys.executable, str(script_path)]
 
             # 使用subprocess启动新进程
-            import subprocess
-
             subprocess.Popen(cmd)
 
         except Exception as e:
@@ -1733,338 +2236,508 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
         self.text_input.clear()
 
         # 获取应用程序的事件循环并在其中运行协程
-        from src.application import Application
-
-        app = Application.get_instance()
+        app = self._application
         if app and app.loop:
-            import asyncio
-
-            asyncio.run_coroutine_threadsafe(self.send_text_callback(text), app.loop)
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is app.loop:
+                # 已在事件循环线程中（如qasync集成），直接创建任务，省去跨线程唤醒
+                running.create_task(self.send_text_callback(text))
+            else:
+                asyncio.run_coroutine_threadsafe(
+                    self.send_text_callback(text), app.loop
+                )
         else:
             self.logger.error("应用程序实例或事件循环不可用")
 
     def _load_iot_devices(self):
-        """加载并显示Home Assistant设备列表."""
+        """加载并显示Home Assistant设备列表.
+
+        页面骨架（标题、滚动区域、网格）和设备卡片只创建一次，
+        重新加载时按实体ID复用已有卡片，只新建缺少的卡片并删除多余的卡片。
+        """
+        if not self.iot_card:
+            return
+
         try:
-            # 先清空现有设备列表
-            if hasattr(self, "devices_list") and self.devices_list:
-                for widget in self.devices_list:
-                    widget.deleteLater()
-                self.devices_list = []
-
-            # 清空设备状态标签引用
-            self.device_labels = {}
-
-            # 获取设备布局
-            if self.iot_card:
-                # 记录原来的标题文本，以便后面重新设置
-                title_text = ""
-                if self.history_title:
-                    title_text = self.history_title.text()
-
-                # 设置self.history_title为None，以避免在清除旧布局时被删除导致引用错误
-                self.history_title = None
-
-                # 获取原布局并删除所有子控件
-                old_layout = self.iot_card.layout()
-                if old_layout:
-                    # 清空布局中的所有控件
-                    while old_layout.count():
-                        item = old_layout.takeAt(0)
-                        widget = item.widget()
-                        if widget:
-                            widget.deleteLater()
-
-                    # 在现有布局中重新添加控件，而不是创建新布局
-                    new_layout = old_layout
-                else:
-                    # 如果没有现有布局，则创建一个新的
-                    new_layout = QVBoxLayout()
-                    self.iot_card.setLayout(new_layout)
-
-                # 重置布局属性
-                new_layout.setContentsMargins(2, 2, 2, 2)  # 进一步减小外边距
-                new_layout.setSpacing(2)  # 进一步减小控件间距
-
-                # 创建标题
-                self.history_title = QLabel(title_text)
-                self.history_title.setFont(
-                    QFont(self.app.font().family(), 12)
-                )  # 字体缩小
-                self.history_title.setAlignment(Qt.AlignCenter)  # 居中对齐
-                self.history_title.setContentsMargins(5, 2, 0, 2)  # 设置标题的边距
-                self.history_title.setMaximumHeight(25)  # 减小标题高度
-                new_layout.addWidget(self.history_title)
-
-                # 尝试通过 ConfigManager 加载设备列表
-                try:
-                    config_manager = ConfigManager.get_instance()
-                    devices = config_manager.get_config("HOME_ASSISTANT.DEVICES", [])
-
-                    # 更新标题
-                    self.history_title.setText(f"已连接设备 ({len(devices)})")
-
-                    # 创建滚动区域
-                    scroll_area = QScrollArea()
-                    scroll_area.setWidgetResizable(True)
-                    scroll_area.setFrameShape(QFrame.NoFrame)  # 移除边框
-                    scroll_area.setStyleSheet("background: transparent;")  # 透明背景
-
-                    # 创建滚动区域的内容容器
-                    container = QWidget()
-                    container.setStyleSheet("background: transparent;")  # 透明背景
-
-                    # 创建网格布局，设置顶部对齐
-                    grid_layout = QGridLayout(container)
-                    grid_layout.setContentsMargins(3, 3, 3, 3)  # 增加外边距
-                    grid_layout.setSpacing(8)  # 增加网格间距
-                    grid_layout.setAlignment(Qt.AlignTop)  # 设置顶部对齐
-
-                    # 设置网格每行显示的卡片数量
-                    cards_per_row = 3  # 每行显示3个设备卡片
-
-                    # 遍历设备并添加到网格布局
-                    for i, device in enumerate(devices):
-                        entity_id = device.get("entity_id", "")
-                        friendly_name = device.get("friendly_name", "")
-
-                        # 解析friendly_name - 提取位置和设备名称
-                        location = friendly_name
-                        device_name = ""
-                        if "," in friendly_name:
-                            parts = friendly_name.split(",", 1)
-                            location = parts[0].strip()
-                            device_name = parts[1].strip()
-
-                        # 创建设备卡片 (使用QFrame替代CardWidget)
-                        device_card = QFrame()
-                        device_card.setMinimumHeight(90)  # 增加最小高度
-                        device_card.setMaximumHeight(150)  # 增加最大高度以适应换行文本
-                        device_card.setMinimumWidth(200)  # 增加宽度
-                        device_card.setProperty("entity_id", entity_id)  # 存储entity_id
-                        # 设置卡片样式 - 轻微背景色，圆角，阴影效果
-                        device_card.setStyleSheet(
-                            """
-                            QFrame {
-                                border-radius: 5px;
-                                background-color: rgba(255, 255, 255, 0.7);
-                                border: none;
-                            }
-                        """
-                        )
+            # 首次加载（或出错后）构建页面骨架
+            if self._device_grid is None:
+                self._build_iot_page()
 
-                        card_layout = QVBoxLayout(device_card)
-                        card_layout.setContentsMargins(10, 8, 10, 8)  # 内边距
-                        card_layout.setSpacing(2)  # 控件间距
-
-                        # 设备名称 - 显示在第一行（加粗）并允许换行
-                        device_name_label = QLabel(f"<b>{device_name}</b>")
-                        device_name_label.setFont(QFont(self.app.font().family(), 14))
-                        device_name_label.setWordWrap(True)  # 启用自动换行
-                        device_name_label.setMinimumHeight(20)  # 设置最小高度
-                        device_name_label.setSizePolicy(
-                            QSizePolicy.Expanding, QSizePolicy.Minimum
-                        )  # 水平扩展，垂直最小
-                        card_layout.addWidget(device_name_label)
-
-                        # 设备位置 - 显示在第二行（不加粗）
-                        location_label = QLabel(f"{location}")
-                        location_label.setFont(QFont(self.app.font().family(), 12))
-                        location_label.setStyleSheet("color: #666666;")
-                        card_layout.addWidget(location_label)
-
-                        # 添加分隔线
-                        line = QFrame()
-                        line.setFrameShape(QFrame.HLine)
-                        line.setFrameShadow(QFrame.Sunken)
-                        line.setStyleSheet("background-color: #E0E0E0;")
-                        line.setMaximumHeight(1)
-                        card_layout.addWidget(line)
-
-                        # 设备状态 - 根据设备类型设置不同的默认状态
-                        state_text = "未知"
-                        if "light" in entity_id:
-                            state_text = "关闭"
-                            status_display = f"状态: {state_text}"
-                        elif "sensor" in entity_id:
-                            if "temperature" in entity_id:
-                                state_text = "0℃"
-                                status_display = state_text
-                            elif "humidity" in entity_id:
-                                state_text = "0%"
-                                status_display = state_text
-                            else:
-                                state_text = "正常"
-                                status_display = f"状态: {state_text}"
-                        elif "switch" in entity_id:
-                            state_text = "关闭"
-                            status_display = f"状态: {state_text}"
-                        elif "button" in entity_id:
-                            state_text = "可用"
-                            status_display = f"状态: {state_text}"
-                        else:
-                            status_display = state_text
-
-                        # 直接显示状态值
-                        state_label = QLabel(status_display)
-                        state_label.setFont(QFont(self.app.font().family(), 14))
-                        state_label.setStyleSheet(
-                            "color: #2196F3; border: none;"
-                        )  # 添加无边框样式
-                        card_layout.addWidget(state_label)
-
-                        # 保存状态标签引用
-                        self.device_labels[entity_id] = state_label
-
-                        # 计算行列位置
-                        row = i // cards_per_row
-                        col = i % cards_per_row
-
-                        # 将卡片添加到网格布局
-                        grid_layout.addWidget(device_card, row, col)
-
-                        # 保存引用以便后续清理
-                        self.devices_list.append(device_card)
-
-                    # 设置滚动区域内容
-                    container.setLayout(grid_layout)
-                    scroll_area.setWidget(container)
-
-                    # 将滚动区域添加到主布局
-                    new_layout.addWidget(scroll_area)
-
-                    # 设置滚动区域样式
-                    scroll_area.setStyleSheet(
-                        """
-                        QScrollArea {
-                            border: none;
-                            background-color: transparent;
-                        }
-                        QScrollBar:vertical {
-                            border: none;
-                            background-color: #F5F5F5;
-                            width: 8px;
-                            border-radius: 4px;
-                        }
-                        QScrollBar::handle:vertical {
-                            background-color: #BDBDBD;
-                            border-radius: 4px;
-                        }
-                        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                            height: 0px;
-                        }
-                    """
-                    )
+            # 尝试加载设备列表（使用缓存的配置）
+            try:
+                if self._ha_devices is None:
+                    self._load_ha_config()
+                devices = self._ha_devices
+
+                # 更新标题
+                self.history_title.setText(f"已连接设备 ({len(devices)})")
 
-                    # 停止现有的更新定时器（如果存在）
-                    if self.ha_update_timer and self.ha_update_timer.isActive():
-                        self.ha_update_timer.stop()
+                self._sync_device_cards(devices)
 
-                    # 创建并启动一个定时器，每1秒更新一次设备状态
+                # 创建一次更新定时器，每1秒更新一次设备状态（事件流已连接时不轮询）
+                if self.ha_update_timer is None:
                     self.ha_update_timer = QTimer()
                     self.ha_update_timer.timeout.connect(self._update_device_states)
+                if not self._ha_streaming and not self.ha_update_timer.isActive():
                     self.ha_update_timer.start(1000)  # 1秒更新一次
 
-                    # 立即执行一次更新
-                    self._update_device_states()
-
-                except Exception as e:
-                    # 如果加载设备失败，创建一个错误提示布局
-                    self.logger.error(f"读取设备配置失败: {e}")
-                    self.history_title = QLabel("加载设备配置失败")
-                    self.history_title.setFont(
-                        QFont(self.app.font().family(), 14, QFont.Bold)
-                    )
-                    self.history_title.setAlignment(Qt.AlignCenter)
-                    new_layout.addWidget(self.history_title)
+                # 立即查询一次所有设备的状态（事件流只推送之后的变化）
+                QTimer.singleShot(
+                    0, lambda: self._update_device_states(visible_only=False)
+                )
 
-                    error_label = QLabel(f"错误信息: {str(e)}")
-                    error_label.setWordWrap(True)
-                    error_label.setStyleSheet("color: red;")
-                    new_layout.addWidget(error_label)
+            except Exception as e:
+                # 如果加载设备失败，显示错误提示
+                self.logger.error(f"读取设备配置失败: {e}")
+                self._show_iot_error("加载设备配置失败", e)
 
         except Exception as e:
             self.logger.error(f"加载IOT设备失败: {e}", exc_info=True)
             try:
                 # 在发生错误时尝试恢复界面
-                old_layout = self.iot_card.layout()
-
-                # 如果已有布局，清空它
-                if old_layout:
-                    while old_layout.count():
-                        item = old_layout.takeAt(0)
-                        widget = item.widget()
-                        if widget:
-                            widget.deleteLater()
-
-                    # 使用现有布局
-                    new_layout = old_layout
-                else:
-                    # 创建新布局
-                    new_layout = QVBoxLayout()
-                    self.iot_card.setLayout(new_layout)
-
-                self.history_title = QLabel("加载设备失败")
-                self.history_title.setFont(
-                    QFont(self.app.font().family(), 14, QFont.Bold)
-                )
-                self.history_title.setAlignment(Qt.AlignCenter)
-                new_layout.addWidget(self.history_title)
-
-                error_label = QLabel(f"错误信息: {str(e)}")
-                error_label.setWordWrap(True)
-                error_label.setStyleSheet("color: red;")
-                new_layout.addWidget(error_label)
-
+                self._show_iot_error("加载设备失败", e)
             except Exception as e2:
                 self.logger.error(f"恢复界面失败: {e2}", exc_info=True)
 
-    def _update_device_states(self):
-        """更新Home Assistant设备状态."""
+    def _clear_iot_page(self):
+        """清空IOT页面的布局并丢弃卡片池，返回可复用的布局."""
+        layout = self.iot_card.layout()
+        if layout:
+            while layout.count():
+                item = layout.takeAt(0)
+                widget = item.widget()
+                if widget:
+                    widget.deleteLater()
+        else:
+            layout = QVBoxLayout()
+            self.iot_card.setLayout(layout)
+
+        self.history_title = None
+        self._device_grid = None
+        self._card_pool = {}
+        self._card_order = []
+        self.device_labels = {}
+        return layout
+
+    def _build_iot_page(self):
+        """构建IOT页面骨架：标题和带网格布局的滚动区域."""
+        # 记录原来的标题文本，以便后面重新设置
+        title_text = self.history_title.text() if self.history_title else ""
+
+        layout = self._clear_iot_page()
+
+        # 卡片共用的字体
+        family = self.app.font().family()
+        self._font12 = QFont(family, 12)
+        self._font14 = QFont(family, 14)
+
+        # 重置布局属性
+        layout.setContentsMargins(2, 2, 2, 2)  # 进一步减小外边距
+        layout.setSpacing(2)  # 进一步减小控件间距
+
+        # 创建标题
+        self.history_title = QLabel(title_text)
+        self.history_title.setFont(self._font12)  # 字体缩小
+        self.history_title.setAlignment(Qt.AlignCenter)  # 居中对齐
+        self.history_title.setContentsMargins(5, 2, 0, 2)  # 设置标题的边距
+        self.history_title.setMaximumHeight(25)  # 减小标题高度
+        layout.addWidget(self.history_title)
+
+        # 创建滚动区域
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QFrame.NoFrame)  # 移除边框
+
+        # 创建滚动区域的内容容器
+        container = QWidget()
+        container.setObjectName("haDeviceContainer")  # 透明背景
+
+        # 创建网格布局，设置顶部对齐
+        grid_layout = QGridLayout(container)
+        grid_layout.setContentsMargins(3, 3, 3, 3)  # 增加外边距
+        grid_layout.setSpacing(8)  # 增加网格间距
+        grid_layout.setAlignment(Qt.AlignTop)  # 设置顶部对齐
+
+        # 设置滚动区域内容
+        scroll_area.setWidget(container)
+
+        # 将滚动区域添加到主布局
+        layout.addWidget(scroll_area)
+
+        # 整个页面只设置一次样式表，卡片和标签通过objectName/属性选择样式
+        scroll_area.setStyleSheet(_IOT_QSS)
+
+        self._device_grid = grid_layout
+
+    def _sync_device_cards(self, devices):
+        """按设备列表同步卡片池：复用已有卡片，只创建缺少的，删除多余的."""
+        pool = self._card_pool
+        grid_layout = self._device_grid
+
+        order = []
+        seen = set()
+        for device in devices:
+            entity_id = device.get("entity_id", "")
+            if entity_id in seen:  # 同一实体只显示一张卡片
+                continue
+            seen.add(entity_id)
+            friendly_name = device.get("friendly_name", "")
+
+            # 解析friendly_name - 提取位置和设备名称
+            location = friendly_name
+            device_name = ""
+            if "," in friendly_name:
+                parts = friendly_name.split(",", 1)
+                location = parts[0].strip()
+                device_name = parts[1].strip()
+
+            card = pool.get(entity_id)
+            if card is None:
+                card = self._create_device_card(entity_id)
+                # 新卡片显示默认状态，清除缓存的状态以便下次查询时刷新
+                self.device_states.pop(entity_id, None)
+                pool[entity_id] = card
+                self.device_labels[entity_id] = card[3]
+
+            # 名称/位置只在变化时更新（setText相同内容时Qt不会重绘）
+            card[1].setText(f"<b>{device_name}</b>")
+            card[2].setText(f"{location}")
+            order.append(entity_id)
+
+        # 删除不再存在的设备卡片
+        for entity_id in [eid for eid in pool if eid not in seen]:
+            device_card = pool.pop(entity_id)[0]
+            grid_layout.removeWidget(device_card)
+            device_card.deleteLater()
+            self.device_labels.pop(entity_id, None)
+
+        # 顺序变化时才重新排列网格
+        if order != self._card_order:
+            # 设置网格每行显示的卡片数量
+            cards_per_row = 3  # 每行显示3个设备卡片
+            for entity_id in order:
+                grid_layout.removeWidget(pool[entity_id][0])
+            for i, entity_id in enumerate(order):
+                # 计算行列位置
+                row = i // cards_per_row
+                col = i % cards_per_row
+                grid_layout.addWidget(pool[entity_id][0], row, col)
+            self._card_order = order
+
+    def _create_device_card(self, entity_id):
+        """创建单个设备卡片，返回(卡片, 名称标签, 位置标签, 状态标签)."""
+        # 创建设备卡片 (使用QFrame替代CardWidget)
+        device_card = QFrame()
+        device_card.setMinimumWidth(200)  # 增加宽度
+        # 高度由内容的sizeHint决定（标签自动换行），不再固定最小/最大高度
+        device_card.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        device_card.setProperty("entity_id", entity_id)  # 存储entity_id
+        # 卡片样式（轻微背景色，圆角）由_IOT_QSS中的#haDeviceCard提供
+        device_card.setObjectName("haDeviceCard")
+
+        card_layout = QVBoxLayout(device_card)
+        card_layout.setContentsMargins(10, 8, 10, 8)  # 内边距
+        card_layout.setSpacing(2)  # 控件间距
+
+        # 设备名称 - 显示在第一行（加粗）并允许换行
+        device_name_label = QLabel()
+        device_name_label.setFont(self._font14)
+        device_name_label.setWordWrap(True)  # 启用自动换行
+        card_layout.addWidget(device_name_label)
+
+        # 设备位置 - 显示在第二行（不加粗）
+        location_label = QLabel()
+        location_label.setFont(self._font12)
+        location_label.setObjectName("haDeviceLocation")
+        location_label.setWordWrap(True)  # 较长的位置名称自动换行
+        card_layout.addWidget(location_label)
+
+        # 添加分隔线
+        card_layout.addWidget(self._make_separator())
+
+        # 设备状态 - 根据设备类型设置不同的默认状态
+        state_text = "未知"
+        if "light" in entity_id:
+            state_text = "关闭"
+            status_display = f"状态: {state_text}"
+        elif "sensor" in entity_id:
+            if "temperature" in entity_id:
+                state_text = "0℃"
+                status_display = state_text
+            elif "humidity" in entity_id:
+                state_text = "0%"
+                status_display = state_text
+            else:
+                state_text = "正常"
+                status_display = f"状态: {state_text}"
+        elif "switch" in entity_id:
+            state_text = "关闭"
+            status_display = f"状态: {state_text}"
+        elif "button" in entity_id:
+            state_text = "可用"
+            status_display = f"状态: {state_text}"
+        else:
+            status_display = state_text
+
+        # 直接显示状态值
+        state_label = QLabel(status_display)
+        state_label.setFont(self._font14)
+        state_label.setObjectName("haDeviceState")
+        state_label.setProperty("_kind", _classify_entity(entity_id))
+        card_layout.addWidget(state_label)
+
+        return device_card, device_name_label, location_label, state_label
+
+    @staticmethod
+    def _make_separator():
+        """创建设备卡片中的水平分隔线."""
+        line = QFrame()
+        line.setFrameShape(QFrame.HLine)
+        line.setFrameShadow(QFrame.Sunken)
+        line.setObjectName("haDeviceSeparator")
+        line.setMaximumHeight(1)
+        return line
+
+    def _show_iot_error(self, title, error):
+        """在IOT页面显示错误信息（清空页面和卡片池）."""
+        layout = self._clear_iot_page()
+
+        self.history_title = QLabel(title)
+        self.history_title.setFont(QFont(self.app.font().family(), 14, QFont.Bold))
+        self.history_title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.history_title)
+
+        error_label = QLabel(f"错误信息: {str(error)}")
+        error_label.setWordWrap(True)
+        error_label.setStyleSheet("color: red;")
+        layout.addWidget(error_label)
+
+    def _update_device_states(self, visible_only=True):
+        """更新Home Assistant设备状态.
+
+        Args:
+            visible_only: 为True时只查询滚动区域内可见的设备
+        """
         # 检查当前是否在IOT界面
         if not self.stackedWidget or self.stackedWidget.currentIndex() != 1:
             return
 
-        # 通过 ConfigManager 获取Home Assistant连接信息
+        # 获取Home Assistant连接信息（使用缓存的配置）
         try:
-            config_manager = ConfigManager.get_instance()
-            ha_url = config_manager.get_config("HOME_ASSISTANT.URL", "")
-            ha_token = config_manager.get_config("HOME_ASSISTANT.TOKEN", "")
+            if self._ha_url is None:
+                self._load_ha_config()
+            ha_url = self._ha_url
+            ha_token = self._ha_token
 
             if not ha_url or not ha_token:
                 self.logger.warning("Home Assistant URL或Token未配置，无法更新设备状态")
                 return
 
-            # 为每个设备查询状态
+            session = self._get_ha_session(ha_token)
+            if self._ha_executor is None:
+                self._ha_executor = ThreadPoolExecutor(
+                    max_workers=_HA_FETCH_WORKERS, thread_name_prefix="ha-state"
+                )
+
+            # 订阅状态变化事件流（已订阅时不做任何事）
+            self._start_ha_stream(ha_url, ha_token)
+
+            # 为每个设备查询状态（上一次查询尚未完成的设备跳过，轮询时跳过滚动区域外的卡片）
+            in_flight = self._ha_in_flight
             for entity_id, label in self.device_labels.items():
-                threading.Thread(
-                    target=self._fetch_device_state,
-                    args=(ha_url, ha_token, entity_id, label),
-                    daemon=True,
-                ).start()
+                if entity_id in in_flight:
+                    continue
+                if visible_only and label.visibleRegion().isEmpty():
+                    continue
+                in_flight.add(entity_id)
+                self._ha_executor.submit(
+                    self._fetch_device_state, session, ha_url, entity_id, label
+                )
 
         except Exception as e:
             self.logger.error(f"更新Home Assistant设备状态失败: {e}", exc_info=True)
 
-    def _fetch_device_state(self, ha_url, ha_token, entity_id, label):
-        """获取单个设备的状态."""
-        import requests
+    def _load_ha_config(self):
+        """通过 ConfigManager 读取并缓存Home Assistant的URL、Token和设备列表."""
+        config_manager = ConfigManager.get_instance()
+        self._ha_url = config_manager.get_config("HOME_ASSISTANT.URL", "")
+        self._ha_token = config_manager.get_config("HOME_ASSISTANT.TOKEN", "")
+        self._ha_devices = config_manager.get_config("HOME_ASSISTANT.DEVICES", [])
+
+    def invalidate_ha_cache(self):
+        """清除Home Assistant配置缓存，下次使用时重新读取."""
+        self._ha_url = None
+        self._ha_token = None
+        self._ha_devices = None
+        # 事件流使用的是旧的URL/Token，下次更新时重新订阅
+        self._stop_ha_stream()
+
+    def _get_ha_session(self, ha_token):
+        """获取Home Assistant的HTTP会话（保持连接复用，Token变化时重建）."""
+        if self._ha_session is None or self._ha_session_token != ha_token:
+            if self._ha_session is not None:
+                self._ha_session.close()
+            session = requests.Session()
+            session.headers.update(
+                {
+                    "Authorization": f"Bearer {ha_token}",
+                    "Content-Type": "application/json",
+                }
+            )
+            # 连接池大小与工作线程数一致：每个线程都能保持一个长连接，不会因池满而丢弃连接
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_HA_FETCH_WORKERS)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._ha_session = session
+            self._ha_session_token = ha_token
+        return self._ha_session
+
+    def _start_ha_stream(self, ha_url, ha_token):
+        """启动Home Assistant事件流（/api/stream）的接收线程."""
+        if self._ha_stream_stop is not None:
+            return  # 已在运行（或服务器不支持事件流）
+
+        stop = threading.Event()
+        self._ha_stream_stop = stop
+        threading.Thread(
+            target=self._ha_stream_loop,
+            args=(ha_url, ha_token, stop),
+            name="ha-stream",
+            daemon=True,
+        ).start()
+
+    def _stop_ha_stream(self):
+        """停止Home Assistant事件流并恢复轮询."""
+        if self._ha_stream_stop is not None:
+            self._ha_stream_stop.set()
+            self._ha_stream_stop = None
+        self._on_ha_stream_lost(None)
+
+    def _ha_stream_loop(self, ha_url, ha_token, stop):
+        """接收Home Assistant的state_changed事件（在独立线程中执行）.
+
+        连接断开时按退避间隔重连；服务器不提供事件流时结束，继续使用轮询。
+        """
+        retry_delay = _HA_STREAM_RETRY_MIN
+        while not stop.is_set():
+            connected = False
+            session = requests.Session()
+            session.headers["Authorization"] = f"Bearer {ha_token}"
+            try:
+                # 读取超时只用于定期检查停止事件（服务器会定期发送ping）
+                with session.get(
+                    f"{ha_url}/api/stream",
+                    params={"restrict": "state_changed"},
+                    stream=True,
+                    timeout=(5, 120),
+                ) as response:
+                    if response.status_code != 200:
+                        self.logger.info(
+                            f"Home Assistant不支持事件流(状态码: {response.status_code})，"
+                            "继续使用轮询更新设备状态"
+                        )
+                        return
+
+                    connected = True
+                    retry_delay = _HA_STREAM_RETRY_MIN
+                    self._schedule_update(lambda: self._on_ha_stream_connected(stop))
+
+                    for line in response.iter_lines(decode_unicode=True):
+                        if stop.is_set():
+                            return
+                        if line and line.startswith("data:"):
+                            self._handle_ha_stream_event(line[5:].strip())
+
+            except requests.RequestException as e:
+                self.logger.warning(f"Home Assistant事件流连接断开: {e}")
+            except Exception as e:
+                self.logger.error(f"处理Home Assistant事件流时出错: {e}")
+            finally:
+                session.close()
+                if connected:
+                    self._schedule_update(lambda: self._on_ha_stream_lost(stop))
+
+            stop.wait(retry_delay)
+            retry_delay = min(retry_delay * 2, _HA_STREAM_RETRY_MAX)
+
+    def _handle_ha_stream_event(self, data):
+        """处理事件流中的一条state_changed事件（在事件流线程中执行）."""
+        if data == "ping":
+            return
+        try:
+            event = json.loads(data)
+        except ValueError:
+            return
+        if event.get("event_type") != "state_changed":
+            return
+
+        event_data = event.get("data") or {}
+        entity_id = event_data.get("entity_id")
+        label = self.device_labels.get(entity_id)
+        new_state = event_data.get("new_state")
+        if label is None or not new_state:
+            return
+
+        state = new_state.get("state", "unknown")
+        if self.device_states.get(entity_id) == state:
+            return
+        self.device_states[entity_id] = state
+        self._update_device_ui(entity_id, state, label)
+
+    def _on_ha_stream_connected(self, stop):
+        """事件流连接成功：停止轮询，并查询一次所有设备以补上连接前的变化."""
+        if stop is not self._ha_stream_stop:
+            return  # 已被停止的旧事件流
+        self._ha_streaming = True
+        if self.ha_update_timer:
+            self.ha_update_timer.stop()
+        self._update_device_states(visible_only=False)
 
+    def _on_ha_stream_lost(self, stop):
+        """事件流断开：恢复每秒轮询直到重新连接."""
+        if stop is not None and stop is not self._ha_stream_stop:
+            return
+        self._ha_streaming = False
+        if (
+            self._running
+            and self.ha_update_timer
+            and not self.ha_update_timer.isActive()
+        ):
+            self.ha_update_timer.start(1000)
+
+    def _shutdown_ha_fetch(self):
+        """停止Home Assistant状态查询的工作线程并关闭HTTP会话."""
+        if self._ha_stream_stop is not None:
+            self._ha_stream_stop.set()
+            self._ha_stream_stop = None
+        if self._ha_executor is not None:
+            # 尚未开始的查询直接取消，不在退出时继续发送请求
+            self._ha_executor.shutdown(wait=False, cancel_futures=True)
+            self._ha_executor = None
+        if self._ha_session is not None:
+            self._ha_session.close()
+            self._ha_session = None
+
+    def _fetch_device_state(self, session, ha_url, entity_id, label):
+        """获取单个设备的状态（在工作线程中执行）."""
         try:
             # 构造API请求URL
             api_url = f"{ha_url}/api/states/{entity_id}"
-            headers = {
-                "Authorization": f"Bearer {ha_token}",
-                "Content-Type": "application/json",
-            }
 
             # 发送请求
-            response = requests.get(api_url, headers=headers, timeout=5)
+            response = session.get(api_url, timeout=5)
 
             if response.status_code == 200:
                 state_data = response.json()
                 state = state_data.get("state", "unknown")
 
+                # 状态未变化时不向GUI线程投递更新
+                if self.device_states.get(entity_id) == state:
+                    return
+
                 # 更新设备状态
                 self.device_states[entity_id] = state
 
@@ -2079,71 +2752,53 @@ class GuiDisplay(BaseDisplay, QObject, metaclass=CombinedMeta):
             self.logger.error(f"请求Home Assistant API失败: {e}")
         except Exception as e:
             self.logger.error(f"处理设备状态时出错: {e}")
+        finally:
+            self._ha_in_flight.discard(entity_id)
 
     def _update_device_ui(self, entity_id, state, label):
-        """更新设备UI显示."""
-        # 在主线程中执行UI更新
-        self.update_queue.put(
-            lambda: self._safe_update_device_label(entity_id, state, label)
-        )
+        """更新设备UI显示（合并为一次主线程刷新）."""
+        self._ha_pending_states[entity_id] = (state, label)
+        # 与_request_process相同：先写入再检查标志，刷新期间写入的状态也不会遗漏
+        if not self._ha_flush_requested:
+            self._ha_flush_requested = True
+            # 不经过通用更新队列，通过队列连接的信号直接投递到GUI线程
+            self._device_states_kick.emit()
+
+    def _flush_device_states(self):
+        """在主线程中一次性应用所有待更新的设备状态."""
+        self._ha_flush_requested = False
+        pending = self._ha_pending_states
+        while pending:
+            try:
+                entity_id, (state, label) = pending.popitem()
+            except KeyError:
+                break
+            self._safe_update_device_label(entity_id, state, label)
 
     def _safe_update_device_label(self, entity_id, state, label):
-        """安全地更新设备状态标签."""
+        """安全地更新设备状态标签（显示内容和样式都未变化时不触碰控件）."""
         if not label or self.root.isHidden():
+            # 未能显示的状态在下次查询时重新投递
+            self.device_states.pop(entity_id, None)
             return
 
         try:
-            display_state = state  # 默认显示原始状态
-
-            # 根据设备类型格式化状态显示
-            if "light" in entity_id or "switch" in entity_id:
-                if state == "on":
-                    display_state = "状态: 开启"
-                    label.setStyleSheet(
-                        "color: #4CAF50; border: none;"
-                    )  # 绿色表示开启，无边框
-                else:
-                    display_state = "状态: 关闭"
-                    label.setStyleSheet(
-                        "color: #9E9E9E; border: none;"
-                    )  # 灰色表示关闭，无边框
-            elif "temperature" in entity_id:
-                try:
-                    temp = float(state)
-                    display_state = f"{temp:.1f}℃"
-                    label.setStyleSheet(
-                        "color: #FF9800; border: none;"
-                    )  # 橙色表示温度，无边框
-                except ValueError:
-                    display_state = state
-            elif "humidity" in entity_id:
-                try:
-                    humidity = float(state)
-                    display_state = f"{humidity:.0f}%"
-                    label.setStyleSheet(
-                        "color: #03A9F4; border: none;"
-                    )  # 浅蓝色表示湿度，无边框
-                except ValueError:
-                    display_state = state
-            elif "battery" in entity_id:
-                try:
-                    battery = float(state)
-                    display_state = f"{battery:.0f}%"
-                    # 根据电池电量设置不同颜色
-                    if battery < 20:
-                        label.setStyleSheet(
-                            "color: #F44336; border: none;"
-                        )  # 红色表示低电量，无边框
-                    else:
-                        label.setStyleSheet(
-                            "color: #4CAF50; border: none;"
-                        )  # 绿色表示正常电量，无边框
-                except ValueError:
-                    display_state = state
-            else:
-                display_state = f"状态: {state}"
-                label.setStyleSheet("color: #2196F3; border: none;")  # 默认颜色，无边框
+            # 按创建卡片时判定的设备类型格式化状态显示
+            formatter = _STATE_FORMATTERS[label.property("_kind")]
+            display_state, state_style = formatter(state)
 
+            # 与上次应用的内容相同时跳过（避免重新计算样式和重绘）
+            key = (display_state, state_style)
+            if label.property("_last_key") == key:
+                return
+            label.setProperty("_last_key", key)
+
+            # 只在颜色类别变化时切换属性并重新应用页面样式表
+            if state_style is not None and label.property("stateStyle") != state_style:
+                label.setProperty("stateStyle", state_style)
+                style = label.style()
+                style.unpolish(label)
+                style.polish(label)
             # 显示状态值
             label.setText(f"{display_state}")
         except RuntimeError as e:
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 
 class ValueType:
@@ -13,36 +13,59 @@ class ValueType:
     FLOAT = "float"
 
 
+# 値の型 -> ValueType（完全一致で引けない型はisinstanceで判定）
+_TYPE_MAP = {
+    bool: ValueType.BOOLEAN,
+    int: ValueType.NUMBER,
+    float: ValueType.NUMBER,
+    str: ValueType.STRING,
+}
+
+
+def _probe_type(value: Any) -> str:
+    """値からプロパティの型を判定."""
+    value_type = _TYPE_MAP.get(type(value))
+    if value_type is not None:
+        return value_type
+    # numpy.float64などのサブクラス
+    if isinstance(value, bool):
+        return ValueType.BOOLEAN
+    if isinstance(value, (int, float)):
+        return ValueType.NUMBER
+    if isinstance(value, str):
+        return ValueType.STRING
+    raise TypeError(f"サポートされていないプロパティ型: {type(value)}")
+
+
 class Property:
     """IoTデバイスのプロパティを表現するクラス.
     
     IoTデバイスの状態を表すプロパティを定義します。
     各プロパティには名前、説明、値を取得するゲッター関数が含まれます。
-    プロパティの型は、ゲッター関数の戻り値から自動的に推測されます。
+    プロパティの型は明示的に指定するか、ゲッター関数の戻り値から自動的に推測されます。
     """
     
-    def __init__(self, name: str, description: str, getter: Callable):
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        getter: Callable,
+        type_: Optional[str] = None,
+    ):
         """プロパティを初期化.
         
         Args:
             name: プロパティ名
             description: プロパティの説明
             getter: プロパティ値を取得するコールバック関数
+            type_: プロパティの型 (ValueType定数)。省略時はゲッターを一度呼び出して判定
         """
         self.name = name
         self.description = description
         self.getter = getter
 
-        # ゲッター関数の戻り値の型を基にプロパティの型を自動判定
-        test_value = getter()
-        if isinstance(test_value, bool):
-            self.type = ValueType.BOOLEAN
-        elif isinstance(test_value, (int, float)):
-            self.type = ValueType.NUMBER
-        elif isinstance(test_value, str):
-            self.type = ValueType.STRING
-        else:
-            raise TypeError(f"サポートされていないプロパティ型: {type(test_value)}")
+        # 型が指定されていればゲッターを呼ばない（I/Oを伴うゲッターの初期化コストを避ける）
+        self.type = type_ if type_ is not None else _probe_type(getter())
 
     def get_descriptor_json(self) -> Dict:
         """プロパティの記述子をJSON形式で取得.
@@ -81,7 +104,6 @@ class Parameter:
         self.description = description
         self.type = type_
         self.required = required
-        self.value = None
 
     def get_descriptor_json(self) -> Dict:
         """パラメータの記述子をJSON形式で取得.
@@ -91,22 +113,6 @@ class Parameter:
         """
         return {"description": self.description, "type": self.type}
 
-    def set_value(self, value: Any):
-        """パラメータの値を設定.
-        
-        Args:
-            value: 設定する値
-        """
-        self.value = value
-
-    def get_value(self) -> Any:
-        """パラメータの値を取得.
-        
-        Returns:
-            Any: パラメータの現在の値
-        """
-        return self.value
-
 
 class Method:
     """IoTデバイスのメソッドを表現するクラス.
@@ -134,6 +140,10 @@ class Method:
         self.description = description
         self.parameters = {param.name: param for param in parameters}
         self.callback = callback
+        # 必須パラメータ名は生成時に確定させ、呼び出しごとの全走査を避ける
+        self._required_names = tuple(
+            name for name, param in self.parameters.items() if param.required
+        )
 
     def get_descriptor_json(self) -> Dict:
         """メソッドの記述子をJSON形式で取得.
@@ -152,6 +162,9 @@ class Method:
     def invoke(self, params: Dict[str, Any]) -> Any:
         """メソッドを実行.
         
+        パラメータ値は共有のParameterオブジェクトに書き込まず、
+        呼び出しごとの辞書のままコールバックへ渡します（再入・並行呼び出しに安全）。
+        
         Args:
             params: メソッドに渡すパラメータの辞書
             
@@ -161,18 +174,13 @@ class Method:
         Raises:
             ValueError: 必須パラメータが不足している場合
         """
-        # パラメータ値を設定
-        for name, value in params.items():
-            if name in self.parameters:
-                self.parameters[name].set_value(value)
-
-        # 必須パラメータの存在確認
-        for name, param in self.parameters.items():
-            if param.required and param.get_value() is None:
+        # 必須パラメータの存在確認（値がNoneの場合も不足とみなす）
+        for name in self._required_names:
+            if params.get(name) is None:
                 raise ValueError(f"必須パラメータが不足: {name}")
 
-        # コールバック関数を実行
-        return self.callback(self.parameters)
+        # コールバック関数を実行（パラメータ名 -> 値 の辞書）
+        return self.callback(params)
 
 
 class Thing:
@@ -194,16 +202,25 @@ class Thing:
         self.description = description
         self.properties = {}
         self.methods = {}
+        self._descriptor_cache = None  # 記述子のキャッシュ（プロパティ/メソッド追加時に破棄）
 
-    def add_property(self, name: str, description: str, getter: Callable) -> None:
+    def add_property(
+        self,
+        name: str,
+        description: str,
+        getter: Callable,
+        type_: Optional[str] = None,
+    ) -> None:
         """デバイスにプロパティを追加.
         
         Args:
             name: プロパティ名
             description: プロパティの説明
             getter: プロパティ値を取得するコールバック関数
+            type_: プロパティの型 (ValueType定数)。省略時は戻り値から判定
         """
-        self.properties[name] = Property(name, description, getter)
+        self.properties[name] = Property(name, description, getter, type_)
+        self._descriptor_cache = None
 
     def add_method(
         self,
@@ -221,10 +238,24 @@ class Thing:
             callback: メソッド実行時のコールバック関数
         """
         self.methods[name] = Method(name, description, parameters, callback)
+        self._descriptor_cache = None
 
     def get_descriptor_json(self) -> Dict:
         """デバイスの完全な記述子をJSON形式で取得.
         
+        記述子はプロパティ/メソッドを追加しない限り変化しないため、
+        初回に構築した辞書をキャッシュして返します。
+        
+        Returns:
+            Dict: デバイス名、説明、プロパティ、メソッドの情報を含む辞書
+        """
+        if self._descriptor_cache is None:
+            self._descriptor_cache = self._build_descriptor_json()
+        return self._descriptor_cache
+
+    def _build_descriptor_json(self) -> Dict:
+        """デバイスの記述子を構築.
+        
         Returns:
             Dict: デバイス名、説明、プロパティ、メソッドの情報を含む辞書
         """
@@ -241,7 +272,7 @@ class Thing:
             },
         }
 
-    def get_state_json(self) -> Dict:
+    def get_state_json(self) -> Dict[str, Any]:
         """デバイスの現在の状態をJSON形式で取得.
         
         Returns:
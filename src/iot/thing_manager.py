@@ -10,6 +10,9 @@ from typing import Any, Dict, Optional, Tuple
 
 from src.iot.thing import Thing
 
+# 状態辞書のJSONエンコーダー（json.dumpsと同じ出力、呼び出しごとの生成を避ける）
+_encode = json.JSONEncoder().encode
+
 
 class ThingManager:
     """IoTデバイス管理クラス.
@@ -34,7 +37,9 @@ class ThingManager:
     def __init__(self):
         """ThingManagerを初期化."""
         self.things = []
-        self.last_states = {}  # 状態キャッシュ辞書、前回の状態を保存
+        self._things_by_name: Dict[str, Thing] = {}  # 名前 -> デバイスの索引（invoke用）
+        self.last_states = {}  # 状態キャッシュ辞書、前回の状態JSON文字列のハッシュ値を保存
+        self._descriptors_json_cache = None  # 記述子JSON文字列のキャッシュ
 
     def add_thing(self, thing: Thing) -> None:
         """IoTデバイスを管理対象に追加.
@@ -43,15 +48,23 @@ class ThingManager:
             thing: 追加するIoTデバイス
         """
         self.things.append(thing)
+        # 同名デバイスは従来の線形探索と同じく先に登録したものを優先
+        self._things_by_name.setdefault(thing.name, thing)
+        self._descriptors_json_cache = None
 
     def get_descriptors_json(self) -> str:
         """すべてのデバイスの記述子をJSON形式で取得.
         
+        デバイスの追加時のみ再構築し、それ以外はキャッシュしたJSON文字列を返します。
+        
         Returns:
             str: すべてのデバイスの記述子を含むJSON文字列
         """
-        descriptors = [thing.get_descriptor_json() for thing in self.things]
-        return json.dumps(descriptors)
+        if self._descriptors_json_cache is None:
+            self._descriptors_json_cache = _encode(
+                [thing.get_descriptor_json() for thing in self.things]
+            )
+        return self._descriptors_json_cache
 
     def get_states_json(self, delta=False) -> Tuple[bool, str]:
         """すべてのデバイスの状態JSONを取得.
@@ -67,28 +80,24 @@ class ThingManager:
 
         changed = False
         states = []
+        last_states = self.last_states
 
         for thing in self.things:
-            state_json = thing.get_state_json()
+            # 各デバイスの状態は一度だけJSON文字列化し、比較と出力の両方に使う
+            state_json = _encode(thing.get_state_json())
 
             if delta:
-                # 状態が変化したかチェック
-                is_same = (
-                    thing.name in self.last_states
-                    and self.last_states[thing.name] == state_json
-                )
-                if is_same:
+                # 状態が変化したかチェック（文字列を保持せずハッシュ値同士で比較）
+                state_hash = hash(state_json)
+                if last_states.get(thing.name) == state_hash:
                     continue
                 changed = True
-                self.last_states[thing.name] = state_json
+                last_states[thing.name] = state_hash
 
-            # state_jsonが既に辞書オブジェクトかチェック
-            if isinstance(state_json, dict):
-                states.append(state_json)
-            else:
-                states.append(json.loads(state_json))  # JSON文字列を辞書に変換
+            states.append(state_json)
 
-        return changed, json.dumps(states)
+        # json.dumps(list)と同じ区切り文字で連結し、全体の再エンコードを避ける
+        return changed, "[" + ", ".join(states) + "]"
 
     def get_states_json_str(self) -> str:
         """旧コードとの互換性のため、元のメソッド名と戻り値の型を保持."""
@@ -108,10 +117,10 @@ class ThingManager:
             ValueError: 指定されたデバイスが存在しない場合
         """
         thing_name = command.get("name")
-        for thing in self.things:
-            if thing.name == thing_name:
-                return thing.invoke(command)
+        thing = self._things_by_name.get(thing_name)
+        if thing is None:
+            # エラーログを記録
+            logging.error(f"デバイスが存在しません: {thing_name}")
+            raise ValueError(f"デバイスが存在しません: {thing_name}")
 
-        # エラーログを記録
-        logging.error(f"デバイスが存在しません: {thing_name}")
-        raise ValueError(f"デバイスが存在しません: {thing_name}")
+        return thing.invoke(command)
@@ -1,9 +1,13 @@
 import asyncio
 import base64
+import hashlib
 import logging
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
+import numpy as np
 
 from src.application import Application
 from src.constants.constants import DeviceState
@@ -12,6 +16,93 @@ from src.iot.things.CameraVL import VL
 
 logger = logging.getLogger("Camera")
 
+# simplejpeg（libjpeg-turboの薄いラッパー）があればJPEGエンコードに使用（任意依存）
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+# JPEG品質の既定値（CAMERA.jpeg_quality未設定時）
+_JPEG_QUALITY = 75
+
+
+def _imencode_params(quality):
+    """cv2.imencodeのJPEGパラメータ."""
+    return [int(cv2.IMWRITE_JPEG_QUALITY), quality, int(cv2.IMWRITE_JPEG_OPTIMIZE), 0]
+
+
+def _encode_jpeg(frame, quality=_JPEG_QUALITY):
+    """BGRフレームをJPEGバイト列にエンコード."""
+    if simplejpeg is not None:
+        # libjpeg-turboがBGRを直接扱うためRGBへの変換コピーは不要
+        return simplejpeg.encode_jpeg(
+            np.ascontiguousarray(frame), quality=quality, colorspace="BGR"
+        )
+    _, buffer = cv2.imencode(".jpg", frame, _imencode_params(quality))
+    return buffer
+
+
+def _encode_jpeg_opencl(frame, quality=_JPEG_QUALITY):
+    """BGRフレームをcv2.UMat（OpenCL T-API）経由でJPEGバイト列にエンコード."""
+    _, buffer = cv2.imencode(".jpg", cv2.UMat(frame), _imencode_params(quality))
+    return buffer
+
+
+def _opencl_jpeg_faster(width, height, quality, rounds=5):
+    """OpenCLを有効にし、UMat経由のエンコードがCPUより速いか計測して判定.
+
+    遅い場合（一部のMesa環境など）はOpenCLを無効に戻してFalseを返す。
+    """
+    if not cv2.ocl.haveOpenCL():
+        return False
+    cv2.ocl.setUseOpenCL(True)
+    frame = np.random.randint(0, 256, (height, width, 3), dtype=np.uint8)
+    params = _imencode_params(quality)
+
+    def measure(make_src):
+        cv2.imencode(".jpg", make_src(), params)  # ウォームアップ（カーネルのビルド等）
+        start = time.perf_counter()
+        for _ in range(rounds):
+            cv2.imencode(".jpg", make_src(), params)
+        return time.perf_counter() - start
+
+    cpu_time = measure(lambda: frame)
+    opencl_time = measure(lambda: cv2.UMat(frame))
+    logger.info(
+        f"JPEGエンコード計測: CPU {cpu_time / rounds * 1000:.1f}ms, "
+        f"OpenCL {opencl_time / rounds * 1000:.1f}ms"
+    )
+    if opencl_time >= cpu_time:
+        cv2.ocl.setUseOpenCL(False)
+        return False
+    return True
+
+
+def _cuda_jpeg_available():
+    """torchvisionのGPU JPEGエンコード（NVJPEG）が使えるか判定（任意依存）."""
+    try:
+        import torch
+        import torchvision.io  # noqa: F401
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+
+def _encode_jpeg_cuda(frame, quality=_JPEG_QUALITY):
+    """BGRフレームをGPU（NVJPEG）でJPEGバイト列にエンコード."""
+    import torch
+    from torchvision.io import encode_jpeg
+
+    # HWC(BGR) -> CHW(RGB) の並べ替えは転送後にGPU上で行う
+    tensor = torch.from_numpy(frame).to("cuda").permute(2, 0, 1).flip(0).contiguous()
+    return encode_jpeg(tensor, quality=quality).cpu().numpy().tobytes()
+
+
+def _log_report_error(future):
+    """認識結果の送信（ウェイクワード）の失敗をログに記録."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"認識結果の送信に失敗しました: {future.exception()}")
+
 
 class Camera(Thing):
     def __init__(self):
@@ -25,15 +116,45 @@ class Camera(Thing):
         self.cap = None
         self.is_running = False
         self.camera_thread = None
+        self._stop_event = threading.Event()  # stop_cameraでカメラループを終了させる
+        # カメラループが読み取った最新フレーム（認識時に再度cap.read()しない）
+        self._frame_lock = threading.Lock()
+        self._latest_frame = None
         self.result = ""
         from src.utils.config_manager import ConfigManager
 
         self.config = ConfigManager.get_instance()
+        # プレビューウィンドウ（ヘッドレス環境では不要なimshow/waitKeyを省く）
+        self.show_preview = self.config.get_config("CAMERA.show_preview", False)
+        self.jpeg_quality = int(
+            self.config.get_config("CAMERA.jpeg_quality", _JPEG_QUALITY)
+        )
+        # GPU JPEGエンコードは設定で有効にし、CUDAが使える場合のみ使用
+        self.use_cuda_jpeg = bool(
+            self.config.get_config("CAMERA.use_cuda_jpeg", False)
+        ) and _cuda_jpeg_available()
+        # OpenCLは設定で有効にし、起動時の計測でCPUより速い場合のみ使用
+        self.use_opencl = (
+            not self.use_cuda_jpeg
+            and bool(self.config.get_config("CAMERA.use_opencl", False))
+            and _opencl_jpeg_faster(
+                self.config.get_config("CAMERA.frame_width"),
+                self.config.get_config("CAMERA.frame_height"),
+                self.jpeg_quality,
+            )
+        )
         # カメラコントローラー
+        batch_size = self.config.get_config("CAMERA.batch_size", 1)
         VL.ImageAnalyzer.get_instance().init(
             self.config.get_config("CAMERA.VLapi_key"),
             self.config.get_config("CAMERA.Loacl_VL_url"),
             self.config.get_config("CAMERA.models"),
+            batch_size=batch_size,
+            batch_timeout_ms=self.config.get_config("CAMERA.batch_timeout_ms", 50),
+        )
+        # 画面認識はイベントループ外のワーカーで実行（batch_size件まで同時に処理しVL側でまとめる）
+        self._capture_executor = ThreadPoolExecutor(
+            max_workers=max(1, batch_size), thread_name_prefix="camera-vl"
         )
         self.VL = VL.ImageAnalyzer.get_instance()
 
@@ -56,13 +177,21 @@ class Camera(Thing):
             "capture_frame_to_base64",
             "画面を認識",
             [],
-            lambda params: self.capture_frame_to_base64(),
+            lambda params: self.request_capture(),
         )
 
+    def _app(self):
+        """アプリケーションインスタンスを取得（取得済みならそれを再利用）."""
+        if self.app is None:
+            self.app = Application.get_instance()
+        return self.app
+
     def _camera_loop(self):
         """カメラスレッドのメインループ."""
         camera_index = self.config.get_config("CAMERA.camera_index")
         self.cap = cv2.VideoCapture(camera_index)
+        # ドライバ側のバッファを1枚にして、認識に古いフレームが使われないようにする
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         if not self.cap.isOpened():
             logger.error("カメラを開けません")
@@ -78,22 +207,38 @@ class Camera(Thing):
         self.cap.set(cv2.CAP_PROP_FPS, self.config.get_config("CAMERA.fps"))
 
         self.is_running = True
-        while self.is_running:
+        stop_event = self._stop_event
+        show_preview = self.show_preview
+        # 間引くフレームはgrab()のみでデコード（YUV->BGR変換）を省く
+        skip = max(1, int(self.config.get_config("CAMERA.frame_skip", 1))) - 1
+        # cap.read()はフレームレートに合わせてブロックするため、プレビューなしでも待機は不要
+        while not stop_event.is_set():
+            for _ in range(skip):
+                self.cap.grab()
             ret, frame = self.cap.read()
             if not ret:
                 logger.error("画面を読み取れません")
                 break
 
-            # 画面を表示
-            cv2.imshow("Camera", frame)
+            # 参照を差し替えるだけ（cap.read()は毎回新しい配列を返すためコピー不要）
+            with self._frame_lock:
+                self._latest_frame = frame
+
+            if show_preview:
+                # 画面を表示
+                cv2.imshow("Camera", frame)
 
-            # 'q'キーを押して終了
-            if cv2.waitKey(1) & 0xFF == ord("q"):
-                self.is_running = False
+                # 'q'キーを押して終了
+                if cv2.waitKey(1) & 0xFF == ord("q"):
+                    break
 
+        self.is_running = False
+        with self._frame_lock:
+            self._latest_frame = None
         # カメラを解放してウィンドウを閉じる
         self.cap.release()
-        cv2.destroyAllWindows()
+        if show_preview:
+            cv2.destroyAllWindows()
 
     def start_camera(self):
         """カメラスレッドを開始."""
@@ -101,38 +246,95 @@ class Camera(Thing):
             logger.warning("カメラスレッドは既に実行中です")
             return
 
+        self._stop_event.clear()
         self.camera_thread = threading.Thread(target=self._camera_loop, daemon=True)
         self.camera_thread.start()
         logger.info("カメラスレッドが開始されました")
         return {"status": "success", "message": "カメラスレッドが開かれました"}
 
-    def capture_frame_to_base64(self):
-        """現在の画面をキャプチャしてBase64エンコードに変換."""
+    def request_capture(self):
+        """画面認識をワーカースレッドで開始（IoTコマンドを処理するイベントループを止めない）.
+
+        認識結果はresultプロパティに反映し、完了時にウェイクワードで報告する。
+        """
         if not self.cap or not self.cap.isOpened():
             logger.error("カメラが開いていません")
             return None
+        self._capture_executor.submit(self.capture_frame_to_base64)
+        return {"status": "success", "message": "認識を開始しました"}
 
-        ret, frame = self.cap.read()
-        if not ret:
-            logger.error("画面を読み取れません")
+    def capture_frame_to_base64(self):
+        """現在の画面をキャプチャしてBase64エンコードに変換（ワーカースレッドで実行）.
+
+        ワーカースレッドの例外は呼び出し元に届かないため、失敗時もここでログを出し、
+        エラー内容をresultに設定して成功時と同じく報告する。
+        """
+        if not self.cap or not self.cap.isOpened():
+            logger.error("カメラが開いていません")
             return None
 
-        # フレームをJPEG形式に変換
-        _, buffer = cv2.imencode(".jpg", frame)
+        try:
+            # カメラループが読み取った最新フレームを使用
+            with self._frame_lock:
+                frame = self._latest_frame
+            if frame is None:
+                raise RuntimeError("画面を読み取れません")
+
+            # 生フレームのハッシュ（同じ画面の再認識はVL側のキャッシュで応答）
+            image_key = hashlib.blake2b(
+                np.ascontiguousarray(frame), digest_size=16
+            ).digest()
 
-        # JPEG画像をBase64エンコードに変換
-        frame_base64 = base64.b64encode(buffer).decode("utf-8")
-        self.result = str(self.VL.analyze_image(frame_base64))
-        # アプリケーションインスタンスを取得
-        self.app = Application.get_instance()
-        logger.info("画面が認識されました")
-        self.app.set_device_state(DeviceState.LISTENING)
-        asyncio.create_task(self.app.protocol.send_wake_word_detected("認識結果を報告"))
-        return {"status": "success", "message": "認識成功", "result": self.result}
+            if self.config.get_config("CAMERA.use_raw_ppm", False):
+                # JPEGエンコードを省き、ヘッダー付きの無圧縮RGB（PPM）をそのまま送る
+                height, width = frame.shape[:2]
+                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                buffer = b"P6\n%d %d\n255\n" % (width, height) + rgb.tobytes()
+                mime_type = "image/x-portable-pixmap"
+            else:
+                # フレームをJPEG形式に変換
+                if self.use_cuda_jpeg:
+                    encode = _encode_jpeg_cuda
+                elif self.use_opencl:
+                    encode = _encode_jpeg_opencl
+                else:
+                    encode = _encode_jpeg
+                buffer = encode(frame, self.jpeg_quality)
+                mime_type = "image/jpeg"
+
+            # 画像をBase64エンコードに変換（文字列への変換はVL側でdata URL作成時に一度だけ行う）
+            frame_base64 = base64.b64encode(buffer)
+            self.result = str(
+                self.VL.analyze_image(
+                    frame_base64, mime_type=mime_type, image_key=image_key
+                )
+            )
+            logger.info("画面が認識されました")
+            response = {"status": "success", "message": "認識成功", "result": self.result}
+        except Exception as e:
+            logger.error(f"画面認識に失敗しました: {e}", exc_info=True)
+            self.result = f"画面認識に失敗しました: {e}"
+            response = {"status": "error", "message": self.result}
+
+        self._report_result()
+        return response
+
+    def _report_result(self):
+        """認識結果（またはエラー）をウェイクワードでサーバーに報告."""
+        try:
+            app = self._app()
+            # ワーカースレッドから呼ばれるため、状態変更と送信はアプリのループに順番に投入する
+            app.loop.call_soon_threadsafe(app.set_device_state, DeviceState.LISTENING)
+            future = asyncio.run_coroutine_threadsafe(
+                app.protocol.send_wake_word_detected("認識結果を報告"), app.loop
+            )
+            future.add_done_callback(_log_report_error)
+        except Exception as e:
+            logger.error(f"認識結果の報告に失敗しました: {e}", exc_info=True)
 
     def stop_camera(self):
         """カメラスレッドを停止."""
-        self.is_running = False
+        self._stop_event.set()
         if self.camera_thread is not None:
             self.camera_thread.join()  # スレッド終了を待機
             self.camera_thread = None
@@ -1,7 +1,27 @@
+import collections
+import queue
+import re
 import threading
+import time
+from concurrent.futures import Future
 
+import httpx
 from openai import OpenAI
 
+# h2パッケージがあればHTTP/2で接続（任意依存、なければHTTP/1.1のkeep-alive）
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# 認識結果キャッシュの最大件数
+_CACHE_MAX = 256
+
+# バッチ回答の画像ごとの見出し
+_BATCH_HEADING = re.compile(r"\[画像(\d+)\]")
+
 
 class ImageAnalyzer:
     _instance = None
@@ -9,38 +29,162 @@ class ImageAnalyzer:
     client = None
 
     def __init__(self):
+        # 二重初期化で状態（キャッシュ・バッチスレッド）を失わないようにする
+        if getattr(self, "_inited", False):
+            return
+        self._inited = True
         self.model = None
-
-    def __new__(cls):
-        """シングルトンパターンを保証する."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        # マイクロバッチ（batch_sizeが1の場合は従来どおり1枚ずつ直接呼び出す）
+        self.batch_size = 1
+        self.batch_timeout = 0.05
+        self._queue = None
+        self._worker = None
+        # 同一画像の認識結果キャッシュ（(画像キー, プロンプト) -> 結果、LRU）
+        self._cache = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def init(
         self,
         api_key,
         base_url="https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions",
         models="qwen-omni-turbo",
+        batch_size=1,
+        batch_timeout_ms=50,
     ):
+        if self.client is not None:
+            self.client.close()
+        # 認識リクエスト間でTCP/TLS接続を使い回す永続クライアント
         self.client = OpenAI(
             api_key=api_key,
             base_url=base_url,
+            http_client=httpx.Client(
+                http2=_HTTP2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=4, keepalive_expiry=60.0
+                ),
+                timeout=httpx.Timeout(30.0, connect=5.0),
+            ),
         )
         self.models = models
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout_ms / 1000
 
     @classmethod
     def get_instance(cls):
         """カメラマネージャーインスタンスを取得（スレッドセーフ）"""
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = cls()
+        # 生成済みならロックを取らずに返す（二重チェック）
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
     def analyze_image(
-        self, base64_image, prompt="画像に描かれているのはどのような光景ですか、ユーザーが目の不自由な方である可能性があるため詳細に説明してください"
+        self,
+        base64_image,
+        prompt="画像に描かれているのはどのような光景ですか、ユーザーが目の不自由な方である可能性があるため詳細に説明してください",
+        mime_type="image/jpeg",
+        image_key=None,
     ) -> str:
-        """画像を分析して結果を返す."""
+        """画像を分析して結果を返す.
+
+        batch_sizeが2以上の場合、同時に届いたリクエストをまとめて1回のAPI呼び出しで処理する。
+
+        Args:
+            base64_image: Base64エンコードされた画像データ（strまたはbytes）
+            prompt: 分析の指示
+            mime_type: 画像データのMIMEタイプ
+            image_key: 元画像のハッシュ値。指定時は同じ画像とプロンプトの結果を再利用する
+        """
+        if image_key is not None:
+            cache_key = (image_key, prompt)
+            with self._cache_lock:
+                result = self._cache.get(cache_key)
+                if result is not None:
+                    self._cache.move_to_end(cache_key)
+                    return result
+
+        if self.batch_size <= 1:
+            result = self._complete([(base64_image, mime_type)], prompt)
+        else:
+            future = Future()
+            self._ensure_batch_worker()
+            self._queue.put((base64_image, mime_type, prompt, future))
+            result = future.result()
+
+        if image_key is not None:
+            with self._cache_lock:
+                self._cache[cache_key] = result
+                if len(self._cache) > _CACHE_MAX:
+                    self._cache.popitem(last=False)
+        return result
+
+    def _ensure_batch_worker(self):
+        """バッチ処理スレッドを必要時に起動."""
+        with self._lock:
+            if self._worker is None:
+                self._queue = queue.Queue()
+                self._worker = threading.Thread(
+                    target=self._batch_loop, name="vl-batch", daemon=True
+                )
+                self._worker.start()
+
+    def _batch_loop(self):
+        """最大batch_size件、またはbatch_timeout秒までリクエストを集めて処理."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_timeout
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # 同じプロンプトのリクエストだけを1回の呼び出しにまとめる
+            groups = {}
+            for item in batch:
+                groups.setdefault(item[2], []).append(item)
+            for prompt, items in groups.items():
+                self._run_batch(prompt, items)
+
+    def _run_batch(self, prompt, items):
+        """まとめたリクエストを処理し、各Futureに結果を設定."""
+        try:
+            images = [(image, mime_type) for image, mime_type, _, _ in items]
+            if len(images) == 1:
+                results = [self._complete(images, prompt)]
+            else:
+                text = self._complete(
+                    images,
+                    f"{prompt}\n{len(images)}枚の画像について、それぞれ"
+                    "「[画像1]」「[画像2]」のように番号の見出しを付けて順番に回答してください。",
+                )
+                results = _split_batch_result(text, len(images))
+                if results is None:
+                    # 回答を画像ごとに分けられない場合は1枚ずつ問い合わせる
+                    results = [self._complete([image], prompt) for image in images]
+            for (_, _, _, future), result in zip(items, results):
+                future.set_result(result)
+        except Exception as e:
+            for _, _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+
+    def _complete(self, images, prompt) -> str:
+        """画像（複数可）とプロンプトでVLモデルに問い合わせ、回答テキストを返す."""
+        content = [
+            {
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:{mime_type};base64,{_as_text(base64_image)}"
+                },
+            }
+            for base64_image, mime_type in images
+        ]
+        content.append({"type": "text", "text": prompt})
         completion = self.client.chat.completions.create(
             model=self.models,
             messages=[
@@ -50,25 +194,38 @@ class ImageAnalyzer:
                 },
                 {
                     "role": "user",
-                    "content": [
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{base64_image}"
-                            },
-                        },
-                        {"type": "text", "text": prompt},
-                    ],
+                    "content": content,
                 },
             ],
             modalities=["text"],
             stream=True,
             stream_options={"include_usage": True},
         )
-        mesag = ""
+        # 断片はリストに集めて最後に一度だけ連結（contentがNoneの断片は読み飛ばす）
+        parts = []
         for chunk in completion:
-            if chunk.choices:
-                mesag += chunk.choices[0].delta.content
-            else:
-                pass
-        return mesag
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if content:
+                parts.append(content)
+        return "".join(parts)
+
+
+def _as_text(base64_image):
+    """Base64データをdata URL用の文字列に変換（bytesの場合のみデコード）."""
+    if isinstance(base64_image, bytes):
+        return base64_image.decode("ascii")
+    return base64_image
+
+
+def _split_batch_result(text, count):
+    """「[画像N]」見出しで区切られた回答を画像ごとに分割（分割できなければNone）."""
+    parts = _BATCH_HEADING.split(text)
+    # split結果: [前置き, 番号1, 本文1, 番号2, 本文2, ...]
+    answers = {}
+    for number, body in zip(parts[1::2], parts[2::2]):
+        answers[int(number)] = body.strip()
+    if sorted(answers) != list(range(1, count + 1)):
+        return None
+    return [answers[i] for i in range(1, count + 1)]
@@ -78,18 +78,12 @@ class CountdownTimer(Thing):
             # 同上
 
     def _start_countdown(self, params_dict):
-        """处理 StartCountdown 方法调用。注意: params 现在是 Parameter 对象的字典."""
-        # Parameterオブジェクト辞書から値を取得
-        command_param = params_dict.get("command")
-        delay_param = params_dict.get("delay")
-
-        command_str = command_param.get_value() if command_param else None
+        """处理 StartCountdown 方法调用。注意: params 是参数名到值的字典."""
+        command_str = params_dict.get("command")
         # オプションパラメータdelayを処理
-        delay = (
-            delay_param.get_value()
-            if delay_param and delay_param.get_value() is not None
-            else self.DEFAULT_DELAY
-        )
+        delay = params_dict.get("delay")
+        if delay is None:
+            delay = self.DEFAULT_DELAY
 
         if not command_str:
             logger.error("启动倒计时失败：缺少 'command' 参数值。")
@@ -139,9 +133,8 @@ class CountdownTimer(Thing):
         }
 
     def _cancel_countdown(self, params_dict):
-        """处理 CancelCountdown 方法调用。注意: params 现在是 Parameter 对象的字典."""
-        timer_id_param = params_dict.get("timer_id")
-        timer_id = timer_id_param.get_value() if timer_id_param else None
+        """处理 CancelCountdown 方法调用。注意: params 是参数名到值的字典."""
+        timer_id = params_dict.get("timer_id")
 
         if timer_id is None:
             logger.error("取消倒计时失败：缺少 'timer_id' 参数值。")
@@ -166,7 +166,7 @@ class HomeAssistantLight(HomeAssistantDevice):
             "SetBrightness",
             "设置灯的亮度",
             [Parameter("brightness", "亮度值 (0-100)", ValueType.NUMBER, True)],
-            lambda params: self._set_brightness(params["brightness"].get_value()),
+            lambda params: self._set_brightness(params["brightness"]),
         )
 
         # 初始化时更新状态
@@ -278,7 +278,7 @@ class HomeAssistantNumber(HomeAssistantDevice):
             "SetValue",
             "设置数值",
             [Parameter("value", "设置值", ValueType.NUMBER, True)],
-            lambda params: self._set_value(params["value"].get_value()),
+            lambda params: self._set_value(params["value"]),
         )
 
         try:
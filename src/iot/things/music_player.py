@@ -125,14 +125,14 @@ class MusicPlayer(Thing):
             "SearchPlay",
             "搜索并播放指定歌曲",
             [Parameter("song_name", "输入歌曲名称", ValueType.STRING, True)],
-            lambda params: self.search_play(params["song_name"].get_value()),
+            lambda params: self.search_play(params["song_name"]),
         )
 
         self.add_method(
             "SearchSong",
             "仅搜索歌曲不播放",
             [Parameter("song_name", "输入歌曲名称", ValueType.STRING, True)],
-            lambda params: self._search_song(params["song_name"].get_value()),
+            lambda params: self._search_song(params["song_name"]),
         )
 
         self.add_method(
@@ -149,7 +149,7 @@ class MusicPlayer(Thing):
             "Seek",
             "跳转到指定位置",
             [Parameter("position_seconds", "跳转位置（秒）", ValueType.NUMBER, True)],
-            lambda params: self.seek(params["position_seconds"].get_value()),
+            lambda params: self.seek(params["position_seconds"]),
         )
 
         self.add_method(
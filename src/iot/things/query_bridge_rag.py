@@ -31,7 +31,7 @@ class QueryBridgeRAG(Thing):
             "Query",
             "情報をクエリ",
             [Parameter("query", "クエリ内容", ValueType.STRING, True)],
-            lambda params: self._query_info_and_store(params["query"].get_value()),
+            lambda params: self._query_info_and_store(params["query"]),
         )
 
         # クエリ結果を取得
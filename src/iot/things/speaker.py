@@ -5,11 +5,11 @@ from src.iot.thing import Parameter, Thing, ValueType
 class Speaker(Thing):
     def __init__(self):
         super().__init__("Speaker", "現在のAIロボットのスピーカー")
+        self.app = None  # アプリケーションインスタンス（_app()で初回のみ取得）
 
         # 現在のディスプレイインスタンスの音量を初期値として取得
         try:
-            app = Application.get_instance()
-            self.volume = app.display.current_volume
+            self.volume = self._app().display.current_volume
         except Exception:
             # 取得に失敗した場合、デフォルト値を使用
             self.volume = 100  # デフォルト音量
@@ -22,15 +22,20 @@ class Speaker(Thing):
             "SetVolume",
             "音量を設定",
             [Parameter("volume", "0から100の間の整数", ValueType.NUMBER, True)],
-            lambda params: self._set_volume(params["volume"].get_value()),
+            lambda params: self._set_volume(params["volume"]),
         )
 
+    def _app(self):
+        """アプリケーションインスタンスを取得（取得済みならそれを再利用）."""
+        if self.app is None:
+            self.app = Application.get_instance()
+        return self.app
+
     def _set_volume(self, volume):
         if 0 <= volume <= 100:
             self.volume = volume
             try:
-                app = Application.get_instance()
-                app.display.update_volume(volume)
+                self._app().display.update_volume(volume)
                 return {"success": True, "message": f"音量を{volume}に設定しました"}
             except Exception as e:
                 print(f"音量設定失敗: {e}")
@@ -1,7 +1,9 @@
 import asyncio
+import collections
 import json
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from src.application import Application
@@ -9,6 +11,39 @@ from src.constants.constants import DeviceState
 from src.iot.thing import Thing
 from src.network.mqtt_client import MqttClient
 
+# ciso8601があればISO 8601文字列の解析に使用（任意依存）
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+
+    def _parse_iso(timestamp):
+        """ISO形式の時間文字列を解析（Python 3.11未満の"Z"表記にも対応）."""
+        if timestamp.endswith("Z"):
+            timestamp = timestamp[:-1] + "+00:00"
+        return datetime.fromisoformat(timestamp)
+
+
+# 未処理のMQTTメッセージの最大保持数（超えた場合は古いものから破棄）
+_MESSAGE_QUEUE_MAX = 1024
+
+# データ要求コマンド（json.dumpsと同じ出力、タイムスタンプのみ差し込む）
+_GET_DATA_FMT = b'{"command": "get_data", "action": "get_data", "timestamp": %d}'
+
+
+def _parse_timestamp(timestamp):
+    """センサーのタイムスタンプ（ISO文字列/数値/None）をUNIX時刻の整数に変換."""
+    if timestamp is None:
+        # タイムスタンプが提供されていない場合、現在時刻を使用
+        return int(time.time())
+    if isinstance(timestamp, str):
+        try:
+            return int(_parse_iso(timestamp).timestamp())
+        except ValueError:
+            # 解析に失敗した場合、現在時刻を使用
+            return int(time.time())
+    # 数値の場合、直接使用
+    return int(timestamp)
+
 
 class TemperatureSensor(Thing):
     def __init__(self):
@@ -19,6 +54,19 @@ class TemperatureSensor(Thing):
         self.is_running = False
         self.mqtt_client = None
         self.app = None  # app属性をNoneで初期化
+        # ウェイクワード送信用のワーカー（イベントごとのスレッド生成を避ける）
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tempsensor"
+        )
+
+        # MQTTネットワークスレッドは受信メッセージを積むだけにし、解析は専用スレッドで行う
+        self._messages = collections.deque(maxlen=_MESSAGE_QUEUE_MAX)
+        self._message_event = threading.Event()
+        self._dropped_messages = 0  # キュー溢れで破棄したメッセージ数
+        self._queue_high_water = 0  # キューに溜まった最大件数
+        threading.Thread(
+            target=self._process_messages, name="tempsensor-mqtt", daemon=True
+        ).start()
 
         print("[IoTデバイス] 温度センサー受信端の初期化が完了しました")
 
@@ -64,10 +112,38 @@ class TemperatureSensor(Thing):
             print(f"[温度センサー] MQTT接続に失敗しました: {e}")
 
     def _on_mqtt_message(self, client, userdata, msg):
+        """MQTTメッセージを受信（MQTTネットワークスレッド、キューに積むだけ）."""
+        messages = self._messages
+        if len(messages) == _MESSAGE_QUEUE_MAX:
+            self._dropped_messages += 1  # appendで最も古いメッセージが押し出される
+        messages.append((msg.topic, msg.payload))
+        self._message_event.set()
+
+    def _process_messages(self):
+        """キューに積まれたMQTTメッセージを順番に処理（専用スレッド）."""
+        messages = self._messages
+        reported_drops = 0
+        while True:
+            self._message_event.wait()
+            self._message_event.clear()
+
+            # キュー深さの最大値と破棄数が増えた場合のみ出力
+            depth = len(messages)
+            if depth > self._queue_high_water:
+                self._queue_high_water = depth
+                print(f"[温度センサー] 未処理メッセージの最大件数: {depth}")
+            if self._dropped_messages > reported_drops:
+                reported_drops = self._dropped_messages
+                print(f"[温度センサー] キュー溢れで破棄したメッセージ数: {reported_drops}")
+
+            while messages:
+                topic, payload = messages.popleft()
+                self._handle_mqtt_message(topic, payload)
+
+    def _handle_mqtt_message(self, topic, payload):
         """MQTTメッセージを処理."""
         try:
-            topic = msg.topic
-            payload = msg.payload.decode("utf-8")
+            payload = payload.decode("utf-8")
             print(f"[温度センサー] データを受信 - トピック: {topic}, 内容: {payload}")
 
             # メッセージをJSONとして解析を試行
@@ -81,25 +157,7 @@ class TemperatureSensor(Thing):
                     self.humidity = data.get("humidity")
 
                     # タイムスタンプを処理 - 複数の形式をサポート
-                    timestamp = data.get("timestamp")
-                    if timestamp is not None:
-                        # 文字列形式の場合（ISO時間）
-                        if isinstance(timestamp, str):
-                            try:
-                                # ISO形式の時間文字列の解析を試行
-                                dt = datetime.fromisoformat(
-                                    timestamp.replace("Z", "+00:00")
-                                )
-                                self.last_update_time = int(dt.timestamp())
-                            except ValueError:
-                                # 解析に失敗した場合、現在時刻を使用
-                                self.last_update_time = int(time.time())
-                        else:
-                            # 数値の場合、直接使用
-                            self.last_update_time = int(timestamp)
-                    else:
-                        # タイムスタンプが提供されていない場合、現在時刻を使用
-                        self.last_update_time = int(time.time())
+                    self.last_update_time = _parse_timestamp(data.get("timestamp"))
 
                     # 更新情報を出力
                     update_time = time.strftime(
@@ -118,17 +176,20 @@ class TemperatureSensor(Thing):
         except Exception as e:
             print(f"[温度センサー] MQTTメッセージ処理中にエラーが発生しました: {e}")
 
+    def _app(self):
+        """アプリケーションインスタンスを取得（取得済みならそれを再利用）."""
+        if self.app is None:
+            self.app = Application.get_instance()
+        return self.app
+
     def handle_temperature_update(self):
         """温度更新後の操作を処理."""
         try:
-            if self.app is None:
-                self.app = Application.get_instance()
-
             # デバイス状態をIDLEに設定してIoT状態を更新
-            self.app.set_device_state(DeviceState.IDLE)
+            self._app().set_device_state(DeviceState.IDLE)
 
-            # スレッドを使用して非同期操作を処理、MQTTスレッドのブロッキングを回避
-            threading.Thread(target=self._delayed_send_wake_word, daemon=True).start()
+            # ワーカースレッドで非同期操作を処理、メッセージ処理スレッドのブロッキングを回避
+            self._executor.submit(self._delayed_send_wake_word)
 
         except Exception as e:
             print(f"[温度センサー] 温度更新処理中にエラーが発生しました: {e}")
@@ -175,18 +236,19 @@ class TemperatureSensor(Thing):
     def _request_sensor_data(self):
         """すべてのセンサーに現在の状態の報告を要求."""
         if self.mqtt_client:
-            # 2つのコマンド形式に対応
-            command = {
-                "command": "get_data",
-                "action": "get_data",  # actionフィールドのサポートを追加
-                "timestamp": int(time.time()),
-            }
-            self.mqtt_client.publish(json.dumps(command))
+            # 2つのコマンド形式（command/action）に対応
+            self.mqtt_client.publish(_GET_DATA_FMT % int(time.time()))
             print("[温度センサー] データ要求コマンドを送信しました")
 
     def send_command(self, action_name, **kwargs):
         """センサーにコマンドを送信."""
         if self.mqtt_client:
+            if action_name == "get_data" and not kwargs:
+                # よく使うデータ要求はテンプレートから生成
+                self.mqtt_client.publish(_GET_DATA_FMT % int(time.time()))
+                print(f"[温度センサー] コマンドを送信しました: {action_name}")
+                return True
+
             command = {
                 "command": action_name,
                 "action": action_name,
@@ -214,6 +276,7 @@ class TemperatureSensor(Thing):
                 self.mqtt_client.stop()
             except Exception:
                 pass
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 # テストコード
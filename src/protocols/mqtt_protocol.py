@@ -435,16 +435,19 @@ class MqttProtocol(Protocol):
     async def close_audio_channel(self):
         """关闭音频通道."""
         try:
-            # 如果有会话ID，发送goodbye消息
+            # 如果有会话ID，发送goodbye消息（经发送队列，排在已排队的消息之后）
             if self.session_id:
                 goodbye_msg = {"type": "goodbye", "session_id": self.session_id}
-                await self.send_text(json.dumps(goodbye_msg))
+                await self._send_ordered(json.dumps(goodbye_msg))
+            # 停止发送任务
+            self._stop_writer()
 
             # 处理goodbye
             await self._handle_goodbye()
 
         except Exception as e:
             logger.error(f"关闭音频通道时出错: {e}")
+            self._stop_writer()
             # 确保即使出错也调用回调
             if self.on_audio_channel_closed:
                 await self.on_audio_channel_closed()
@@ -6,9 +6,26 @@
 音声通信とメッセージ通信の統一したインターフェースを提供し、
 具体的な実装は各サブクラスで行います。
 """
+import asyncio
 import json
 
 from src.constants.constants import AbortReason, ListeningMode
+from src.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# 送信待ちキューの上限（超えた分は破棄）
+_OUTBOX_MAX = 256
+
+# メッセージのJSONエンコーダー（json.dumpsと同じ出力、呼び出しごとの生成を避ける）
+_encode = json.JSONEncoder().encode
+
+# 音声認識モード -> プロトコル上のモード名
+_LISTENING_MODE_NAMES = {
+    ListeningMode.ALWAYS_ON: "realtime",
+    ListeningMode.AUTO_STOP: "auto",
+    ListeningMode.MANUAL: "manual",
+}
 
 
 class Protocol:
@@ -37,6 +54,9 @@ class Protocol:
         self.on_audio_channel_opened = None
         self.on_audio_channel_closed = None
         self.on_network_error = None
+        # テキストメッセージの送信キューと送信タスク（積んだ順にサーバーへ届ける）
+        self._outbox = None
+        self._writer_task = None
 
     def on_incoming_json(self, callback):
         """JSONメッセージ受信時のコールバック関数を設定します。
@@ -104,7 +124,7 @@ class Protocol:
         message = {"session_id": self.session_id, "type": "abort"}
         if reason == AbortReason.WAKE_WORD_DETECTED:
             message["reason"] = "wake_word_detected"
-        await self.send_text(json.dumps(message))
+        await self._send_ordered(_encode(message))
 
     async def send_wake_word_detected(self, wake_word):
         """唤醒词検出メッセージを送信します。
@@ -122,7 +142,7 @@ class Protocol:
             "state": "detect",
             "text": wake_word,
         }
-        await self.send_text(json.dumps(message))
+        await self._send_ordered(_encode(message))
 
     async def send_start_listening(self, mode):
         """音声認識開始メッセージを送信します。
@@ -136,18 +156,13 @@ class Protocol:
         Args:
             mode (ListeningMode): 音声認識のモード
         """
-        mode_map = {
-            ListeningMode.ALWAYS_ON: "realtime",
-            ListeningMode.AUTO_STOP: "auto",
-            ListeningMode.MANUAL: "manual",
-        }
         message = {
             "session_id": self.session_id,
             "type": "listen",
             "state": "start",
-            "mode": mode_map[mode],
+            "mode": _LISTENING_MODE_NAMES[mode],
         }
-        await self.send_text(json.dumps(message))
+        await self._send_ordered(_encode(message))
 
     async def send_stop_listening(self):
         """音声認識停止メッセージを送信します。
@@ -157,7 +172,7 @@ class Protocol:
         停止する必要がある場合に使用されます。
         """
         message = {"session_id": self.session_id, "type": "listen", "state": "stop"}
-        await self.send_text(json.dumps(message))
+        await self._send_ordered(_encode(message))
 
     async def send_iot_descriptors(self, descriptors):
         """IoTデバイス記述情報を送信します。
@@ -169,14 +184,7 @@ class Protocol:
         Args:
             descriptors (str | dict): IoTデバイスの記述情報（JSON文字列またはdict）
         """
-        message = {
-            "session_id": self.session_id,
-            "type": "iot",
-            "descriptors": (
-                json.loads(descriptors) if isinstance(descriptors, str) else descriptors
-            ),
-        }
-        await self.send_text(json.dumps(message))
+        await self._send_ordered(self._iot_message("descriptors", descriptors))
 
     async def send_iot_states(self, states):
         """IoTデバイスの状態情報を送信します。
@@ -188,9 +196,119 @@ class Protocol:
         Args:
             states (str | dict): IoTデバイスの状態情報（JSON文字列またはdict）
         """
-        message = {
-            "session_id": self.session_id,
-            "type": "iot",
-            "states": json.loads(states) if isinstance(states, str) else states,
-        }
-        await self.send_text(json.dumps(message))
+        # 状態通知は応答を待たないため、送信キューに積んで呼び出し元にすぐ戻る
+        self._post_text(self._iot_message("states", states))
+
+    def _ensure_writer(self):
+        """送信キューと送信タスクを必要時に作成し、送信キューを返します。
+
+        イベントループのスレッドから呼び出す必要があります。
+
+        Returns:
+            asyncio.Queue: 送信キュー
+        """
+        if self._writer_task is None or self._writer_task.done():
+            self._outbox = asyncio.Queue(maxsize=_OUTBOX_MAX)
+            self._writer_task = asyncio.get_running_loop().create_task(
+                self._writer_loop(self._outbox)
+            )
+        return self._outbox
+
+    def _post_text(self, message):
+        """メッセージを送信キューに積みます（送信完了を待ちません）。
+
+        キューは単一の送信タスクが順番に処理するため、_send_orderedで送る
+        メッセージとの間でも積んだ順序は保たれます。
+
+        Args:
+            message (str): 送信するテキストメッセージ
+        """
+        try:
+            self._ensure_writer().put_nowait((message, None))
+        except asyncio.QueueFull:
+            logger.warning("送信キューが満杯のため、メッセージを破棄しました")
+
+    async def _send_ordered(self, message):
+        """メッセージを送信キュー経由で送信し、送信完了まで待ちます。
+
+        先に_post_textで積まれたメッセージ（IoT状態など）の後に送信されるため、
+        例えば状態通知の直後に送った唤醒词がサーバーへ先に届くことはありません。
+        完了まで待つので、音声データとの順序も従来どおり保たれます。
+
+        Args:
+            message (str): 送信するテキストメッセージ
+        """
+        if asyncio.current_task() is self._writer_task:
+            # 送信タスク内（send_textのエラー処理など）からは直接送信（自身を待つと停止するため）
+            await self.send_text(message)
+            return
+        outbox = self._ensure_writer()
+        waiter = asyncio.get_running_loop().create_future()
+        await outbox.put((message, waiter))
+        await waiter
+
+    def _stop_writer(self):
+        """送信タスクを停止し、未送信のメッセージを破棄します。
+
+        音声チャネルを閉じる際に呼び出します。送信完了を待っている呼び出し元には
+        未送信のまま完了を通知します（チャネル切断後のsend_textと同じく送信されません）。
+        """
+        task, outbox = self._writer_task, self._outbox
+        self._writer_task = None
+        self._outbox = None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        # send_textのエラー処理から呼ばれた場合、送信タスクはループ先頭で自ら終了する
+        dropped = 0
+        while outbox is not None and not outbox.empty():
+            _, waiter = outbox.get_nowait()
+            if waiter is not None and not waiter.done():
+                waiter.set_result(None)
+            dropped += 1
+        if dropped:
+            logger.warning(f"チャネルを閉じるため未送信のメッセージを{dropped}件破棄しました")
+
+    async def _writer_loop(self, outbox):
+        """送信キューのメッセージを順番にsend_textで送信します。
+
+        Args:
+            outbox (asyncio.Queue): 送信キュー
+        """
+        while self._outbox is outbox:
+            message, waiter = await outbox.get()
+            try:
+                await self.send_text(message)
+            except asyncio.CancelledError:
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(None)
+                raise
+            except Exception as e:
+                if waiter is None:
+                    logger.error(f"キューからのメッセージ送信に失敗しました: {e}")
+                elif not waiter.done():
+                    # 完了を待つ呼び出し元には従来どおり例外を伝える
+                    waiter.set_exception(e)
+                continue
+            if waiter is not None and not waiter.done():
+                waiter.set_result(None)
+
+    def _iot_message(self, key, payload):
+        """IoTメッセージのJSON文字列を組み立てます。
+
+        JSON文字列で渡されたペイロードはデコードせずにそのまま埋め込みます
+        （ThingManagerが生成した文字列の読み込みと再エンコードを省く）。
+
+        Args:
+            key (str): ペイロードのキー（"descriptors"または"states"）
+            payload (str | dict): JSON文字列またはdict
+
+        Returns:
+            str: 送信するJSON文字列
+        """
+        if not isinstance(payload, str):
+            payload = _encode(payload)
+        return '{"session_id": %s, "type": "iot", "%s": %s}' % (
+            _encode(self.session_id),
+            key,
+            payload,
+        )
@@ -295,6 +295,8 @@ class WebsocketProtocol(Protocol):
         Note:
             接続切断中にエラーが発生した場合でも、状態のリセットは実行されます。
         """
+        # 送信タスクを停止（切断後は送信できないため未送信分は破棄）
+        self._stop_writer()
         if self.websocket:
             try:
                 await self.websocket.close()
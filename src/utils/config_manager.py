@@ -95,9 +95,22 @@ class ConfigManager:
             "frame_width": 640,  # 映像フレーム幅
             "frame_height": 480,  # 映像フレーム高さ
             "fps": 30,  # フレームレート
+            "frame_skip": 1,  # K枚に1枚だけデコード（1で全フレーム）
+            "show_preview": False,  # カメラ映像のプレビューウィンドウを表示
+            "jpeg_quality": 75,  # 認識用JPEGの品質（1-100）
             "Loacl_VL_url": "https://open.bigmodel.cn/api/paas/v4/",  # ビジュアル言語モデルAPI URL
             "VLapi_key": "あなた自身のAPIキー",  # VL API認証キー
             "models": "glm-4v-plus",  # 使用するVLモデル名
+            # JPEGエンコードを省き無圧縮PPMで送信（PPM対応のVLエンドポイントのみ）
+            "use_raw_ppm": False,
+            # CUDA環境でtorchvision（NVJPEG）によるGPU JPEGエンコードを使用
+            "use_cuda_jpeg": False,
+            # OpenCL（T-API）対応のOpenCVでcv2.UMat経由のJPEGエンコードを使用
+            # （起動時の計測でCPUより遅い場合は使用しない）
+            "use_opencl": False,
+            # 同時に届いた画像認識をまとめる最大件数（1で無効）と待ち時間（ミリ秒）
+            "batch_size": 1,
+            "batch_timeout_ms": 50,
         },
     }
 
@@ -277,20 +290,58 @@ class ConfigManager:
             >>> config_manager.update_config("WAKE_WORD_OPTIONS.USE_WAKE_WORD", True)
         """
         try:
-            current = self._config
-            # パスを分割して最後の要素以外をたどる
-            *parts, last = path.split(".")
-            for part in parts:
-                # 中間パスが存在しない場合は空の辞書を作成
-                current = current.setdefault(part, {})
-            # 最終的な値を設定
-            current[last] = value
+            self._set_path(path, value)
             # 設定ファイルに保存
             return self._save_config(self._config)
         except Exception as e:
             logger.error(f"設定更新エラー {path}: {e}")
             return False
 
+    def update_configs(self, updates: Dict[str, Any]) -> bool:
+        """
+        複数の設定項目をまとめて更新する
+        
+        ドット区切りのパスと値の辞書を受け取り、すべての値を設定した後に
+        設定ファイルへ一度だけ保存する。
+        
+        Args:
+            updates (Dict[str, Any]): ドット区切りの設定パスと設定値の辞書
+            
+        Returns:
+            bool: 更新と保存に成功した場合True、失敗した場合False
+            
+        Example:
+            >>> config_manager.update_configs({
+            ...     "WAKE_WORD_OPTIONS.USE_WAKE_WORD": True,
+            ...     "SYSTEM_OPTIONS.DEVICE_ID": "00:11:22:33:44:55",
+            ... })
+        """
+        try:
+            for path, value in updates.items():
+                self._set_path(path, value)
+            # 設定ファイルに保存
+            return self._save_config(self._config)
+        except Exception as e:
+            logger.error(f"設定一括更新エラー {list(updates)}: {e}")
+            return False
+
+    def _set_path(self, path: str, value: Any):
+        """
+        ドット区切りのパスで設定値をメモリ上に設定する（保存はしない）
+        
+        Args:
+            path (str): ドット区切りの設定パス
+            value (Any): 設定する値
+        """
+        current = self._config
+        # パスを分割して最後の要素以外をたどる
+        *parts, last = path.split(".")
+        for part in parts:
+            # 中間パスが存在しない場合は空の辞書を作成
+            current = current.setdefault(part, {})
+        # 最終的な値を設定
+        current[last] = value
+
     @classmethod
     def get_instance(cls):
         """